@@ -0,0 +1,80 @@
+"""
+Compares validating IBAN/BIC pairs one by one with the form validators of localflavor and the cross-check of the
+checkout form against :func:`pretix_sepadebit.bankaccounts.validate_accounts`.
+
+Run from the repository root with ``python benchmarks/bench_bankaccounts.py``.
+"""
+import os
+import random
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from django.conf import settings  # NOQA
+
+settings.configure(USE_I18N=False)
+
+from django.core.exceptions import ValidationError  # NOQA
+from localflavor.generic.validators import BICValidator, IBANValidator  # NOQA
+
+from pretix_sepadebit import bicdata  # NOQA
+from pretix_sepadebit.bankaccounts import bic_matches, validate_accounts  # NOQA
+from pretix_sepadebit.biclookup import lookup_bic  # NOQA
+
+
+def per_row(accounts):
+    results = []
+    iban_validator, bic_validator = IBANValidator(), BICValidator()
+    for iban, bic in accounts:
+        errors = []
+        try:
+            iban_validator(iban)
+        except ValidationError as e:
+            errors.append(e)
+        try:
+            bic_validator(bic)
+        except ValidationError as e:
+            errors.append(e)
+        if not errors:
+            correct_bic = lookup_bic(iban)
+            if correct_bic and not bic_matches(correct_bic, bic):
+                errors.append(correct_bic)
+        results.append(not errors)
+    return results
+
+
+def with_checksum(country, bban):
+    digits = (bban + country + "00").translate(str.maketrans({chr(c): str(c - 55) for c in range(65, 91)}))
+    return f"{country}{98 - int(digits) % 97:02d}{bban}"
+
+
+def sample_accounts(n):
+    rnd = random.Random(42)
+    records = list(bicdata.load().items())
+    accounts = []
+    for i in range(n):
+        key, bic = rnd.choice(records)
+        bban = key[4:] + "".join(rnd.choice("0123456789") for _ in range(18 - len(key[4:])))
+        iban = with_checksum(key[:2], bban)
+        if i % 10 == 7:
+            # Typo in the account number
+            iban = iban[:-1] + str((int(iban[-1]) + 1) % 10)
+        elif i % 10 == 8:
+            bic = "INGDDEFFXXX"
+        accounts.append((iban, bic))
+    return accounts
+
+
+def main():
+    accounts = sample_accounts(20_000)
+    assert per_row(accounts) == [r.valid for r in validate_accounts(accounts)]
+
+    for label, func in (("per row", per_row), ("batch", validate_accounts)):
+        best = min(timeit.repeat(lambda: func(accounts), number=1, repeat=5))
+        print(f"{label:>8}: {len(accounts) / best:12,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
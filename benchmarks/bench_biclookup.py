@@ -0,0 +1,91 @@
+"""
+Compares the throughput of the IBAN→BIC check performed during checkout validation, as well as the cost of loading
+the dataset in a fresh process.
+
+Run from the repository root with ``python benchmarks/bench_biclookup.py``.
+"""
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from pretix_sepadebit import bicdata  # NOQA
+from pretix_sepadebit.biclookup import lookup_bic  # NOQA
+
+# The dict literal bicdata.py used to contain before the dataset moved to bicdata.bin
+DATA = dict(bicdata.load().items())
+
+LOAD_SCRIPT = """
+import resource, sys, time
+sys.path.insert(0, {path!r})
+before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+t = time.perf_counter()
+{stmt}
+print(time.perf_counter() - t, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - before)
+"""
+
+
+def legacy_lookup(iban):
+    # The loop SEPAPaymentProviderForm.clean used before pretix_sepadebit.biclookup existed
+    correct_bic = None
+    iban_without_checksum = iban[0:2] + "XX" + iban[4:]
+    for k in range(6, 15):
+        if iban_without_checksum[:k] in DATA:
+            correct_bic = DATA[iban_without_checksum[:k]]
+    return correct_bic
+
+
+def sample_ibans(n):
+    rnd = random.Random(42)
+    keys = sorted(DATA)
+    ibans = []
+    for i in range(n):
+        if i % 4 == 3:
+            # Unknown bank
+            ibans.append("NL91ABNA" + "".join(rnd.choice("0123456789") for _ in range(10)))
+        else:
+            k = rnd.choice(keys)
+            ibans.append(k[0:2] + "02" + k[4:] + "".join(rnd.choice("0123456789") for _ in range(22 - len(k))))
+    return ibans
+
+
+def measure_load(path, stmt):
+    # Run twice so the second run can use the bytecode cache, as a long-running worker would
+    for _ in range(2):
+        out = subprocess.check_output(
+            [sys.executable, "-c", LOAD_SCRIPT.format(path=path, stmt=stmt)]
+        )
+    seconds, rss_kib = out.split()
+    return float(seconds), int(rss_kib)
+
+
+def main():
+    ibans = sample_ibans(10_000)
+    lookup_bic(ibans[0])  # map the file and index the German records outside of the measurement
+
+    assert all(legacy_lookup(i) == lookup_bic(i) for i in ibans)
+
+    for label, func in (("legacy loop", legacy_lookup), ("lookup_bic", lookup_bic)):
+        best = min(timeit.repeat(lambda: [func(i) for i in ibans], number=10, repeat=5))
+        print(f"{label:>12}: {len(ibans) * 10 / best:12,.0f} validations/s")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        with open(os.path.join(tmp, "legacy_bicdata.py"), "w") as f:
+            f.write(f"DATA = {json.dumps(DATA)}")
+        for label, path, stmt in (
+            ("legacy dict", tmp, "import legacy_bicdata"),
+            ("mmap", ROOT, "from pretix_sepadebit import bicdata; bicdata.load()"),
+            ("first lookup", ROOT, "from pretix_sepadebit.biclookup import lookup_bic; lookup_bic('DE02120300000000202051')"),
+        ):
+            seconds, rss_kib = measure_load(path, stmt)
+            print(f"{label:>12}: loaded in {seconds * 1000:6.1f} ms, {rss_kib:6,} KiB additional RSS")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Measures how long generating and validating the files of an export run takes when the run produces 20 files, e.g.
+one per collection date in split mode. Compares compiling the XSD schema for every file, as exports used to do, with
+the per-process cache in :mod:`pretix_sepadebit.schemas`, and validating the files one by one with validating them
+in a process pool. The first run with the pool includes starting it, which happens once per process. Use it to tune
+``PARALLEL_MIN_SIZE``.
+
+Run from the repository root with ``python benchmarks/bench_export.py``.
+"""
+import datetime
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import xmlschema  # NOQA
+from sepaxml import validation  # NOQA
+
+from pretix_sepadebit import schemas  # NOQA
+from pretix_sepadebit.painwriter import Pain008Writer  # NOQA
+from pretix_sepadebit.schemas import (  # NOQA
+    get_schema, validate_files, validation_errors,
+)
+
+FILES = int(os.environ.get("FILES", 20))
+PAYMENTS_PER_FILE = int(os.environ.get("PAYMENTS_PER_FILE", 200))
+CONFIG = {
+    "name": "Acme Corp",
+    "IBAN": "DE13495179316396679327",
+    "BIC": "BYLADEM1001",
+    "batch": True,
+    "creditor_id": "DE98ZZZ09999999999",
+    "currency": "EUR",
+}
+
+
+def build_files():
+    files = []
+    for f in range(FILES):
+        writer = Pain008Writer(CONFIG)
+        for i in range(PAYMENTS_PER_FILE):
+            writer.add_payment({
+                "name": "Max Mustermann",
+                "IBAN": "DE02120300000000202051",
+                "BIC": "BYLADEM1001",
+                "amount": 2300 + i,
+                "type": "OOFF",
+                "collection_date": datetime.date(2026, 3, 2) + datetime.timedelta(days=f),
+                "mandate_id": f"DUMMY-{f}-{i}",
+                "mandate_date": datetime.date(2026, 2, 1),
+                "description": f"Event ticket DUMMY-{f}-{i}",
+            })
+        files.append(writer)
+    return files
+
+
+def compile_every_time(name, source):
+    schema = xmlschema.XMLSchema(os.path.join(os.path.dirname(validation.__file__), "schemas", name + ".xsd"))
+    return [str(e) for e in schema.iter_errors(source)]
+
+
+def run(validate):
+    t = time.perf_counter()
+    for writer in build_files():
+        with tempfile.TemporaryFile() as tmp:
+            writer.write(tmp)
+            tmp.seek(0)
+            assert not validate(writer.schema, tmp)
+    return time.perf_counter() - t
+
+
+def run_files(parallel):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        files = []
+        for i, writer in enumerate(build_files()):
+            files.append((writer.schema, os.path.join(tmpdir, f"{i}.xml")))
+            with open(files[-1][1], "wb") as f:
+                writer.write(f)
+        size = sum(os.path.getsize(path) for name, path in files)
+        t = time.perf_counter()
+        assert not any(validate_files(files, parallel=parallel))
+    return time.perf_counter() - t, size
+
+
+def main():
+    print(f"{FILES} files with {PAYMENTS_PER_FILE} debits each")
+    for label, func in (("compile per file", compile_every_time), ("cached schema", validation_errors)):
+        if func is validation_errors:
+            # A long-running worker has compiled the schema before
+            get_schema("pain.008.001.02")
+        best = min(run(func) for _ in range(3))
+        print(f"{label:>17}: {best * 1000:8.0f} ms per export run")
+
+    schemas.PARALLEL_MIN_SIZE = 0
+    for label, parallel in (("serial", False), ("process pool", True)):
+        first, size = run_files(parallel)
+        best = min(run_files(parallel)[0] for _ in range(3))
+        print(
+            f"{label:>17}: {best * 1000:8.0f} ms per validation of {size / 1024 / 1024:.1f} MiB "
+            f"(first run {first * 1000:.0f} ms)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+from django.db.models import Count, Q, Sum
+from django.http import FileResponse
+from django.utils.timezone import now
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework import mixins, serializers, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.pagination import CursorPagination
+from rest_framework.response import Response
+
+from pretix_sepadebit.models import (
+    SepaExport, SepaExportOrder, SepaExportRun,
+)
+from pretix_sepadebit.painwriter import SCHEMAS
+from pretix_sepadebit.tasks import run_export
+
+EXPORT_MODES = ("split", "move", "mix")
+
+
+class IdCursorPagination(CursorPagination):
+    ordering = "-id"
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
+
+
+class SepaExportSerializer(serializers.ModelSerializer):
+    event = serializers.SlugRelatedField(slug_field="slug", read_only=True)
+    num_orders = serializers.IntegerField(read_only=True)
+    total = serializers.DecimalField(max_digits=13, decimal_places=2, read_only=True)
+    reversible = serializers.BooleanField(source="is_reversible", read_only=True)
+
+    class Meta:
+        model = SepaExport
+        fields = (
+            "id", "event", "run", "datetime", "testmode", "currency", "num_orders", "total", "xml_size", "xml_sha256",
+            "reversible",
+        )
+
+
+class SepaExportOrderSerializer(serializers.ModelSerializer):
+    event = serializers.SlugRelatedField(source="order.event", slug_field="slug", read_only=True)
+    order = serializers.SlugRelatedField(slug_field="code", read_only=True)
+    payment = serializers.SlugRelatedField(slug_field="local_id", read_only=True)
+
+    class Meta:
+        model = SepaExportOrder
+        fields = ("id", "export", "event", "order", "payment", "amount")
+
+
+class SepaExportRunSerializer(serializers.ModelSerializer):
+    event = serializers.SlugRelatedField(slug_field="slug", read_only=True)
+    exports = serializers.PrimaryKeyRelatedField(many=True, read_only=True)
+    errors = serializers.SerializerMethodField()
+    failed_orders = serializers.SerializerMethodField()
+
+    class Meta:
+        model = SepaExportRun
+        fields = ("id", "event", "date", "scheduled", "state", "started", "finished", "exports", "errors",
+                  "failed_orders")
+
+    def get_errors(self, run):
+        return run.result.get("errors", [])
+
+    def get_failed_orders(self, run):
+        return run.result.get("failed_orders", [])
+
+
+class ExportCreateSerializer(serializers.Serializer):
+    mode = serializers.ChoiceField(choices=EXPORT_MODES, required=False)
+    schema = serializers.ChoiceField(choices=SCHEMAS, required=False)
+
+
+class SepaExportViewSet(mixins.DestroyModelMixin, viewsets.ReadOnlyModelViewSet):
+    """
+    Lists the export files and creates new ones. Creating an export starts it in the background and returns the
+    :class:`SepaExportRun` that records it with status 202. Poll the run until its state is no longer ``running`` to
+    get the IDs of the new files. Send an ``X-Idempotency-Key`` header to be able to retry the request without
+    starting the export twice.
+    """
+    serializer_class = SepaExportSerializer
+    pagination_class = IdCursorPagination
+
+    @property
+    def settings_holder(self):
+        raise NotImplementedError()
+
+    @property
+    def run_owner(self):
+        raise NotImplementedError()
+
+    def get_base_queryset(self):
+        raise NotImplementedError()
+
+    def get_queryset(self):
+        return (
+            self.get_base_queryset()
+            .select_related("event")
+            .annotate(num_orders=Count("sepaexportorder"), total=Sum("sepaexportorder__amount"))
+            .defer("xml_gz")
+        )
+
+    def create(self, request, *args, **kwargs):
+        serializer = ExportCreateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        run = SepaExportRun.objects.create(
+            date=now().astimezone(self.settings_holder.timezone).date(),
+            scheduled=False,
+            **self.run_owner,
+        )
+        run_export.apply_async(
+            args=(run.pk,),
+            kwargs={
+                "mode": serializer.validated_data.get("mode"),
+                "schema": serializer.validated_data.get("schema"),
+            },
+        )
+        # Without a task queue, the export is already done
+        run.refresh_from_db()
+        return Response(SepaExportRunSerializer(run).data, status=status.HTTP_202_ACCEPTED)
+
+    @action(detail=True, methods=["GET"])
+    def download(self, request, *args, **kwargs):
+        export = self.get_object()
+        resp = FileResponse(
+            export.open_xml(),
+            content_type="application/xml",
+            as_attachment=True,
+            filename="{}-{}.xml".format(
+                self.settings_holder.slug.upper(), export.datetime.strftime("%Y-%m-%d-%H-%M-%S")
+            ),
+        )
+        resp["Content-Length"] = export.xml_size
+        return resp
+
+    def perform_destroy(self, instance):
+        if not instance.is_reversible():
+            raise PermissionDenied("This export can no longer be reverted.")
+        instance.delete()
+
+
+class EventSepaExportViewSet(SepaExportViewSet):
+    # The files contain the bank account details of the customers, so even listing them requires the same permission
+    # as in the backend
+    permission = "can_change_orders"
+    write_permission = "can_change_orders"
+
+    @property
+    def settings_holder(self):
+        return self.request.event
+
+    @property
+    def run_owner(self):
+        return {"organizer": self.request.organizer, "event": self.request.event}
+
+    def get_base_queryset(self):
+        return SepaExport.objects.filter(event=self.request.event)
+
+
+class OrganizerSepaExportViewSet(SepaExportViewSet):
+    permission = "can_change_organizer_settings"
+    write_permission = "can_change_organizer_settings"
+
+    @property
+    def settings_holder(self):
+        return self.request.organizer
+
+    @property
+    def run_owner(self):
+        return {"organizer": self.request.organizer}
+
+    def get_base_queryset(self):
+        return SepaExport.objects.filter(
+            Q(organizer=self.request.organizer) | Q(event__organizer=self.request.organizer)
+        )
+
+    def perform_destroy(self, instance):
+        # Like in the backend, exports of single events can only be reverted through the event
+        if instance.organizer_id != self.request.organizer.pk:
+            raise PermissionDenied("This export belongs to an event and can only be reverted there.")
+        super().perform_destroy(instance)
+
+
+class EventSepaExportRunViewSet(viewsets.ReadOnlyModelViewSet):
+    serializer_class = SepaExportRunSerializer
+    pagination_class = IdCursorPagination
+    permission = "can_change_orders"
+
+    def get_queryset(self):
+        return SepaExportRun.objects.filter(event=self.request.event).select_related("event").prefetch_related(
+            "exports"
+        )
+
+
+class OrganizerSepaExportRunViewSet(EventSepaExportRunViewSet):
+    permission = "can_change_organizer_settings"
+
+    def get_queryset(self):
+        return SepaExportRun.objects.filter(organizer=self.request.organizer, event__isnull=True).prefetch_related(
+            "exports"
+        )
+
+
+class EventSepaExportOrderViewSet(viewsets.ReadOnlyModelViewSet):
+    serializer_class = SepaExportOrderSerializer
+    pagination_class = IdCursorPagination
+    filter_backends = (DjangoFilterBackend,)
+    filterset_fields = ("export",)
+    permission = "can_change_orders"
+
+    def get_queryset(self):
+        return SepaExportOrder.objects.filter(order__event=self.request.event).select_related(
+            "order", "order__event", "payment"
+        )
+
+
+class OrganizerSepaExportOrderViewSet(EventSepaExportOrderViewSet):
+    permission = "can_change_organizer_settings"
+
+    def get_queryset(self):
+        return SepaExportOrder.objects.filter(order__event__organizer=self.request.organizer).select_related(
+            "order", "order__event", "payment"
+        )
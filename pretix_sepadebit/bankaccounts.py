@@ -0,0 +1,86 @@
+"""
+Validation of many IBAN/BIC pairs at once, e.g. when auditing old payments or importing mandates.
+
+:func:`validate_accounts` performs the same checks as ``IBANValidator``, ``BICValidator`` and the BIC cross-check of
+the checkout form, but collects all problems of a row instead of raising on the first one and avoids the per-character
+Python loops and exception handling of the form validators. The country-specific BBAN checks that ``IBANValidator``
+delegates to ``stdnum`` are not performed.
+"""
+import re
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+from localflavor.generic.countries.iso_3166 import (
+    ISO_3166_1_ALPHA2_COUNTRY_CODES,
+)
+from localflavor.generic.validators import IBAN_COUNTRY_CODE_LENGTH
+
+from .biclookup import lookup_bic
+
+IBAN_RE = re.compile(r"^[A-Z]{2}[0-9]{2}[A-Z0-9]+$")
+BIC_RE = re.compile(r"^[A-Z]{4}[A-Z]{2}[A-Z2-9][A-NP-Z0-9]([A-Z0-9]{3})?$")
+
+# A = 10, B = 11, …, Z = 35, as required by the mod-97 checksum of ISO 13616
+_LETTERS_TO_DIGITS = str.maketrans({chr(c): str(c - 55) for c in range(ord("A"), ord("Z") + 1)})
+
+IBAN_FORMAT = "iban_format"
+IBAN_COUNTRY = "iban_country"
+IBAN_LENGTH = "iban_length"
+IBAN_CHECKSUM = "iban_checksum"
+BIC_FORMAT = "bic_format"
+BIC_MISMATCH = "bic_mismatch"
+
+
+class AccountCheck(NamedTuple):
+    iban: str
+    bic: str
+    expected_bic: Optional[str]
+    errors: Tuple[str, ...]
+
+    @property
+    def valid(self) -> bool:
+        return not self.errors
+
+
+def bic_matches(expected_bic: str, bic: str) -> bool:
+    """
+    Returns whether the BIC entered by a customer matches the BIC we know for their IBAN. Eight-character BICs are
+    compared to the primary office of the bank.
+    """
+    if len(bic) == 8:
+        bic += "XXX"
+    # https://github.com/pretix/pretix-sepadebit/issues/34
+    return expected_bic == bic or (expected_bic.startswith("COBADE") and bic.startswith("COBADE"))
+
+
+def validate_accounts(accounts: Iterable[Tuple[str, str]]) -> List[AccountCheck]:
+    """
+    Validates a sequence of ``(iban, bic)`` pairs and returns one :class:`AccountCheck` per pair, in the same order.
+    IBAN and BIC are normalized like in the payment form. The BIC may be empty, in which case only the IBAN is
+    checked.
+    """
+    results = []
+    for iban, bic in accounts:
+        iban = (iban or "").replace(" ", "").replace("-", "").upper()
+        bic = (bic or "").replace(" ", "").upper()
+        errors = []
+        expected_bic = None
+
+        if not IBAN_RE.match(iban):
+            errors.append(IBAN_FORMAT)
+        elif iban[:2] not in IBAN_COUNTRY_CODE_LENGTH:
+            errors.append(IBAN_COUNTRY)
+        elif len(iban) != IBAN_COUNTRY_CODE_LENGTH[iban[:2]]:
+            errors.append(IBAN_LENGTH)
+        elif int((iban[4:] + iban[:4]).translate(_LETTERS_TO_DIGITS)) % 97 != 1:
+            errors.append(IBAN_CHECKSUM)
+        else:
+            expected_bic = lookup_bic(iban)
+
+        if bic:
+            if not BIC_RE.match(bic) or bic[4:6] not in ISO_3166_1_ALPHA2_COUNTRY_CODES:
+                errors.append(BIC_FORMAT)
+            elif expected_bic and not bic_matches(expected_bic, bic):
+                errors.append(BIC_MISMATCH)
+
+        results.append(AccountCheck(iban, bic, expected_bic, tuple(errors)))
+    return results
@@ -0,0 +1,81 @@
+"""
+Business days of the SEPA direct debit system.
+
+Direct debits can only be collected on TARGET2 business days. TARGET2 is closed on weekends, New Year's Day, Good
+Friday, Easter Monday, 1 May, Christmas Day and 26 December. We additionally skip 24 and 31 December, on which many
+banks, including the Bundesbank, do not process payments.
+
+For every year that is used, a table of the distance from each day to the next business day is computed once, so
+resolving the collection date of a payment is a single lookup.
+"""
+import datetime
+from functools import lru_cache
+
+FIXED_HOLIDAYS = (
+    (1, 1),
+    (5, 1),
+    (12, 24),
+    (12, 25),
+    (12, 26),
+    (12, 31),
+)
+
+
+def easter_sunday(year: int) -> datetime.date:
+    """
+    Returns the date of Easter Sunday in the Gregorian calendar, using the anonymous Gregorian algorithm.
+    """
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l_ = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l_) // 451
+    month, day = divmod(h + l_ - 7 * m + 114, 31)
+    return datetime.date(year, month, day + 1)
+
+
+@lru_cache(maxsize=None)
+def holidays(year: int) -> frozenset:
+    easter = easter_sunday(year)
+    return frozenset(
+        [datetime.date(year, month, day) for month, day in FIXED_HOLIDAYS]
+        + [easter - datetime.timedelta(days=2), easter + datetime.timedelta(days=1)]
+    )
+
+
+def is_business_day(dt: datetime.date) -> bool:
+    return dt.weekday() < 5 and dt not in holidays(dt.year)
+
+
+@lru_cache(maxsize=None)
+def _offsets(year: int):
+    """
+    Returns the ordinal of 1 January of ``year`` and, for every day of the year, the number of days until the next
+    business day.
+    """
+    first = datetime.date(year, 1, 1).toordinal()
+    last = datetime.date(year, 12, 31).toordinal()
+    dt = datetime.date(year + 1, 1, 1)
+    while not is_business_day(dt):
+        dt += datetime.timedelta(days=1)
+    next_business_day = dt.toordinal()
+
+    offsets = bytearray(last - first + 1)
+    for ordinal in range(last, first - 1, -1):
+        if is_business_day(datetime.date.fromordinal(ordinal)):
+            next_business_day = ordinal
+        offsets[ordinal - first] = next_business_day - ordinal
+    return first, bytes(offsets)
+
+
+def next_business_day(dt: datetime.date) -> datetime.date:
+    """
+    Returns ``dt`` if it is a business day, otherwise the first business day after it.
+    """
+    first, offsets = _offsets(dt.year)
+    ordinal = dt.toordinal()
+    return datetime.date.fromordinal(ordinal + offsets[ordinal - first])
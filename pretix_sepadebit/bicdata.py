@@ -1,3526 +1,163 @@
-DATA = {
-    "DEXX10000000": "MARKDEF1100",
-    "DEXX10010010": "PBNKDEFFXXX",
-    "DEXX10010123": "QNTODEB2XXX",
-    "DEXX10010424": "AARBDE5W100",
-    "DEXX10011001": "NTSBDEB1XXX",
-    "DEXX10017997": "HOLVDEB1XXX",
-    "DEXX10019610": "DXIADEBBXXX",
-    "DEXX10019670": "DXIADEB2COV",
-    "DEXX10020200": "BHFBDEFF100",
-    "DEXX10020500": "BFSWDE33BER",
-    "DEXX10020510": "BFSWDE33BER",
-    "DEXX10020520": "BFSWDE33BER",
-    "DEXX10020890": "HYVEDEMM488",
-    "DEXX10030200": "BHYPDEB2XXX",
-    "DEXX10030400": "ABKBDEB1XXX",
-    "DEXX10030500": "LOEBDEBBXXX",
-    "DEXX10030600": "GENODEF1OGK",
-    "DEXX10030700": "DLGHDEB1XXX",
-    "DEXX10030730": "DLGHDEB1XXX",
-    "DEXX10031000": "EIEGDEB1XXX",
-    "DEXX10033300": "SCFBDE33XXX",
-    "DEXX10040000": "COBADEBBXXX",
-    "DEXX10040005": "COBADEBBXXX",
-    "DEXX10040010": "COBADEFFXXX",
-    "DEXX10040048": "COBADEFFXXX",
-    "DEXX10040060": "COBADEFFXXX",
-    "DEXX10040061": "COBADEFFXXX",
-    "DEXX10040062": "COBADEFFXXX",
-    "DEXX10040063": "COBADEFFXXX",
-    "DEXX10040085": "COBADEFFXXX",
-    "DEXX10045050": "COBADEFFXXX",
-    "DEXX10050000": "BELADEBEXXX",
-    "DEXX10050020": "SKPADEB1XXX",
-    "DEXX10050500": "LBSODEB1BLN",
-    "DEXX10050999": "DGZFDEFFBER",
-    "DEXX10060198": "GENODED1PA6",
-    "DEXX10061006": "GENODED1KDB",
-    "DEXX10070000": "DEUTDEBBXXX",
-    "DEXX10070024": "DEUTDEDBBER",
-    "DEXX10070100": "DEUTDEBB101",
-    "DEXX10070124": "DEUTDEDB101",
-    "DEXX10070848": "DEUTDEDB110",
-    "DEXX10077777": "NORSDE51XXX",
-    "DEXX10080000": "DRESDEFF100",
-    "DEXX10080005": "DRESDEFFI26",
-    "DEXX10080006": "DRESDEFFXXX",
-    "DEXX10080055": "DRESDEFF112",
-    "DEXX10080057": "DRESDEFF114",
-    "DEXX10080085": "DRESDEFFI53",
-    "DEXX10080086": "DRESDEFFI71",
-    "DEXX10080087": "DRESDEFFI72",
-    "DEXX10080088": "DRESDEFFXXX",
-    "DEXX10080089": "DRESDEFFI73",
-    "DEXX10080900": "DRESDEFF199",
-    "DEXX10089260": "DRESDEFFI14",
-    "DEXX10089999": "DRESDEFFI99",
-    "DEXX10090000": "BEVODEBBXXX",
-    "DEXX10090300": "GENODEF1BSB",
-    "DEXX10090603": "DAAEDED1003",
-    "DEXX10090900": "GENODEF1P01",
-    "DEXX10110300": "MACODEB1XXX",
-    "DEXX10110400": "IBBBDEBBXXX",
-    "DEXX10110600": "QUBKDEBBXXX",
-    "DEXX10120100": "WELADED1WBB",
-    "DEXX10120800": "VONEDE33BLN",
-    "DEXX10130600": "ISBKDEFXXXX",
-    "DEXX10130800": "BIWBDE33XXX",
-    "DEXX10220500": "BOFSDEB1XXX",
-    "DEXX10220600": "SYBKDE22BER",
-    "DEXX10310600": "TRDADEB1PBK",
-    "DEXX11010100": "SOBKDEBBXXX",
-    "DEXX11010101": "SOBKDEB2XXX",
-    "DEXX12016836": "KFWIDEFF100",
-    "DEXX12030000": "BYLADEM1001",
-    "DEXX12030900": "MEFIDEMM100",
-    "DEXX12040000": "COBADEBB120",
-    "DEXX12050555": "NOLADE21DVS",
-    "DEXX12060000": "GENODEFF120",
-    "DEXX12070000": "DEUTDEBB160",
-    "DEXX12070024": "DEUTDEDB160",
-    "DEXX12070070": "DEUTDEFFVAC",
-    "DEXX12070088": "DEUTDEDBPAL",
-    "DEXX12080000": "DRESDEFF120",
-    "DEXX12090640": "DAAEDED1040",
-    "DEXX12096597": "GENODEF1S10",
-    "DEXX13000000": "MARKDEF1130",
-    "DEXX13010111": "ESSEDE5F130",
-    "DEXX13040000": "COBADEFFXXX",
-    "DEXX13050000": "NOLADE21ROS",
-    "DEXX13051042": "NOLADE21RUE",
-    "DEXX13061008": "GENODEF1WOG",
-    "DEXX13061078": "GENODEF1HWI",
-    "DEXX13061088": "GENODEF1HWR",
-    "DEXX13061128": "GENODEF1DBR",
-    "DEXX13070000": "DEUTDEBRXXX",
-    "DEXX13070024": "DEUTDEDBROS",
-    "DEXX13080000": "DRESDEFF130",
-    "DEXX13090000": "GENODEF1HR1",
-    "DEXX13091054": "GENODEF1HST",
-    "DEXX13091084": "GENODEF1HWV",
-    "DEXX14040000": "COBADEFFXXX",
-    "DEXX14051000": "NOLADE21WIS",
-    "DEXX14051362": "NOLADE21PCH",
-    "DEXX14051462": "NOLADE21SNS",
-    "DEXX14052000": "NOLADE21LWL",
-    "DEXX14061308": "GENODEF1GUE",
-    "DEXX14061438": "GENODEF1GDB",
-    "DEXX14080000": "DRESDEFF140",
-    "DEXX14080011": "DRESDEFFI27",
-    "DEXX14091464": "GENODEF1SN1",
-    "DEXX15000000": "MARKDEF1150",
-    "DEXX15040068": "COBADEFFXXX",
-    "DEXX15050100": "NOLADE21WRN",
-    "DEXX15050200": "NOLADE21NBS",
-    "DEXX15050400": "NOLADE21PSW",
-    "DEXX15050500": "NOLADE21GRW",
-    "DEXX15051732": "NOLADE21MST",
-    "DEXX15061618": "GENODEF1WRN",
-    "DEXX15061638": "GENODEF1ANK",
-    "DEXX15061698": "GENODEF1MAL",
-    "DEXX15080000": "DRESDEFF150",
-    "DEXX15091674": "GENODEF1DM1",
-    "DEXX15091704": "GENODEF1PZ1",
-    "DEXX16010300": "ILBXDE8XXXX",
-    "DEXX16020086": "HYVEDEMM470",
-    "DEXX16040000": "COBADEFFXXX",
-    "DEXX16050000": "WELADED1PMB",
-    "DEXX16050101": "WELADED1PRP",
-    "DEXX16050202": "WELADED1OPR",
-    "DEXX16050500": "LBSODEB1XXX",
-    "DEXX16060122": "GENODEF1PER",
-    "DEXX16061938": "GENODEF1NPP",
-    "DEXX16062008": "GENODEF1LUK",
-    "DEXX16062073": "GENODEF1BRB",
-    "DEXX16080000": "DRESDEFF160",
-    "DEXX16091994": "GENODEF1RN1",
-    "DEXX17020086": "HYVEDEMM471",
-    "DEXX17040000": "COBADEFFXXX",
-    "DEXX17052000": "WELADED1GZE",
-    "DEXX17052302": "WELADED1UMX",
-    "DEXX17054040": "WELADED1MOL",
-    "DEXX17055050": "WELADED1LOS",
-    "DEXX17056060": "WELADED1UMP",
-    "DEXX17062428": "GENODEF1BKW",
-    "DEXX17080000": "DRESDEFF170",
-    "DEXX17092404": "GENODEF1FW1",
-    "DEXX18020086": "HYVEDEMM472",
-    "DEXX18040000": "COBADEFFXXX",
-    "DEXX18050000": "WELADED1CBN",
-    "DEXX18051000": "WELADED1EES",
-    "DEXX18055000": "WELADED1OSL",
-    "DEXX18062678": "GENODEF1FWA",
-    "DEXX18062758": "GENODEF1FOR",
-    "DEXX18080000": "DRESDEFF180",
-    "DEXX18092684": "GENODEF1LN1",
-    "DEXX18092744": "GENODEF1SPM",
-    "DEXX20000000": "MARKDEF1200",
-    "DEXX20010020": "PBNKDEFFXXX",
-    "DEXX20010111": "ESSEDE5F200",
-    "DEXX20010424": "AARBDE5W200",
-    "DEXX20020200": "ESSEDEFFHAM",
-    "DEXX20020500": "JYBADEHHXXX",
-    "DEXX20020900": "SIBSDEHHXXX",
-    "DEXX20030000": "HYVEDEMM300",
-    "DEXX20030133": "VGAGDEHHXXX",
-    "DEXX20030300": "CHDBDEHHXXX",
-    "DEXX20030400": "MCRDDEHHXXX",
-    "DEXX20030600": "SYBKDE22HAM",
-    "DEXX20030700": "MEFIDEMM200",
-    "DEXX20040000": "COBADEHHXXX",
-    "DEXX20040005": "COBADEHHXXX",
-    "DEXX20040020": "COBADEFFXXX",
-    "DEXX20040040": "COBADEFFXXX",
-    "DEXX20040048": "COBADEFFXXX",
-    "DEXX20040050": "COBADEFFXXX",
-    "DEXX20040060": "COBADEFFXXX",
-    "DEXX20040061": "COBADEFFXXX",
-    "DEXX20040062": "COBADEFFXXX",
-    "DEXX20040063": "COBADEFFXXX",
-    "DEXX20041111": "COBADEHDXXX",
-    "DEXX20041133": "COBADEHD001",
-    "DEXX20041144": "COBADEHD044",
-    "DEXX20041155": "COBADEHD055",
-    "DEXX20041166": "COBADEHD066",
-    "DEXX20041177": "COBADEHD077",
-    "DEXX20041188": "COBADEHD088",
-    "DEXX20041199": "COBADEHD099",
-    "DEXX20050000": "HSHNDEHHXXX",
-    "DEXX20050550": "HASPDEHHXXX",
-    "DEXX20060000": "GENODEFF200",
-    "DEXX20069111": "GENODEF1NDR",
-    "DEXX20069125": "GENODEF1KLK",
-    "DEXX20069130": "GENODEF1BBR",
-    "DEXX20069144": "GENODEF1SST",
-    "DEXX20069177": "GENODEF1GRS",
-    "DEXX20069232": "GENODEF1STV",
-    "DEXX20069641": "GENODEF1OWS",
-    "DEXX20069780": "GENODEF1AST",
-    "DEXX20069782": "GENODEF1APE",
-    "DEXX20069786": "GENODEF1DRO",
-    "DEXX20069800": "GENODEF1HAA",
-    "DEXX20069812": "GENODEF1FRB",
-    "DEXX20069815": "GENODEF1815",
-    "DEXX20069861": "GENODEF1RRZ",
-    "DEXX20069882": "GENODEF1RLT",
-    "DEXX20069965": "GENODEF1WIM",
-    "DEXX20069989": "GENODEF1WUL",
-    "DEXX20070000": "DEUTDEHHXXX",
-    "DEXX20070024": "DEUTDEDBHAM",
-    "DEXX20080000": "DRESDEFF200",
-    "DEXX20080055": "DRESDEFF207",
-    "DEXX20080057": "DRESDEFF208",
-    "DEXX20080085": "DRESDEFFI56",
-    "DEXX20080086": "DRESDEFFI63",
-    "DEXX20080087": "DRESDEFFI64",
-    "DEXX20080088": "DRESDEFFI74",
-    "DEXX20080089": "DRESDEFFI75",
-    "DEXX20080091": "DRESDEFFJ33",
-    "DEXX20080092": "DRESDEFFJ34",
-    "DEXX20080093": "DRESDEFFJ35",
-    "DEXX20080094": "DRESDEFFJ36",
-    "DEXX20080095": "DRESDEFFJ37",
-    "DEXX20089200": "DRESDEFFI06",
-    "DEXX20090400": "DGHYDEH1XXX",
-    "DEXX20090500": "AUGBDE71NET",
-    "DEXX20090602": "DAAEDED1002",
-    "DEXX20090700": "EDEKDEHHXXX",
-    "DEXX20090745": "EDEKDEHHXXX",
-    "DEXX20090900": "GENODEF1P08",
-    "DEXX20110022": "PBNKDEFFXXX",
-    "DEXX20110700": "BOTKDEH1XXX",
-    "DEXX20110800": "BKCHDEFFHMB",
-    "DEXX20120000": "BEGODEHHXXX",
-    "DEXX20120100": "WBWCDEHHXXX",
-    "DEXX20120200": "BHFBDEFF200",
-    "DEXX20120400": "DRBKDEH1XXX",
-    "DEXX20120520": "BFSWDE33HAN",
-    "DEXX20120600": "GOGODEH1XXX",
-    "DEXX20120700": "HSTBDEHHXXX",
-    "DEXX20130400": "GREBDEH1XXX",
-    "DEXX20130600": "BARCDEHAXXX",
-    "DEXX20133300": "SCFBDE33XXX",
-    "DEXX20190003": "GENODEF1HH2",
-    "DEXX20190077": "GENODEF1HH2",
-    "DEXX20190109": "GENODEF1HH4",
-    "DEXX20190206": "GENODEF1HH1",
-    "DEXX20190301": "GENODEF1HH3",
-    "DEXX20190800": "GENODEF1MKB",
-    "DEXX20210200": "MELIDEHHXXX",
-    "DEXX20210300": "SIHRDEH1HAM",
-    "DEXX20220100": "DNBADEHXXXX",
-    "DEXX20220400": "MMWHDEH1XXX",
-    "DEXX20220800": "SXPYDEHHXXX",
-    "DEXX20230300": "OSCBDEH1XXX",
-    "DEXX20230600": "ISBKDEFXXXX",
-    "DEXX20230800": "MHSBDEHBXXX",
-    "DEXX20310300": "EIHBDEHHXXX",
-    "DEXX20320500": "DABADEHHXXX",
-    "DEXX20690500": "GENODEF1S11",
-    "DEXX20730001": "HYVEDEMME01",
-    "DEXX20730002": "HYVEDEMME02",
-    "DEXX20730003": "HYVEDEMME03",
-    "DEXX20730004": "HYVEDEMME04",
-    "DEXX20730005": "HYVEDEMME05",
-    "DEXX20730006": "HYVEDEMME06",
-    "DEXX20730007": "HYVEDEMME07",
-    "DEXX20730008": "HYVEDEMME08",
-    "DEXX20730009": "HYVEDEMME09",
-    "DEXX20730010": "HYVEDEMME10",
-    "DEXX20730011": "HYVEDEMME11",
-    "DEXX20730012": "HYVEDEMME12",
-    "DEXX20730013": "HYVEDEMME13",
-    "DEXX20730014": "HYVEDEMME14",
-    "DEXX20730015": "HYVEDEMME15",
-    "DEXX20730016": "HYVEDEMME16",
-    "DEXX20730017": "HYVEDEMME17",
-    "DEXX20730018": "HYVEDEMME18",
-    "DEXX20730019": "HYVEDEMME19",
-    "DEXX20730020": "HYVEDEMME20",
-    "DEXX20730021": "HYVEDEMME21",
-    "DEXX20730022": "HYVEDEMME22",
-    "DEXX20730023": "HYVEDEMME23",
-    "DEXX20730024": "HYVEDEMME24",
-    "DEXX20730025": "HYVEDEMME25",
-    "DEXX20730026": "HYVEDEMME26",
-    "DEXX20730027": "HYVEDEMME27",
-    "DEXX20730028": "HYVEDEMME28",
-    "DEXX20730029": "HYVEDEMME29",
-    "DEXX20730030": "HYVEDEMME30",
-    "DEXX20730031": "HYVEDEMME31",
-    "DEXX20730032": "HYVEDEMME32",
-    "DEXX20730033": "HYVEDEMME33",
-    "DEXX20730034": "HYVEDEMME34",
-    "DEXX20730035": "HYVEDEMME35",
-    "DEXX20730036": "HYVEDEMME36",
-    "DEXX20730037": "HYVEDEMME37",
-    "DEXX20730038": "HYVEDEMME38",
-    "DEXX20730039": "HYVEDEMME39",
-    "DEXX20730040": "HYVEDEMME40",
-    "DEXX20730041": "HYVEDEMME41",
-    "DEXX20730042": "HYVEDEMME42",
-    "DEXX20730043": "HYVEDEMME43",
-    "DEXX20730044": "HYVEDEMME44",
-    "DEXX20730045": "HYVEDEMME45",
-    "DEXX20730046": "HYVEDEMME46",
-    "DEXX20730047": "HYVEDEMME47",
-    "DEXX20730048": "HYVEDEMME48",
-    "DEXX20730049": "HYVEDEMME49",
-    "DEXX20730050": "HYVEDEMME50",
-    "DEXX20730052": "HYVEDEMME52",
-    "DEXX20730055": "HYVEDEMME55",
-    "DEXX20730056": "HYVEDEMME56",
-    "DEXX20730057": "HYVEDEMME57",
-    "DEXX20730058": "HYVEDEMME58",
-    "DEXX20730059": "HYVEDEMME59",
-    "DEXX20730060": "HYVEDEMME60",
-    "DEXX20730061": "HYVEDEMME61",
-    "DEXX20730062": "HYVEDEMME62",
-    "DEXX20730063": "HYVEDEMME63",
-    "DEXX20730064": "HYVEDEMME64",
-    "DEXX20730065": "HYVEDEMME65",
-    "DEXX20730066": "HYVEDEMME66",
-    "DEXX20730067": "HYVEDEMME67",
-    "DEXX20730068": "HYVEDEMME68",
-    "DEXX20730069": "HYVEDEMME69",
-    "DEXX20730070": "HYVEDEMME70",
-    "DEXX20730071": "HYVEDEMME71",
-    "DEXX20730072": "HYVEDEMME72",
-    "DEXX20730073": "HYVEDEMME73",
-    "DEXX20730074": "HYVEDEMME74",
-    "DEXX20730075": "HYVEDEMME75",
-    "DEXX20730076": "HYVEDEMME76",
-    "DEXX20730077": "HYVEDEMME77",
-    "DEXX20730078": "HYVEDEMME78",
-    "DEXX20730079": "HYVEDEMME79",
-    "DEXX20730080": "HYVEDEMME80",
-    "DEXX20730081": "HYVEDEMME81",
-    "DEXX20730082": "HYVEDEMME82",
-    "DEXX20730083": "HYVEDEMME83",
-    "DEXX20730084": "HYVEDEMME84",
-    "DEXX20730085": "HYVEDEMME85",
-    "DEXX20730086": "HYVEDEMME86",
-    "DEXX20730087": "HYVEDEMME87",
-    "DEXX20730088": "HYVEDEMME88",
-    "DEXX20730089": "HYVEDEMME89",
-    "DEXX20730090": "HYVEDEMME90",
-    "DEXX20730091": "HYVEDEMME91",
-    "DEXX20730092": "HYVEDEMME92",
-    "DEXX20730093": "HYVEDEMME93",
-    "DEXX20730094": "HYVEDEMME94",
-    "DEXX20730095": "HYVEDEMME95",
-    "DEXX20730096": "HYVEDEMME96",
-    "DEXX20730097": "HYVEDEMME97",
-    "DEXX20730098": "HYVEDEMME98",
-    "DEXX20730099": "HYVEDEMME99",
-    "DEXX20750000": "NOLADE21HAM",
-    "DEXX21000000": "MARKDEF1210",
-    "DEXX21020600": "SYBKDE22KIE",
-    "DEXX21040010": "COBADEFFXXX",
-    "DEXX21042076": "COBADEFFXXX",
-    "DEXX21050000": "HSHNDEHHXXX",
-    "DEXX21050170": "NOLADE21KIE",
-    "DEXX21051275": "NOLADE21BOR",
-    "DEXX21051580": "NOLADE21PLN",
-    "DEXX21052090": "NOLADE21ECK",
-    "DEXX21070020": "DEUTDEHH210",
-    "DEXX21070024": "DEUTDEDB210",
-    "DEXX21080050": "DRESDEFF210",
-    "DEXX21089201": "DRESDEFFI07",
-    "DEXX21090007": "GENODEF1KIL",
-    "DEXX21090099": "GENODEF1KIL",
-    "DEXX21090619": "DAAEDED1019",
-    "DEXX21090900": "GENODEF1P11",
-    "DEXX21092023": "GENODEF1EFO",
-    "DEXX21240040": "COBADEFFXXX",
-    "DEXX21241540": "COBADEFFXXX",
-    "DEXX21261089": "GENODEF1WAS",
-    "DEXX21261227": "GENODEF1BOO",
-    "DEXX21270020": "DEUTDEHH212",
-    "DEXX21270024": "DEUTDEDB212",
-    "DEXX21280002": "DRESDEFF212",
-    "DEXX21290016": "GENODEF1NMS",
-    "DEXX21340010": "COBADEFFXXX",
-    "DEXX21352240": "NOLADE21HOL",
-    "DEXX21390008": "GENODEF1NSH",
-    "DEXX21392218": "GENODEF1EUT",
-    "DEXX21440045": "COBADEFFXXX",
-    "DEXX21450000": "NOLADE21RDB",
-    "DEXX21451205": "NOLADE21BDF",
-    "DEXX21452030": "NOLADE21HWS",
-    "DEXX21463603": "GENODEF1NTO",
-    "DEXX21464671": "GENODEF1TOB",
-    "DEXX21480003": "DRESDEFF214",
-    "DEXX21510600": "SYBKDE22XXX",
-    "DEXX21520100": "UNBNDE21XXX",
-    "DEXX21540060": "COBADEFFXXX",
-    "DEXX21565316": "GENODEF1HDW",
-    "DEXX21570011": "DEUTDEHH215",
-    "DEXX21570024": "DEUTDEDB215",
-    "DEXX21580000": "DRESDEFF215",
-    "DEXX21661719": "GENODEF1RSL",
-    "DEXX21690020": "GENODEF1SLW",
-    "DEXX21740043": "COBADEFFXXX",
-    "DEXX21741674": "COBADEFFXXX",
-    "DEXX21741825": "COBADEFFXXX",
-    "DEXX21750000": "NOLADE21NOS",
-    "DEXX21751230": "NOLADE21BRD",
-    "DEXX21762550": "GENODEF1HUM",
-    "DEXX21763542": "GENODEF1BDS",
-    "DEXX21770011": "DEUTDEHH217",
-    "DEXX21770024": "DEUTDEDB217",
-    "DEXX21791805": "GENODEF1SYL",
-    "DEXX21791906": "GENODEF1WYK",
-    "DEXX21840078": "COBADEFFXXX",
-    "DEXX21841328": "COBADEFFXXX",
-    "DEXX21852310": "NOLADE21WEB",
-    "DEXX21860418": "GENODEF1RHE",
-    "DEXX21890022": "GENODEF1DVR",
-    "DEXX22140028": "COBADEFFXXX",
-    "DEXX22141028": "COBADEFFXXX",
-    "DEXX22141428": "COBADEFFXXX",
-    "DEXX22141628": "COBADEFFXXX",
-    "DEXX22150000": "NOLADE21ELH",
-    "DEXX22151730": "NOLADE21WED",
-    "DEXX22163114": "GENODEF1HTE",
-    "DEXX22180000": "DRESDEFF221",
-    "DEXX22181400": "DRESDEFF206",
-    "DEXX22190030": "GENODEF1ELM",
-    "DEXX22191405": "GENODEF1PIN",
-    "DEXX22240073": "COBADEFFXXX",
-    "DEXX22250020": "NOLADE21WHO",
-    "DEXX22280000": "DRESDEFF201",
-    "DEXX22290031": "GENODEF1VIT",
-    "DEXX23000000": "MARKDEF1230",
-    "DEXX23040022": "COBADEFFXXX",
-    "DEXX23050000": "HSHNDEHH230",
-    "DEXX23050101": "NOLADE21SPL",
-    "DEXX23051030": "NOLADE21SHO",
-    "DEXX23052750": "NOLADE21RZB",
-    "DEXX23061220": "GENODEF1LZN",
-    "DEXX23062124": "GENODEF1BAR",
-    "DEXX23063129": "GENODEF1RLB",
-    "DEXX23064107": "GENODEF1BCH",
-    "DEXX23070700": "DEUTDEDB237",
-    "DEXX23070710": "DEUTDEHH222",
-    "DEXX23080040": "DRESDEFF230",
-    "DEXX23089201": "DRESDEFFI08",
-    "DEXX23090142": "GENODEF1HLU",
-    "DEXX23092620": "DAAEDED1020",
-    "DEXX24040000": "COBADEFFXXX",
-    "DEXX24050110": "NOLADE21LBG",
-    "DEXX24060300": "GENODEF1NBU",
-    "DEXX24061392": "GENODEF1DAB",
-    "DEXX24070024": "DEUTDEDB240",
-    "DEXX24070075": "DEUTDE2H240",
-    "DEXX24080000": "DRESDEFF240",
-    "DEXX24090041": "GENODEF1LUE",
-    "DEXX24121000": "GENODED1RKI",
-    "DEXX24140041": "COBADEFFXXX",
-    "DEXX24150001": "BRLADE21CUX",
-    "DEXX24151005": "NOLADE21STS",
-    "DEXX24151116": "NOLADE21STK",
-    "DEXX24151235": "BRLADE21ROB",
-    "DEXX24161594": "GENODEF1SIT",
-    "DEXX24162898": "GENODEF1LAS",
-    "DEXX24180000": "DRESDEFF242",
-    "DEXX24180001": "DRESDEFF241",
-    "DEXX24191015": "GENODEF1SDE",
-    "DEXX25000000": "MARKDEF1250",
-    "DEXX25010030": "PBNKDEFFXXX",
-    "DEXX25010424": "AARBDE5W250",
-    "DEXX25010600": "DEHYDE2HXXX",
-    "DEXX25010900": "CKVHDE21XXX",
-    "DEXX25020200": "BHFBDEFF250",
-    "DEXX25020600": "SCFBDE33XXX",
-    "DEXX25040060": "COBADEFFXXX",
-    "DEXX25040061": "COBADEFFXXX",
-    "DEXX25040066": "COBADEFFXXX",
-    "DEXX25050000": "NOLADE2HXXX",
-    "DEXX25050055": "NOLADE21CSH",
-    "DEXX25050066": "NOLADE21CMV",
-    "DEXX25050180": "SPKHDE2HXXX",
-    "DEXX25055500": "NOLADE21LBS",
-    "DEXX25060000": "GENODEFF250",
-    "DEXX25060180": "HALLDE2HXXX",
-    "DEXX25069168": "GENODEF1DES",
-    "DEXX25069262": "GENODEF1NST",
-    "DEXX25069270": "GENODEF1MUA",
-    "DEXX25069503": "GENODEF1BNT",
-    "DEXX25070024": "DEUTDEDBHAN",
-    "DEXX25070066": "DEUTDE2H265",
-    "DEXX25070070": "DEUTDE2HXXX",
-    "DEXX25070077": "DEUTDE2H256",
-    "DEXX25070084": "DEUTDE2H258",
-    "DEXX25070086": "DEUTDE2H251",
-    "DEXX25080020": "DRESDEFF250",
-    "DEXX25080085": "DRESDEFFI65",
-    "DEXX25089220": "DRESDEFFI09",
-    "DEXX25090300": "GENODEF1BFS",
-    "DEXX25090500": "GENODEF1S09",
-    "DEXX25090608": "DAAEDED1008",
-    "DEXX25090900": "GENODEF1P09",
-    "DEXX25120510": "BFSWDE33HAN",
-    "DEXX25151270": "NOLADE21BAH",
-    "DEXX25151371": "NOLADE21BUF",
-    "DEXX25152375": "NOLADE21WAL",
-    "DEXX25152490": "NOLADE21WST",
-    "DEXX25190001": "VOHADE2HXXX",
-    "DEXX25190088": "VOHADE2HXXX",
-    "DEXX25193331": "GENODEF1PAT",
-    "DEXX25250001": "NOLADE21PEI",
-    "DEXX25260010": "GENODEF1PEV",
-    "DEXX25410200": "BHWBDE2HXXX",
-    "DEXX25440047": "COBADEFFXXX",
-    "DEXX25450001": "NOLADE21HMS",
-    "DEXX25450110": "NOLADE21SWB",
-    "DEXX25451345": "NOLADE21PMT",
-    "DEXX25462160": "GENODEF1HMP",
-    "DEXX25462680": "GENODEF1COP",
-    "DEXX25470024": "DEUTDEDB254",
-    "DEXX25470073": "DEUTDE2H254",
-    "DEXX25471024": "DEUTDEDB264",
-    "DEXX25471073": "DEUTDE2H264",
-    "DEXX25480021": "DRESDEFF254",
-    "DEXX25491273": "GENODED1AEZ",
-    "DEXX25541426": "COBADEFFXXX",
-    "DEXX25551480": "NOLADE21SHG",
-    "DEXX25591413": "GENODEF1BCK",
-    "DEXX25621327": "OLBODEH2XXX",
-    "DEXX25641302": "COBADEFFXXX",
-    "DEXX25650106": "NOLADE21NIB",
-    "DEXX25651325": "BRLADE21DHZ",
-    "DEXX25662540": "GENODEF1STY",
-    "DEXX25663584": "GENODEF1HOY",
-    "DEXX25690009": "GENODEF1NIN",
-    "DEXX25690010": "GENODEF1NIN",
-    "DEXX25691633": "GENODEF1SUL",
-    "DEXX25691699": "GENODEF1SUL",
-    "DEXX25740061": "COBADEFFXXX",
-    "DEXX25750001": "NOLADE21CEL",
-    "DEXX25761894": "GENODEF1WIK",
-    "DEXX25770024": "DEUTDEDB257",
-    "DEXX25770069": "DEUTDE2H257",
-    "DEXX25780022": "DRESDEFF257",
-    "DEXX25791516": "GENODEF1HKB",
-    "DEXX25791635": "GENODEF1HMN",
-    "DEXX25840048": "COBADEFFXXX",
-    "DEXX25841403": "COBADEFFXXX",
-    "DEXX25841708": "COBADEFFXXX",
-    "DEXX25850110": "NOLADE21UEL",
-    "DEXX25851335": "NOLADE21DAN",
-    "DEXX25851660": "NOLADE21SOL",
-    "DEXX25861990": "GENODEF1CLZ",
-    "DEXX25862292": "GENODEF1EUB",
-    "DEXX25863489": "GENODEF1WOT",
-    "DEXX25891636": "GENODEF1SOL",
-    "DEXX25940033": "COBADEFFXXX",
-    "DEXX25950001": "NOLADE21HIS",
-    "DEXX25950130": "NOLADE21HIK",
-    "DEXX25970024": "DEUTDEDB259",
-    "DEXX25970074": "DEUTDE2H259",
-    "DEXX25971024": "DEUTDEDB253",
-    "DEXX25971071": "DEUTDE2H253",
-    "DEXX25980027": "DRESDEFF259",
-    "DEXX25990011": "GENODEF1HIH",
-    "DEXX25991528": "GENODEF1SLD",
-    "DEXX26000000": "MARKDEF1260",
-    "DEXX26040030": "COBADEFFXXX",
-    "DEXX26050001": "NOLADE21GOE",
-    "DEXX26051260": "NOLADE21DUD",
-    "DEXX26051450": "NOLADE21HMU",
-    "DEXX26061291": "GENODEF1DUD",
-    "DEXX26061556": "GENODEF1ADE",
-    "DEXX26062433": "GENODEF1DRA",
-    "DEXX26070024": "DEUTDEDB260",
-    "DEXX26070072": "DEUTDE2H260",
-    "DEXX26080024": "DRESDEFF260",
-    "DEXX26090050": "GENODEF1GOE",
-    "DEXX26240039": "COBADEFFXXX",
-    "DEXX26250001": "NOLADE21NOM",
-    "DEXX26251425": "NOLADE21EIN",
-    "DEXX26261396": "GENODEF1VDA",
-    "DEXX26261492": "GENODEF1EIN",
-    "DEXX26261693": "GENODEF1HDG",
-    "DEXX26271424": "DEUTDEDB262",
-    "DEXX26271471": "DEUTDE2H262",
-    "DEXX26280020": "DRESDEFF261",
-    "DEXX26281420": "DRESDEFF262",
-    "DEXX26340056": "COBADEFFXXX",
-    "DEXX26341072": "COBADEFFXXX",
-    "DEXX26350001": "NOLADE21OHA",
-    "DEXX26351015": "NOLADE21HZB",
-    "DEXX26351445": "NOLADE21SAC",
-    "DEXX26500000": "MARKDEF1265",
-    "DEXX26520017": "OLBODEH2XXX",
-    "DEXX26521703": "OLBODEH2XXX",
-    "DEXX26522319": "OLBODEH2XXX",
-    "DEXX26540070": "COBADEFFXXX",
-    "DEXX26550105": "NOLADE22XXX",
-    "DEXX26551540": "NOLADE21BEB",
-    "DEXX26552286": "NOLADE21MEL",
-    "DEXX26560625": "DAAEDED1025",
-    "DEXX26562490": "GENODEF1HTR",
-    "DEXX26563960": "GENODEF1WHO",
-    "DEXX26565928": "GENODEF1HGM",
-    "DEXX26566939": "GENODEF1MRZ",
-    "DEXX26567943": "GENODEF1NOP",
-    "DEXX26570024": "DEUTDEDB265",
-    "DEXX26570090": "DEUTDE3B265",
-    "DEXX26580070": "DRESDEFF265",
-    "DEXX26589210": "DRESDEFFI10",
-    "DEXX26590025": "GENODEF1OSV",
-    "DEXX26620010": "OLBODEH2XXX",
-    "DEXX26621413": "OLBODEH2XXX",
-    "DEXX26640049": "COBADEFFXXX",
-    "DEXX26650001": "NOLADE21EMS",
-    "DEXX26660060": "GENODEF1LIG",
-    "DEXX26661380": "GENODEF1HLN",
-    "DEXX26661494": "GENODEF1MEP",
-    "DEXX26662932": "GENODEF1LEN",
-    "DEXX26691213": "GENODEF1HAR",
-    "DEXX26720028": "OLBODEH2XXX",
-    "DEXX26740044": "COBADEFFXXX",
-    "DEXX26750001": "NOLADE21NOH",
-    "DEXX26760005": "GENODEF1NDH",
-    "DEXX26770024": "DEUTDEDB267",
-    "DEXX26770095": "DEUTDE3B267",
-    "DEXX26840032": "COBADEFFXXX",
-    "DEXX26850001": "NOLADE21GSL",
-    "DEXX26851410": "NOLADE21CLZ",
-    "DEXX26851620": "NOLADE21SZG",
-    "DEXX26870024": "DEUTDEDB268",
-    "DEXX26870032": "DEUTDE2H268",
-    "DEXX26880063": "DRESDEFF268",
-    "DEXX26890019": "GENODEF1VNH",
-    "DEXX26891484": "GENODEF1OHA",
-    "DEXX26941053": "COBADEFFXXX",
-    "DEXX26951311": "NOLADE21GFW",
-    "DEXX26971024": "DEUTDEDB269",
-    "DEXX26971038": "DEUTDE2H269",
-    "DEXX26981062": "DRESDEFF269",
-    "DEXX26989221": "DRESDEFFI11",
-    "DEXX26991066": "GENODEF1WOB",
-    "DEXX27010200": "VONEDE33BRA",
-    "DEXX27020000": "VOWADE2BXXX",
-    "DEXX27020001": "AUDFDE21XXX",
-    "DEXX27020003": "SKODDE21XXX",
-    "DEXX27020004": "ECBKDE21XXX",
-    "DEXX27020800": "SEATDE21XXX",
-    "DEXX27032500": "BCLSDE21XXX",
-    "DEXX27040080": "COBADEFFXXX",
-    "DEXX27062290": "GENODEF1BOH",
-    "DEXX27070024": "DEUTDEDB270",
-    "DEXX27070030": "DEUTDE2H270",
-    "DEXX27070031": "DEUTDE2H271",
-    "DEXX27070034": "DEUTDE2H274",
-    "DEXX27070041": "DEUTDE2H279",
-    "DEXX27070042": "DEUTDE2H272",
-    "DEXX27070043": "DEUTDE2H273",
-    "DEXX27070079": "DEUTDE2H275",
-    "DEXX27072524": "DEUTDEDB277",
-    "DEXX27072537": "DEUTDE2H277",
-    "DEXX27072724": "DEUTDEDB276",
-    "DEXX27072736": "DEUTDE2H276",
-    "DEXX27080060": "DRESDEFF270",
-    "DEXX27089221": "DRESDEFFI12",
-    "DEXX27090618": "DAAEDED1018",
-    "DEXX27090900": "GENODEF1P02",
-    "DEXX27092555": "GENODEF1WFV",
-    "DEXX27131300": "GENODEF1RTS",
-    "DEXX27240004": "COBADEFFXXX",
-    "DEXX27290087": "GENODEF1HMV",
-    "DEXX27893359": "GENODEF1BLG",
-    "DEXX27893760": "GENODEF1SES",
-    "DEXX28000000": "MARKDEF1280",
-    "DEXX28020050": "OLBODEH2XXX",
-    "DEXX28021002": "OLBODEH2XXX",
-    "DEXX28021301": "OLBODEH2XXX",
-    "DEXX28021504": "OLBODEH2XXX",
-    "DEXX28021623": "OLBODEH2XXX",
-    "DEXX28021705": "OLBODEH2XXX",
-    "DEXX28021906": "OLBODEH2XXX",
-    "DEXX28022015": "OLBODEH2XXX",
-    "DEXX28022412": "OLBODEH2XXX",
-    "DEXX28022511": "OLBODEH2XXX",
-    "DEXX28022620": "OLBODEH2XXX",
-    "DEXX28022822": "OLBODEH2XXX",
-    "DEXX28023224": "OLBODEH2XXX",
-    "DEXX28023325": "OLBODEH2XXX",
-    "DEXX28030300": "FORTDEH4XXX",
-    "DEXX28040046": "COBADEFFXXX",
-    "DEXX28042865": "COBADEFFXXX",
-    "DEXX28050100": "SLZODE22XXX",
-    "DEXX28060228": "GENODEF1OL2",
-    "DEXX28061410": "GENODEF1BRN",
-    "DEXX28061501": "GENODEF1CLP",
-    "DEXX28061679": "GENODEF1DAM",
-    "DEXX28061822": "GENODEF1EDE",
-    "DEXX28062165": "GENODEF1RSE",
-    "DEXX28062249": "GENODEF1HUD",
-    "DEXX28062299": "GENODEF1HUD",
-    "DEXX28062560": "GENODEF1LON",
-    "DEXX28062740": "GENODEF1GBH",
-    "DEXX28062913": "GENODEF1BSL",
-    "DEXX28063253": "GENODEF1WRE",
-    "DEXX28063526": "GENODEF1ESO",
-    "DEXX28063607": "GENODEF1BAM",
-    "DEXX28064179": "GENODEF1VEC",
-    "DEXX28064241": "GENODEF1NHE",
-    "DEXX28065061": "GENODEF1LOG",
-    "DEXX28065108": "GENODEF1DIK",
-    "DEXX28065286": "GENODEF1SAN",
-    "DEXX28066103": "GENODEF1VIS",
-    "DEXX28066214": "GENODEF1WDH",
-    "DEXX28066620": "GENODEF1FOY",
-    "DEXX28067068": "GENODEF1NEO",
-    "DEXX28067170": "GENODEF1GSC",
-    "DEXX28067257": "GENODEF1LAP",
-    "DEXX28068218": "GENODEF1BUT",
-    "DEXX28069052": "GENODEF1ORF",
-    "DEXX28069092": "GENODEF1HAT",
-    "DEXX28069109": "GENODEF1EMK",
-    "DEXX28069128": "GENODEF1GRR",
-    "DEXX28069138": "GENODEF1VAG",
-    "DEXX28069293": "GENODEF1BBH",
-    "DEXX28069381": "GENODEF1WLT",
-    "DEXX28069706": "GENODEF1BOG",
-    "DEXX28069755": "GENODEF1MLO",
-    "DEXX28069773": "GENODEF1WWM",
-    "DEXX28069878": "GENODEF1KBL",
-    "DEXX28069926": "GENODEF1HOO",
-    "DEXX28069930": "GENODEF1LAG",
-    "DEXX28069935": "GENODEF1LRU",
-    "DEXX28069956": "GENODEF1NEV",
-    "DEXX28069991": "GENODEF1LTH",
-    "DEXX28069994": "GENODEF1SPL",
-    "DEXX28070024": "DEUTDEDB280",
-    "DEXX28070057": "DEUTDEHB280",
-    "DEXX28090633": "DAAEDED1033",
-    "DEXX28220026": "OLBODEH2XXX",
-    "DEXX28222208": "OLBODEH2XXX",
-    "DEXX28222621": "OLBODEH2XXX",
-    "DEXX28240023": "COBADEFFXXX",
-    "DEXX28250110": "BRLADE21WHV",
-    "DEXX28252760": "BRLADE21WTM",
-    "DEXX28262254": "GENODEF1JEV",
-    "DEXX28262673": "GENODEF1VAR",
-    "DEXX28270024": "DEUTDEDB282",
-    "DEXX28270056": "DEUTDEHB282",
-    "DEXX28280012": "DRESDEFF282",
-    "DEXX28290063": "GENODEF1WHV",
-    "DEXX28291551": "GENODEF1ESE",
-    "DEXX28320014": "OLBODEH2XXX",
-    "DEXX28321816": "OLBODEH2XXX",
-    "DEXX28350000": "BRLADE21ANO",
-    "DEXX28361592": "GENODEF1MAR",
-    "DEXX28420007": "OLBODEH2XXX",
-    "DEXX28421030": "OLBODEH2XXX",
-    "DEXX28440037": "COBADEFFXXX",
-    "DEXX28450000": "BRLADE21EMD",
-    "DEXX28470024": "DEUTDEDB284",
-    "DEXX28470091": "DEUTDEHB284",
-    "DEXX28520009": "OLBODEH2XXX",
-    "DEXX28521518": "OLBODEH2XXX",
-    "DEXX28540034": "COBADEFFXXX",
-    "DEXX28550000": "BRLADE21LER",
-    "DEXX28562297": "GENODEF1UPL",
-    "DEXX28562716": "GENODEF1WEF",
-    "DEXX28562863": "GENODEF1HTL",
-    "DEXX28563749": "GENODEF1MML",
-    "DEXX28570024": "DEUTDEDB285",
-    "DEXX28570092": "DEUTDEHB285",
-    "DEXX28590075": "GENODEF1LER",
-    "DEXX28591579": "GENODEF1PAP",
-    "DEXX28591654": "GENODEF1WRH",
-    "DEXX29000000": "MARKDEF1290",
-    "DEXX29010400": "COBADEFFDSB",
-    "DEXX29020000": "NEELDE22XXX",
-    "DEXX29020100": "BANVDEHBXXX",
-    "DEXX29020200": "NFHBDE21XXX",
-    "DEXX29030400": "PLUMDE29XXX",
-    "DEXX29040060": "COBADEFFXXX",
-    "DEXX29040061": "COBADEFFXXX",
-    "DEXX29040090": "COBADEFFXXX",
-    "DEXX29050000": "BRLADE22XXX",
-    "DEXX29050101": "SBREDE22XXX",
-    "DEXX29070024": "DEUTDEDBBRE",
-    "DEXX29070050": "DEUTDEHBXXX",
-    "DEXX29070051": "DEUTDEHB292",
-    "DEXX29070052": "DEUTDEHB294",
-    "DEXX29070058": "DEUTDEHB293",
-    "DEXX29070059": "DEUTDEHB290",
-    "DEXX29080010": "DRESDEFF290",
-    "DEXX29089210": "DRESDEFFI13",
-    "DEXX29090605": "DAAEDED1005",
-    "DEXX29090900": "GENODEF1P03",
-    "DEXX29121731": "OLBODEH2XXX",
-    "DEXX29151700": "BRLADE21SYK",
-    "DEXX29152300": "BRLADE21OHZ",
-    "DEXX29152550": "BRLADE21SHL",
-    "DEXX29152670": "BRLADE21VER",
-    "DEXX29162394": "GENODEF1OHZ",
-    "DEXX29162453": "GENODEF1SWW",
-    "DEXX29162697": "GENODEF1VER",
-    "DEXX29165545": "GENODEF1OYT",
-    "DEXX29165681": "GENODEF1SUM",
-    "DEXX29166568": "GENODEF1WOP",
-    "DEXX29167624": "GENODEF1SHR",
-    "DEXX29172624": "DEUTDEDB291",
-    "DEXX29172655": "DEUTDEHB291",
-    "DEXX29190024": "GENODEF1HB1",
-    "DEXX29190330": "GENODEF1HB2",
-    "DEXX29190399": "GENODEF1HB2",
-    "DEXX29240024": "COBADEFFXXX",
-    "DEXX29250000": "BRLADE21BRS",
-    "DEXX29250150": "BRLADE21BRK",
-    "DEXX29262722": "GENODEF1BRV",
-    "DEXX29265747": "GENODEF1BEV",
-    "DEXX29280011": "DRESDEFF292",
-    "DEXX29290034": "GENODEF1HBV",
-    "DEXX30000000": "MARKDEF1300",
-    "DEXX30010400": "IKBDDEDDXXX",
-    "DEXX30010444": "IKBDDEDDDIR",
-    "DEXX30010700": "BOTKDEDXXXX",
-    "DEXX30019000": "IPAGDEDFXXX",
-    "DEXX30020500": "BHFBDEFF300",
-    "DEXX30020700": "MHCBDEDDXXX",
-    "DEXX30020900": "CMCIDEDDXXX",
-    "DEXX30022000": "NRWBDEDMXXX",
-    "DEXX30025500": "PORTDEDDXXX",
-    "DEXX30030100": "PULSDEDDXXX",
-    "DEXX30030500": "CUABDED1XXX",
-    "DEXX30030600": "ETRIDE31XXX",
-    "DEXX30030880": "TUBDDEDDXXX",
-    "DEXX30030889": "TUBDDEDDXXX",
-    "DEXX30030900": "MEFIDEMM300",
-    "DEXX30040000": "COBADEDDXXX",
-    "DEXX30040005": "COBADEDDXXX",
-    "DEXX30040048": "COBADEFFXXX",
-    "DEXX30040060": "COBADEFFXXX",
-    "DEXX30040061": "COBADEFFXXX",
-    "DEXX30040062": "COBADEFFXXX",
-    "DEXX30040063": "COBADEFFXXX",
-    "DEXX30050000": "WELADEDDXXX",
-    "DEXX30050110": "DUSSDEDDXXX",
-    "DEXX30060010": "GENODEDDXXX",
-    "DEXX30060601": "DAAEDEDDXXX",
-    "DEXX30060992": "GENODEF1P05",
-    "DEXX30070010": "DEUTDEDDXXX",
-    "DEXX30070024": "DEUTDEDBDUE",
-    "DEXX30080000": "DRESDEFF300",
-    "DEXX30080005": "DRESDEFFXXX",
-    "DEXX30080022": "DRESDEFFI28",
-    "DEXX30080038": "DRESDEFFXXX",
-    "DEXX30080041": "DRESDEFFI29",
-    "DEXX30080053": "DRESDEFFI30",
-    "DEXX30080055": "DRESDEFF309",
-    "DEXX30080057": "DRESDEFF316",
-    "DEXX30080061": "DRESDEFFI31",
-    "DEXX30080074": "DRESDEFFI32",
-    "DEXX30080080": "DRESDEFFI76",
-    "DEXX30080081": "DRESDEFFI77",
-    "DEXX30080082": "DRESDEFFI78",
-    "DEXX30080083": "DRESDEFFI79",
-    "DEXX30080084": "DRESDEFFI80",
-    "DEXX30080085": "DRESDEFFI81",
-    "DEXX30080086": "DRESDEFFI82",
-    "DEXX30080087": "DRESDEFFI83",
-    "DEXX30080088": "DRESDEFFI84",
-    "DEXX30080089": "DRESDEFFI85",
-    "DEXX30080095": "DRESDEFFI33",
-    "DEXX30089300": "DRESDEFFI02",
-    "DEXX30089302": "DRESDEFFI03",
-    "DEXX30110300": "SMBCDEDDXXX",
-    "DEXX30120500": "BANVDEHB300",
-    "DEXX30130100": "DHBNDEDDXXX",
-    "DEXX30130200": "UGBIDEDDXXX",
-    "DEXX30130600": "ISBKDEFXDUS",
-    "DEXX30150200": "WELADED1KSD",
-    "DEXX30160213": "GENODED1DNE",
-    "DEXX30160266": "GENODED1DNE",
-    "DEXX30220190": "HYVEDEMM414",
-    "DEXX30330800": "BIWBDE33303",
-    "DEXX30351220": "WELADED1HAA",
-    "DEXX30520000": "RCIDDE3NXXX",
-    "DEXX30520037": "RCIDDE3NPAY",
-    "DEXX30524400": "KREDDEDDXXX",
-    "DEXX30530000": "WERHDED1XXX",
-    "DEXX30530500": "WEFZDED1XXX",
-    "DEXX30550000": "WELADEDNXXX",
-    "DEXX30551240": "WELADED1KST",
-    "DEXX30560090": "GENODED1NSS",
-    "DEXX30560548": "GENODED1NLD",
-    "DEXX30560591": "GENODED1NLD",
-    "DEXX31010833": "SCFBDE33XXX",
-    "DEXX31040015": "COBADEFFXXX",
-    "DEXX31040060": "COBADEFFXXX",
-    "DEXX31040061": "COBADEFFXXX",
-    "DEXX31050000": "MGLSDE33XXX",
-    "DEXX31060181": "GENODED1GBM",
-    "DEXX31060517": "GENODED1MRB",
-    "DEXX31062154": "GENODED1KBN",
-    "DEXX31062553": "GENODED1NKR",
-    "DEXX31070001": "DEUTDEDD310",
-    "DEXX31070024": "DEUTDEDB310",
-    "DEXX31080015": "DRESDEFF310",
-    "DEXX31080061": "DRESDEFFI34",
-    "DEXX31251220": "WELADED1ERK",
-    "DEXX31261282": "GENODED1EHE",
-    "DEXX31263359": "GENODED1LOE",
-    "DEXX31460290": "GENODED1VSN",
-    "DEXX31470004": "DEUTDEDD314",
-    "DEXX31470024": "DEUTDEDB314",
-    "DEXX32040024": "COBADEFFXXX",
-    "DEXX32050000": "SPKRDE33XXX",
-    "DEXX32051996": "WELADED1STR",
-    "DEXX32060362": "GENODED1HTK",
-    "DEXX32061384": "GENODED1GDL",
-    "DEXX32061414": "GENODED1KMP",
-    "DEXX32070024": "DEUTDEDB320",
-    "DEXX32070080": "DEUTDEDD320",
-    "DEXX32080010": "DRESDEFF320",
-    "DEXX32250050": "WELADED1GOC",
-    "DEXX32440023": "COBADEFFXXX",
-    "DEXX32450000": "WELADED1KLE",
-    "DEXX32460422": "GENODED1KLL",
-    "DEXX32470024": "DEUTDEDB324",
-    "DEXX32470077": "DEUTDEDD324",
-    "DEXX33020000": "AKFBDE31XXX",
-    "DEXX33020190": "HYVEDEMM809",
-    "DEXX33030000": "GGABDE31XXX",
-    "DEXX33040001": "COBADEFFXXX",
-    "DEXX33040310": "COBADEDHXXX",
-    "DEXX33050000": "WUPSDE33XXX",
-    "DEXX33060098": "GENODED1CVW",
-    "DEXX33060592": "GENODED1SPW",
-    "DEXX33060616": "DAAEDED1016",
-    "DEXX33070024": "DEUTDEDBWUP",
-    "DEXX33070090": "DEUTDEDWXXX",
-    "DEXX33080001": "DRESDEFFI86",
-    "DEXX33080030": "DRESDEFF332",
-    "DEXX33080085": "DRESDEFFI87",
-    "DEXX33080086": "DRESDEFFI88",
-    "DEXX33080087": "DRESDEFFI89",
-    "DEXX33080088": "DRESDEFFI90",
-    "DEXX33440035": "COBADEFFXXX",
-    "DEXX33450000": "WELADED1VEL",
-    "DEXX33451220": "WELADED1HGH",
-    "DEXX34040049": "COBADEFFXXX",
-    "DEXX34050000": "WELADEDRXXX",
-    "DEXX34051350": "WELADED1RVW",
-    "DEXX34051570": "WELADED1WMK",
-    "DEXX34060094": "VBRSDE33XXX",
-    "DEXX34070024": "DEUTDEDB340",
-    "DEXX34070093": "DEUTDEDW340",
-    "DEXX34080031": "DRESDEFF340",
-    "DEXX34240050": "COBADEFFXXX",
-    "DEXX34250000": "SOLSDE33XXX",
-    "DEXX34270024": "DEUTDEDB342",
-    "DEXX34270094": "DEUTDEDW342",
-    "DEXX34280032": "DRESDEFF342",
-    "DEXX35040038": "COBADEFFXXX",
-    "DEXX35040085": "COBADEFFXXX",
-    "DEXX35050000": "DUISDE33XXX",
-    "DEXX35060190": "GENODED1DKD",
-    "DEXX35060199": "GENODED1DKD",
-    "DEXX35060386": "GENODED1VRR",
-    "DEXX35060632": "DAAEDED1032",
-    "DEXX35070024": "DEUTDEDB350",
-    "DEXX35070030": "DEUTDEDE350",
-    "DEXX35080070": "DRESDEFF350",
-    "DEXX35080085": "DRESDEFFI91",
-    "DEXX35080086": "DRESDEFFI92",
-    "DEXX35080087": "DRESDEFFI93",
-    "DEXX35080088": "DRESDEFFI94",
-    "DEXX35080089": "DRESDEFFI95",
-    "DEXX35090300": "GENODEF1BSD",
-    "DEXX35251000": "WELADED1DIN",
-    "DEXX35261248": "GENODED1DLK",
-    "DEXX35450000": "WELADED1MOR",
-    "DEXX35451460": "WELADED1NVL",
-    "DEXX35451775": "WELADED1RHB",
-    "DEXX35461106": "GENODED1NRH",
-    "DEXX35640064": "COBADEFFXXX",
-    "DEXX35650000": "WELADED1WES",
-    "DEXX35660501": "GENODED1RLW",
-    "DEXX35660599": "GENODED1RLW",
-    "DEXX35850000": "WELADED1EMR",
-    "DEXX35860245": "GENODED1EMR",
-    "DEXX36000000": "MARKDEF1360",
-    "DEXX36010043": "PBNKDEFFXXX",
-    "DEXX36010111": "ESSEDE5F360",
-    "DEXX36010200": "VONEDE33XXX",
-    "DEXX36010424": "AARBDE5W360",
-    "DEXX36010600": "GABKDE3EXXX",
-    "DEXX36020030": "NBAGDE3EXXX",
-    "DEXX36020186": "HYVEDEMM360",
-    "DEXX36033300": "SCFBDE33XXX",
-    "DEXX36040039": "COBADEFFXXX",
-    "DEXX36040060": "COBADEFFXXX",
-    "DEXX36040061": "COBADEFFXXX",
-    "DEXX36040085": "COBADEFFXXX",
-    "DEXX36050105": "SPESDE3EXXX",
-    "DEXX36060192": "GENODED1PA2",
-    "DEXX36060295": "GENODED1BBE",
-    "DEXX36060488": "GENODEM1GBE",
-    "DEXX36060591": "GENODED1SPE",
-    "DEXX36060610": "DAAEDED1010",
-    "DEXX36070024": "DEUTDEDBESS",
-    "DEXX36070050": "DEUTDEDEXXX",
-    "DEXX36080080": "DRESDEFF360",
-    "DEXX36080085": "DRESDEFFI66",
-    "DEXX36089321": "DRESDEFFI17",
-    "DEXX36240045": "COBADEFFXXX",
-    "DEXX36250000": "SPMHDE3EXXX",
-    "DEXX36270024": "DEUTDEDB362",
-    "DEXX36270048": "DEUTDEDE362",
-    "DEXX36280071": "DRESDEFF362",
-    "DEXX36540046": "COBADEFFXXX",
-    "DEXX36550000": "WELADED1OBH",
-    "DEXX36570024": "DEUTDEDB365",
-    "DEXX36570049": "DEUTDEDE365",
-    "DEXX36580072": "DRESDEFF365",
-    "DEXX37000000": "MARKDEF1370",
-    "DEXX37010050": "PBNKDEFFXXX",
-    "DEXX37010600": "BNPADEFFXXX",
-    "DEXX37010699": "BNPADEFFXXX",
-    "DEXX37011000": "PBNKDEFFXXX",
-    "DEXX37020090": "HYVEDEMM429",
-    "DEXX37020200": "AXABDE31XXX",
-    "DEXX37020400": "TOBADE33XXX",
-    "DEXX37020500": "BFSWDE33XXX",
-    "DEXX37020600": "AKBCDE31XXX",
-    "DEXX37020900": "FDBADE3KXXX",
-    "DEXX37021500": "FDBADE8FXXX",
-    "DEXX37021548": "LRFSDE31XXX",
-    "DEXX37030200": "SOPPDE3KXXX",
-    "DEXX37030700": "WWBADE3AXXX",
-    "DEXX37030800": "ISBKDEFXKOL",
-    "DEXX37040037": "COBADEFFXXX",
-    "DEXX37040044": "COBADEFFXXX",
-    "DEXX37040048": "COBADEFFXXX",
-    "DEXX37040060": "COBADEFFXXX",
-    "DEXX37040061": "COBADEFFXXX",
-    "DEXX37050198": "COLSDE33XXX",
-    "DEXX37050299": "COKSDE33XXX",
-    "DEXX37060120": "GENODED1PA7",
-    "DEXX37060193": "GENODED1PAX",
-    "DEXX37060590": "GENODED1SPK",
-    "DEXX37060615": "DAAEDED1015",
-    "DEXX37060993": "GENODEF1P13",
-    "DEXX37062124": "GENODED1BGL",
-    "DEXX37062365": "GENODED1FHH",
-    "DEXX37062600": "GENODED1PAF",
-    "DEXX37063367": "GENODED1FKH",
-    "DEXX37069101": "GENODED1AEG",
-    "DEXX37069103": "GENODED1ALD",
-    "DEXX37069125": "GENODED1RKO",
-    "DEXX37069153": "GENODED1HCK",
-    "DEXX37069164": "GENODED1MBU",
-    "DEXX37069252": "GENODED1ERE",
-    "DEXX37069302": "GENODED1GLK",
-    "DEXX37069303": "GENODED1GKK",
-    "DEXX37069306": "GENODED1GRB",
-    "DEXX37069322": "GENODED1EGY",
-    "DEXX37069330": "GENODED1HAW",
-    "DEXX37069331": "GENODED1KHO",
-    "DEXX37069342": "GENODED1HMB",
-    "DEXX37069354": "GENODED1SEG",
-    "DEXX37069355": "GENODED1AHO",
-    "DEXX37069381": "GENODED1IMM",
-    "DEXX37069401": "GENODED1JUK",
-    "DEXX37069405": "GENODED1KAA",
-    "DEXX37069412": "GENODED1HRB",
-    "DEXX37069427": "GENODED1DHK",
-    "DEXX37069429": "GENODED1KNL",
-    "DEXX37069472": "GENODED1ERF",
-    "DEXX37069520": "GENODED1RST",
-    "DEXX37069521": "GENODED1MNH",
-    "DEXX37069524": "GENODED1MUC",
-    "DEXX37069627": "GENODED1RBC",
-    "DEXX37069639": "GENODED1WND",
-    "DEXX37069642": "GENODED1SMR",
-    "DEXX37069707": "GENODED1SAM",
-    "DEXX37069720": "GENODED1SLE",
-    "DEXX37069805": "GENODED1WVI",
-    "DEXX37069833": "GENODED1WSL",
-    "DEXX37069840": "GENODED1WPF",
-    "DEXX37069991": "GENODED1BRL",
-    "DEXX37070000": "DEUTDEDK402",
-    "DEXX37070024": "DEUTDEDBKOE",
-    "DEXX37070060": "DEUTDEDKXXX",
-    "DEXX37080040": "DRESDEFF370",
-    "DEXX37080085": "DRESDEFFI51",
-    "DEXX37080086": "DRESDEFFI67",
-    "DEXX37080087": "DRESDEFFI96",
-    "DEXX37080088": "DRESDEFFI97",
-    "DEXX37080089": "DRESDEFFI98",
-    "DEXX37080090": "DRESDEFFJ01",
-    "DEXX37080091": "DRESDEFFJ02",
-    "DEXX37080092": "DRESDEFFJ03",
-    "DEXX37080093": "DRESDEFFJ04",
-    "DEXX37080094": "DRESDEFFJ05",
-    "DEXX37080095": "DRESDEFFJ06",
-    "DEXX37080096": "DRESDEFFXXX",
-    "DEXX37080097": "DRESDEFFXXX",
-    "DEXX37080098": "DRESDEFFJ07",
-    "DEXX37080099": "DRESDEFFI36",
-    "DEXX37089340": "DRESDEFFI04",
-    "DEXX37089342": "DRESDEFFI05",
-    "DEXX37160087": "GENODED1CGN",
-    "DEXX37161289": "GENODED1BRH",
-    "DEXX37540050": "COBADEFFXXX",
-    "DEXX37551020": "WELADED1LEI",
-    "DEXX37551440": "WELADEDLLEV",
-    "DEXX37551780": "WELADED1LAF",
-    "DEXX37560092": "GENODED1RWL",
-    "DEXX37570024": "DEUTDEDB375",
-    "DEXX37570064": "DEUTDEDK375",
-    "DEXX38010053": "PBNKDEFF380",
-    "DEXX38010700": "PBNKDEFFDSL",
-    "DEXX38010900": "DTABDED1XXX",
-    "DEXX38010999": "DTABDED1AUS",
-    "DEXX38011000": "VZVDDED1XXX",
-    "DEXX38011001": "VZVDDED1001",
-    "DEXX38011002": "VZVDDED1002",
-    "DEXX38011003": "VZVDDED1003",
-    "DEXX38011004": "VZVDDED1004",
-    "DEXX38011005": "VZVDDED1005",
-    "DEXX38011006": "VZVDDED1006",
-    "DEXX38011007": "VZVDDED1007",
-    "DEXX38011008": "VZVDDED1008",
-    "DEXX38020090": "HYVEDEMM402",
-    "DEXX38040007": "COBADEFFXXX",
-    "DEXX38050000": "COLSDE33BON",
-    "DEXX38051290": "WELADED1HON",
-    "DEXX38060186": "GENODED1BRS",
-    "DEXX38070024": "DEUTDEDB380",
-    "DEXX38070059": "DEUTDEDK380",
-    "DEXX38070724": "DEUTDEDBXXX",
-    "DEXX38077724": "DEUTDEDB383",
-    "DEXX38080055": "DRESDEFF380",
-    "DEXX38160220": "GENODED1HBO",
-    "DEXX38250110": "WELADED1EUS",
-    "DEXX38260082": "GENODED1EVB",
-    "DEXX38440016": "COBADEFFXXX",
-    "DEXX38450000": "WELADED1GMB",
-    "DEXX38452490": "WELADED1WIE",
-    "DEXX38462135": "GENODED1WIL",
-    "DEXX38470024": "DEUTDEDB384",
-    "DEXX38470091": "DEUTDEDW384",
-    "DEXX38621500": "GENODED1STB",
-    "DEXX38650000": "WELADED1SGB",
-    "DEXX38651390": "WELADED1HEN",
-    "DEXX39020000": "AABSDE31XXX",
-    "DEXX39040013": "COBADEFFXXX",
-    "DEXX39050000": "AACSDE33XXX",
-    "DEXX39060180": "GENODED1AAC",
-    "DEXX39060630": "DAAEDED1030",
-    "DEXX39061981": "GENODED1HNB",
-    "DEXX39070020": "DEUTDEDK390",
-    "DEXX39070024": "DEUTDEDB390",
-    "DEXX39080005": "DRESDEFF390",
-    "DEXX39080098": "DRESDEFFI37",
-    "DEXX39080099": "DRESDEFFI38",
-    "DEXX39160191": "GENODED1PA1",
-    "DEXX39161490": "GENODED1AAS",
-    "DEXX39162980": "GENODED1WUR",
-    "DEXX39362254": "GENODED1RSC",
-    "DEXX39540052": "COBADEFFXXX",
-    "DEXX39550110": "SDUEDE33XXX",
-    "DEXX39560201": "GENODED1DUE",
-    "DEXX39570024": "DEUTDEDB395",
-    "DEXX39570061": "DEUTDEDK395",
-    "DEXX39580041": "DRESDEFF395",
-    "DEXX40022000": "NRWBDEDMMST",
-    "DEXX40030000": "MLBKDEH1MUE",
-    "DEXX40040028": "COBADEFFXXX",
-    "DEXX40050000": "WELADE3MXXX",
-    "DEXX40050150": "WELADED1MST",
-    "DEXX40055555": "LBSWDE31XXX",
-    "DEXX40060000": "GENODEMSXXX",
-    "DEXX40060265": "GENODEM1DKM",
-    "DEXX40060300": "GENODEM1WLM",
-    "DEXX40060560": "GENODEF1S08",
-    "DEXX40060614": "DAAEDED1014",
-    "DEXX40061238": "GENODEM1GRV",
-    "DEXX40069226": "GENODEM1CND",
-    "DEXX40069266": "GENODEM1MAS",
-    "DEXX40069283": "GENODEM1SLN",
-    "DEXX40069348": "GENODEM1MDB",
-    "DEXX40069362": "GENODEM1SAE",
-    "DEXX40069363": "GENODEM1SMB",
-    "DEXX40069371": "GENODEM1BTH",
-    "DEXX40069408": "GENODEM1BAU",
-    "DEXX40069477": "GENODEM1DWU",
-    "DEXX40069546": "GENODEM1SDN",
-    "DEXX40069600": "GENODEM1MAB",
-    "DEXX40069601": "GENODEM1CAN",
-    "DEXX40069606": "GENODEM1ERR",
-    "DEXX40069622": "GENODEM1LSP",
-    "DEXX40069709": "GENODEM1DLR",
-    "DEXX40069716": "GENODEM1SCN",
-    "DEXX40070024": "DEUTDEDB400",
-    "DEXX40070080": "DEUTDE3B400",
-    "DEXX40080040": "DRESDEFF400",
-    "DEXX40080085": "DRESDEFFI68",
-    "DEXX40090900": "GENODEF1P15",
-    "DEXX40153768": "WELADED1EMS",
-    "DEXX40154006": "WELADED1GRO",
-    "DEXX40154476": "WELADED1LEN",
-    "DEXX40154530": "WELADE3WXXX",
-    "DEXX40154702": "WELADED1STL",
-    "DEXX40160050": "GENODEM1MSC",
-    "DEXX40163720": "GENODEM1SEE",
-    "DEXX40164024": "GENODEM1GRN",
-    "DEXX40164256": "GENODEM1LAE",
-    "DEXX40164352": "GENODEM1CNO",
-    "DEXX40164528": "GENODEM1LHN",
-    "DEXX40164618": "GENODEM1OTR",
-    "DEXX40164901": "GENODEM1GE1",
-    "DEXX40165366": "GENODEM1SEM",
-    "DEXX40166439": "GENODEM1LLE",
-    "DEXX40166800": "GENODEM1BUL",
-    "DEXX40340030": "COBADEFFXXX",
-    "DEXX40350005": "WELADED1RHN",
-    "DEXX40351060": "WELADED1STF",
-    "DEXX40351220": "WELADED1IBB",
-    "DEXX40361627": "GENODEM1WKP",
-    "DEXX40361906": "GENODEM1IBB",
-    "DEXX40363433": "GENODEM1HRL",
-    "DEXX40370024": "DEUTDEDB403",
-    "DEXX40370079": "DEUTDE3B403",
-    "DEXX41040018": "COBADEFFXXX",
-    "DEXX41041000": "COBADEFFXXX",
-    "DEXX41050095": "WELADED1HAM",
-    "DEXX41051605": "WELADED1WRN",
-    "DEXX41051845": "WELADED1BGK",
-    "DEXX41061011": "GENODEM1HBH",
-    "DEXX41061903": "GENODEM1BAG",
-    "DEXX41062215": "GENODEM1BO1",
-    "DEXX41070024": "DEUTDEDB410",
-    "DEXX41070049": "DEUTDEDE410",
-    "DEXX41240048": "COBADEFFXXX",
-    "DEXX41250035": "WELADED1BEK",
-    "DEXX41260006": "GENODEM1BEK",
-    "DEXX41261324": "GENODEM1EOW",
-    "DEXX41261419": "GENODEM1OEN",
-    "DEXX41262501": "GENODEM1AHL",
-    "DEXX41280043": "DRESDEFF413",
-    "DEXX41440018": "COBADEFFXXX",
-    "DEXX41450075": "WELADED1SOS",
-    "DEXX41451750": "WELADED1WRL",
-    "DEXX41460116": "GENODEM1SOE",
-    "DEXX41462295": "GENODEM1WRU",
-    "DEXX41650001": "WELADED1LIP",
-    "DEXX41651770": "WELADED1HSL",
-    "DEXX41651815": "WELADED1ERW",
-    "DEXX41651965": "WELADED1GES",
-    "DEXX41652560": "WELADED1WAR",
-    "DEXX41660124": "GENODEM1LPS",
-    "DEXX41661206": "GENODEM1ANR",
-    "DEXX41661504": "GENODEM1LBH",
-    "DEXX41661719": "GENODEM1BRI",
-    "DEXX41662465": "GENODEM1SGE",
-    "DEXX41662557": "GENODEM1WST",
-    "DEXX41663335": "GENODEM1HOE",
-    "DEXX41670024": "DEUTDEDB416",
-    "DEXX41670027": "DEUTDE3B416",
-    "DEXX41670028": "DEUTDE3B417",
-    "DEXX41670029": "DEUTDE3B414",
-    "DEXX41670030": "DEUTDE3B418",
-    "DEXX42030600": "ISBKDEFXGEL",
-    "DEXX42040040": "COBADEFFXXX",
-    "DEXX42050001": "WELADED1GEK",
-    "DEXX42070024": "DEUTDEDB420",
-    "DEXX42070062": "DEUTDEDE420",
-    "DEXX42080082": "DRESDEFF420",
-    "DEXX42260001": "GENODEM1GBU",
-    "DEXX42450040": "WELADED1GLA",
-    "DEXX42451220": "WELADED1BOT",
-    "DEXX42461435": "GENODEM1KIH",
-    "DEXX42640048": "COBADEFFXXX",
-    "DEXX42650150": "WELADED1REK",
-    "DEXX42651315": "WELADED1HAT",
-    "DEXX42661008": "GENODEM1MRL",
-    "DEXX42661088": "GENODEM1MRL",
-    "DEXX42661330": "GENODEM1HLT",
-    "DEXX42661717": "GENODEM1WLW",
-    "DEXX42662320": "GENODEM1DST",
-    "DEXX42680081": "DRESDEFF426",
-    "DEXX42840005": "COBADEFFXXX",
-    "DEXX42850035": "WELADED1BOH",
-    "DEXX42860003": "GENODEM1BOH",
-    "DEXX42861239": "GENODEM1RKN",
-    "DEXX42861387": "GENODEM1BOB",
-    "DEXX42861515": "GENODEM1BOG",
-    "DEXX42861608": "GENODEM1HEI",
-    "DEXX42861814": "GENODEM1RHD",
-    "DEXX42862451": "GENODEM1RAE",
-    "DEXX42870024": "DEUTDEDB428",
-    "DEXX42870077": "DEUTDE3B428",
-    "DEXX43000000": "MARKDEF1430",
-    "DEXX43040036": "COBADEFFXXX",
-    "DEXX43050001": "WELADED1BOC",
-    "DEXX43051040": "WELADED1HTG",
-    "DEXX43060129": "GENODEM1BOC",
-    "DEXX43060967": "GENODEM1GLS",
-    "DEXX43060988": "GENODEM1GLS",
-    "DEXX43070024": "DEUTDEDB430",
-    "DEXX43070061": "DEUTDEDE430",
-    "DEXX43080083": "DRESDEFF430",
-    "DEXX43250030": "WELADED1HRN",
-    "DEXX44000000": "MARKDEF1440",
-    "DEXX44010046": "PBNKDEFFXXX",
-    "DEXX44020090": "HYVEDEMM808",
-    "DEXX44040037": "COBADEFFXXX",
-    "DEXX44040060": "COBADEFFXXX",
-    "DEXX44040061": "COBADEFFXXX",
-    "DEXX44040085": "COBADEFFXXX",
-    "DEXX44050000": "WELADE3DXXX",
-    "DEXX44050199": "DORTDE33XXX",
-    "DEXX44060122": "GENODEM1DNW",
-    "DEXX44060604": "DAAEDED1004",
-    "DEXX44064406": "GENODED1KDD",
-    "DEXX44070024": "DEUTDEDB440",
-    "DEXX44070050": "DEUTDEDE440",
-    "DEXX44080050": "DRESDEFF440",
-    "DEXX44080055": "DRESDEFF446",
-    "DEXX44080057": "DRESDEFF447",
-    "DEXX44080085": "DRESDEFFI69",
-    "DEXX44089320": "DRESDEFFI18",
-    "DEXX44090920": "GENODEF1P04",
-    "DEXX44152370": "WELADED1LUN",
-    "DEXX44152490": "WELADED1SWT",
-    "DEXX44160014": "GENODEM1DOR",
-    "DEXX44340037": "COBADEFFXXX",
-    "DEXX44350060": "WELADED1UNN",
-    "DEXX44351380": "WELADED1KAM",
-    "DEXX44351740": "WELADED1FRN",
-    "DEXX44361342": "GENODEM1KWK",
-    "DEXX44540022": "COBADEFFXXX",
-    "DEXX44550045": "WELADED1ISL",
-    "DEXX44551210": "WELADED1HEM",
-    "DEXX44570004": "DEUTDEDW445",
-    "DEXX44570024": "DEUTDEDB445",
-    "DEXX44580070": "DRESDEFF445",
-    "DEXX44580085": "DRESDEFFI70",
-    "DEXX44750065": "WELADED1MEN",
-    "DEXX44761312": "GENODEM1MEN",
-    "DEXX44761534": "GENODEM1NRD",
-    "DEXX45000000": "MARKDEF1450",
-    "DEXX45040042": "COBADEFFXXX",
-    "DEXX45050001": "WELADE3HXXX",
-    "DEXX45051485": "WELADED1HER",
-    "DEXX45060009": "GENODEM1HGN",
-    "DEXX45061524": "GENODEM1HLH",
-    "DEXX45070002": "DEUTDEDW450",
-    "DEXX45070024": "DEUTDEDB450",
-    "DEXX45080060": "DRESDEFF450",
-    "DEXX45240056": "COBADEFFXXX",
-    "DEXX45250035": "WELADED1WTN",
-    "DEXX45251480": "WELADED1WET",
-    "DEXX45251515": "SPSHDE31XXX",
-    "DEXX45260041": "GENODEM1WTN",
-    "DEXX45260475": "GENODEM1BFG",
-    "DEXX45261547": "GENODEM1SPO",
-    "DEXX45450050": "WELADED1GEV",
-    "DEXX45451060": "WELADED1ENE",
-    "DEXX45451555": "WELADED1SLM",
-    "DEXX45660029": "GENODEM1ALA",
-    "DEXX45840026": "COBADEFFXXX",
-    "DEXX45841031": "COBADEFFXXX",
-    "DEXX45850005": "WELADED1LSD",
-    "DEXX45851020": "WELADED1PLB",
-    "DEXX45851665": "WELADED1KMZ",
-    "DEXX45860033": "GENODEM1LHA",
-    "DEXX45861434": "GENODEM1KIE",
-    "DEXX45861617": "GENODEM1MOM",
-    "DEXX46040033": "COBADEFFXXX",
-    "DEXX46050001": "WELADED1SIE",
-    "DEXX46051240": "WELADED1BUB",
-    "DEXX46051733": "WELADED1FRE",
-    "DEXX46051875": "WELADED1HIL",
-    "DEXX46052855": "WELADED1SMB",
-    "DEXX46053480": "WELADED1BEB",
-    "DEXX46060040": "GENODEM1SNS",
-    "DEXX46061724": "GENODEM1FRF",
-    "DEXX46062817": "GENODEM1SMA",
-    "DEXX46063405": "GENODEM1BB1",
-    "DEXX46070024": "DEUTDEDB460",
-    "DEXX46070090": "DEUTDEDK460",
-    "DEXX46080010": "DRESDEFF460",
-    "DEXX46240016": "COBADEFFXXX",
-    "DEXX46250049": "WELADED1OPE",
-    "DEXX46251590": "WELADED1FTR",
-    "DEXX46251630": "WELADED1ALK",
-    "DEXX46260023": "GENODEM1OLP",
-    "DEXX46261607": "GENODEM1GLG",
-    "DEXX46261822": "GENODEM1WDD",
-    "DEXX46262456": "GENODEM1HUL",
-    "DEXX46441003": "COBADEFFXXX",
-    "DEXX46451012": "WELADED1MES",
-    "DEXX46451250": "WELADED1BST",
-    "DEXX46461126": "GENODEM1SRL",
-    "DEXX46462271": "GENODEM1ANO",
-    "DEXX46464453": "GENODEM1RET",
-    "DEXX46640018": "COBADEFFXXX",
-    "DEXX46650005": "WELADED1ARN",
-    "DEXX46660022": "GENODEM1NEH",
-    "DEXX46670007": "DEUTDEDW466",
-    "DEXX46670024": "DEUTDEDB961",
-    "DEXX47000000": "MARKDEF1470",
-    "DEXX47240047": "COBADEFFXXX",
-    "DEXX47250101": "WELADED1PBN",
-    "DEXX47251550": "WELADED1HXB",
-    "DEXX47251740": "WELADED1DEL",
-    "DEXX47260121": "DGPBDE3MXXX",
-    "DEXX47260234": "GENODEM1EWB",
-    "DEXX47260307": "GENODEM1BKC",
-    "DEXX47261429": "GENODEM1WNH",
-    "DEXX47261603": "GENODEM1BUS",
-    "DEXX47262626": "GENODEM1WDE",
-    "DEXX47262703": "GENODEM1DLB",
-    "DEXX47263472": "GENODEM1WWW",
-    "DEXX47264367": "GENODEM1STM",
-    "DEXX47265383": "GENODEM1WAH",
-    "DEXX47267216": "GENODEM1BOT",
-    "DEXX47270024": "DEUTDEDB472",
-    "DEXX47270029": "DEUTDE3B472",
-    "DEXX47460028": "GENODEM1WBG",
-    "DEXX47640051": "COBADEFFXXX",
-    "DEXX47650130": "WELADE3LXXX",
-    "DEXX47651225": "WELADED1BLO",
-    "DEXX47670023": "DEUTDE3B476",
-    "DEXX47670024": "DEUTDEDB476",
-    "DEXX47691200": "GENODEM1OLB",
-    "DEXX47840065": "COBADEFFXXX",
-    "DEXX47840080": "COBADEFFXXX",
-    "DEXX47850065": "WELADED1GTL",
-    "DEXX47852760": "WELADED1RTG",
-    "DEXX47853355": "WELADED1VSM",
-    "DEXX47853520": "WELADED1WDB",
-    "DEXX47860125": "GENODEM1GTL",
-    "DEXX47861317": "GENODEM1CLL",
-    "DEXX47861518": "GENODEM1HWI",
-    "DEXX47861806": "GENODEM1VKA",
-    "DEXX47862261": "GENODEM1MFD",
-    "DEXX47862447": "GENODEM1RNE",
-    "DEXX47863373": "GENODEM1VMD",
-    "DEXX47880031": "DRESDEFF478",
-    "DEXX48000000": "MARKDEF1480",
-    "DEXX48020086": "HYVEDEMM344",
-    "DEXX48020151": "LAMPDEDDXXX",
-    "DEXX48021900": "DGPBDE3MBVW",
-    "DEXX48040035": "COBADEFFXXX",
-    "DEXX48040060": "COBADEFFXXX",
-    "DEXX48040061": "COBADEFFXXX",
-    "DEXX48050161": "SPBIDE3BXXX",
-    "DEXX48051580": "WELADED1HAW",
-    "DEXX48060036": "GENODEM1BIE",
-    "DEXX48062051": "GENODEM1HLW",
-    "DEXX48062466": "GENODEM1SHS",
-    "DEXX48070020": "DEUTDE3BXXX",
-    "DEXX48070024": "DEUTDEDBBIE",
-    "DEXX48070040": "DEUTDE3B480",
-    "DEXX48070042": "DEUTDE3B484",
-    "DEXX48070043": "DEUTDE3B489",
-    "DEXX48070044": "DEUTDE3B487",
-    "DEXX48070045": "DEUTDE3B413",
-    "DEXX48070050": "DEUTDE3B481",
-    "DEXX48070052": "DEUTDE3B492",
-    "DEXX48080020": "DRESDEFF480",
-    "DEXX48089350": "DRESDEFFI19",
-    "DEXX48250110": "WELADED1LEM",
-    "DEXX48291490": "GENODEM1BSU",
-    "DEXX49040043": "COBADEFFXXX",
-    "DEXX49050101": "WELADED1MIN",
-    "DEXX49051065": "WELADED1RHD",
-    "DEXX49051285": "WELADED1OEH",
-    "DEXX49051990": "WELADED1PWF",
-    "DEXX49060127": "GENODEM1MPW",
-    "DEXX49060392": "GENODEM1MND",
-    "DEXX49061470": "GENODEM1STR",
-    "DEXX49061510": "GENODEM1EPW",
-    "DEXX49070024": "DEUTDEDB490",
-    "DEXX49070028": "DEUTDE3B490",
-    "DEXX49080025": "DRESDEFF491",
-    "DEXX49092650": "GENODEM1LUB",
-    "DEXX49240096": "COBADEFFXXX",
-    "DEXX49262364": "GENODEM1SNA",
-    "DEXX49440043": "COBADEFFXXX",
-    "DEXX49450120": "WLAHDE44XXX",
-    "DEXX49490070": "GENODEM1HFV",
-    "DEXX50000000": "MARKDEF1500",
-    "DEXX50010060": "PBNKDEFFXXX",
-    "DEXX50010111": "ESSEDE5FXXX",
-    "DEXX50010200": "AKBKDEFFXXX",
-    "DEXX50010424": "AARBDE5W500",
-    "DEXX50010517": "INGDDEFFXXX",
-    "DEXX50010700": "DEGUDEFFXXX",
-    "DEXX50010900": "BOFADEFXXXX",
-    "DEXX50010910": "BOFADEFXVAM",
-    "DEXX50012800": "ALTEDEFAXXX",
-    "DEXX50016600": "WUIDDEF1XXX",
-    "DEXX50020000": "SEZDDEF1XXX",
-    "DEXX50020200": "BHFBDEFF500",
-    "DEXX50020300": "BANVDEHB500",
-    "DEXX50020400": "KFWIDEFFXXX",
-    "DEXX50020500": "LAREDEFFXXX",
-    "DEXX50020700": "FBHLDEFFXXX",
-    "DEXX50020800": "BCITDEFFXXX",
-    "DEXX50021000": "INGBDEFFXXX",
-    "DEXX50021100": "FFBKDEFFKRN",
-    "DEXX50021120": "FFBKDEFFTHK",
-    "DEXX50022200": "HCSEDEF1XXX",
-    "DEXX50025000": "GMGGDE51XXX",
-    "DEXX50030000": "PSADDEF1XXX",
-    "DEXX50030010": "BPNDDE52XXX",
-    "DEXX50030100": "HKBBDEF1FRA",
-    "DEXX50030500": "PARBDEFFXXX",
-    "DEXX50030600": "DWPBDEFFXXX",
-    "DEXX50030700": "ESBKDEFFXXX",
-    "DEXX50031000": "TRODDEF1XXX",
-    "DEXX50033300": "SCFBDE33XXX",
-    "DEXX50038800": "ABOCDEFFXXX",
-    "DEXX50040000": "COBADEFFXXX",
-    "DEXX50040005": "COBADEFFXXX",
-    "DEXX50040033": "COBADEF1BRS",
-    "DEXX50040038": "COBADEFFXXX",
-    "DEXX50040040": "COBADEFFXXX",
-    "DEXX50040048": "COBADEFFXXX",
-    "DEXX50040050": "COBADEFFXXX",
-    "DEXX50040051": "COBADEFFXXX",
-    "DEXX50040052": "COBADEFFXXX",
-    "DEXX50040060": "COBADEFFXXX",
-    "DEXX50040061": "COBADEFFXXX",
-    "DEXX50040062": "COBADEFFXXX",
-    "DEXX50040063": "COBADEFFXXX",
-    "DEXX50040075": "COBADEFFXXX",
-    "DEXX50040084": "COBADEFFXXX",
-    "DEXX50040085": "COBADEFFXXX",
-    "DEXX50040086": "COBADEFFXXX",
-    "DEXX50040087": "COBADEFFXXX",
-    "DEXX50040088": "COBADEFFXXX",
-    "DEXX50040099": "COBADEFFXXX",
-    "DEXX50042500": "COBADEFFXXX",
-    "DEXX50044444": "COBADEFFXXX",
-    "DEXX50047010": "COBADEFFXXX",
-    "DEXX50050000": "HELADEFFXXX",
-    "DEXX50050201": "HELADEF1822",
-    "DEXX50050222": "HELADEF1822",
-    "DEXX50050999": "DGZFDEFFXXX",
-    "DEXX50060000": "GENODE55XXX",
-    "DEXX50060400": "GENODEFFXXX",
-    "DEXX50060412": "GENODEF1VK1",
-    "DEXX50060413": "GENODEF1VK2",
-    "DEXX50060414": "GENODEF1VK3",
-    "DEXX50060415": "GENODEF1VK4",
-    "DEXX50060416": "GENODEF1VK6",
-    "DEXX50060417": "GENODEF1VK7",
-    "DEXX50060418": "GENODEF1VK8",
-    "DEXX50060419": "GENODEF1VK9",
-    "DEXX50060420": "GENODEF1V20",
-    "DEXX50060421": "GENODEF1V21",
-    "DEXX50060422": "GENODEF1V22",
-    "DEXX50060423": "GENODEF1V23",
-    "DEXX50060424": "GENODEF1V24",
-    "DEXX50060425": "GENODEF1V25",
-    "DEXX50060474": "GENODEFFBRO",
-    "DEXX50061741": "GENODE51OBU",
-    "DEXX50069126": "GENODE51ABO",
-    "DEXX50069146": "GENODE51GRC",
-    "DEXX50069187": "GENODE51EGE",
-    "DEXX50069241": "GENODE51ERB",
-    "DEXX50069345": "GENODE51GWB",
-    "DEXX50069455": "GENODE51HUT",
-    "DEXX50069477": "GENODE51KIF",
-    "DEXX50069693": "GENODE51BH1",
-    "DEXX50069842": "GENODE51SWB",
-    "DEXX50069976": "GENODE51WWI",
-    "DEXX50070010": "DEUTDEFFXXX",
-    "DEXX50070011": "DEUTDEFFSIP",
-    "DEXX50070024": "DEUTDEDBFRA",
-    "DEXX50073019": "DEUTDEFF502",
-    "DEXX50073024": "DEUTDEDB502",
-    "DEXX50073081": "DEUTDE5XXXX",
-    "DEXX50080000": "DRESDEFFXXX",
-    "DEXX50080015": "DRESDEFFI39",
-    "DEXX50080025": "DRESDEFFXXX",
-    "DEXX50080035": "DRESDEFFI40",
-    "DEXX50080055": "DRESDEFF516",
-    "DEXX50080057": "DRESDEFF522",
-    "DEXX50080060": "DRESDEFFXXX",
-    "DEXX50080061": "DRESDEFFLDG",
-    "DEXX50080077": "DRESDEFFBSP",
-    "DEXX50080079": "DRESDEFFXXX",
-    "DEXX50080080": "DRESDEFFI41",
-    "DEXX50080082": "DRESDEFFAVB",
-    "DEXX50080086": "DRESDEFFI49",
-    "DEXX50080087": "DRESDEFFJ08",
-    "DEXX50080088": "DRESDEFFJ09",
-    "DEXX50080089": "DRESDEFFJ10",
-    "DEXX50080091": "DRESDEFFJ11",
-    "DEXX50080092": "DRESDEFFFCO",
-    "DEXX50080099": "DRESDEFFI42",
-    "DEXX50080300": "DRESDEFF500",
-    "DEXX50083007": "DRESDEFF502",
-    "DEXX50083838": "DRESDEFFMBP",
-    "DEXX50089400": "DRESDEFFI01",
-    "DEXX50090200": "VRDIDEFFXXX",
-    "DEXX50090500": "GENODEF1S12",
-    "DEXX50090607": "DAAEDED1007",
-    "DEXX50090900": "GENODEF1P06",
-    "DEXX50092100": "GENODE51BH2",
-    "DEXX50092200": "GENODE51KEL",
-    "DEXX50092900": "GENODE51USI",
-    "DEXX50093000": "GENODE51RUS",
-    "DEXX50093010": "GENODE51GAA",
-    "DEXX50093400": "GENODE51KBH",
-    "DEXX50110200": "ICBKDEFFXXX",
-    "DEXX50110300": "DVKBDEFFXXX",
-    "DEXX50110400": "AUSKDEFFXXX",
-    "DEXX50110500": "NATXDEFFXXX",
-    "DEXX50110636": "SCBLDEFXXXX",
-    "DEXX50110700": "FBGADEF1XXX",
-    "DEXX50110800": "CHASDEFXXXX",
-    "DEXX50110801": "CHASDEFXVR1",
-    "DEXX50110855": "JPMGDEFFXXX",
-    "DEXX50110900": "MNBIDEF1XXX",
-    "DEXX50120000": "MAIFDEFFXXX",
-    "DEXX50120100": "ICICDEFFXXX",
-    "DEXX50120383": "DELBDE33XXX",
-    "DEXX50120500": "CRESDE55XXX",
-    "DEXX50120600": "COMMDEFFXXX",
-    "DEXX50120900": "TVBADEFFXXX",
-    "DEXX50123400": "DOBADEF1XXX",
-    "DEXX50127000": "BPKODEFFXXX",
-    "DEXX50130000": "NBPADEFFXXX",
-    "DEXX50130200": "SOPPDEFFXXX",
-    "DEXX50130400": "MEFIDEMM501",
-    "DEXX50130600": "UBSWDEFFXXX",
-    "DEXX50131000": "ICBVDEFFXXX",
-    "DEXX50190000": "FFVBDEFFXXX",
-    "DEXX50190300": "GENODE51FHC",
-    "DEXX50190400": "GENODE51FGH",
-    "DEXX50210200": "RABODEFFTAR",
-    "DEXX50210212": "RABODEFFDIR",
-    "DEXX50210295": "RABODEFFXXX",
-    "DEXX50210800": "PRCBDEFFXXX",
-    "DEXX50210900": "CITIDEFFXXX",
-    "DEXX50220085": "SMHBDEFFXXX",
-    "DEXX50220101": "INVODEF2XXX",
-    "DEXX50220300": "HVBKDEFFXXX",
-    "DEXX50220500": "BOFSDEF1XXX",
-    "DEXX50220707": "CAIXDEFFXXX",
-    "DEXX50220900": "HAUKDEFFXXX",
-    "DEXX50230000": "ABCADEFFXXX",
-    "DEXX50230100": "MSPCDEF1XXX",
-    "DEXX50230600": "ISBKDEFXXXX",
-    "DEXX50230700": "METZDEFFXXX",
-    "DEXX50230800": "PLFGDE5AXXX",
-    "DEXX50230888": "PLFGDE5AIKB",
-    "DEXX50234500": "KTAGDEFFXXX",
-    "DEXX50250200": "DLFGDE51XXX",
-    "DEXX50310400": "BARCDEFFXXX",
-    "DEXX50310900": "PCBCDEFFXXX",
-    "DEXX50320000": "OWHBDEFFXXX",
-    "DEXX50320191": "HYVEDEMM430",
-    "DEXX50320500": "BSCHDEFFXXX",
-    "DEXX50320600": "BCMADEFFXXX",
-    "DEXX50320900": "PICTDEFFXXX",
-    "DEXX50324000": "FTSBDEFAXXX",
-    "DEXX50324015": "FTSBDEFAPRO",
-    "DEXX50324040": "FTSBDEFAMYO",
-    "DEXX50330000": "SBINDEFFXXX",
-    "DEXX50330200": "MHBFDEFFXXX",
-    "DEXX50330201": "RAISDEFFXXX",
-    "DEXX50330300": "IRVTDEFXXXX",
-    "DEXX50330500": "BCDMDEF1XXX",
-    "DEXX50330600": "SEPBDEFFXXX",
-    "DEXX50334400": "BNYMDEF1XXX",
-    "DEXX50400000": "MARKDEFFXXX",
-    "DEXX50510300": "SMBCDEFFXXX",
-    "DEXX50520190": "HYVEDEMM467",
-    "DEXX50522222": "FDORDEFFXXX",
-    "DEXX50530000": "GENODE51CRO",
-    "DEXX50540028": "COBADEFFXXX",
-    "DEXX50550020": "HELADEF1OFF",
-    "DEXX50560102": "GENODE51OF2",
-    "DEXX50561315": "GENODE51OBH",
-    "DEXX50570018": "DEUTDEFF505",
-    "DEXX50570024": "DEUTDEDB505",
-    "DEXX50580005": "DRESDEFF505",
-    "DEXX50580085": "DRESDEFFJ12",
-    "DEXX50590000": "GENODE51OF1",
-    "DEXX50592200": "GENODE51DRE",
-    "DEXX50640015": "COBADEFFXXX",
-    "DEXX50650023": "HELADEF1HAN",
-    "DEXX50652124": "HELADEF1SLS",
-    "DEXX50661639": "GENODEF1LSR",
-    "DEXX50661816": "GENODE51NIH",
-    "DEXX50662299": "GENODEF1BKO",
-    "DEXX50662669": "RBMFDEF1XXX",
-    "DEXX50663699": "GENODEF1RDB",
-    "DEXX50670009": "DEUTDEFF506",
-    "DEXX50670024": "DEUTDEDB506",
-    "DEXX50680002": "DRESDEFF506",
-    "DEXX50680085": "DRESDEFFJ13",
-    "DEXX50690000": "GENODEF1HUV",
-    "DEXX50691300": "DZBMDEF1XXX",
-    "DEXX50692100": "GENODE51SEL",
-    "DEXX50740048": "COBADEFFXXX",
-    "DEXX50750094": "HELADEF1GEL",
-    "DEXX50761333": "GENODE51BUE",
-    "DEXX50763319": "GENODEF1BIR",
-    "DEXX50780006": "DRESDEFF524",
-    "DEXX50790000": "GENODE51GEL",
-    "DEXX50793300": "GENODE51BIV",
-    "DEXX50794300": "GENODE51WBH",
-    "DEXX50810900": "BBSPDE6KXXX",
-    "DEXX50820292": "HYVEDEMM487",
-    "DEXX50835800": "MKGMDE51XXX",
-    "DEXX50840005": "COBADEFFXXX",
-    "DEXX50850049": "HELADEFF508",
-    "DEXX50850150": "HELADEF1DAS",
-    "DEXX50851952": "HELADEF1ERB",
-    "DEXX50852553": "HELADEF1GRG",
-    "DEXX50852651": "HELADEF1DIE",
-    "DEXX50861393": "GENODE51BKZ",
-    "DEXX50861501": "GENODE51ABH",
-    "DEXX50862311": "GENODE51WGH",
-    "DEXX50862408": "GENODE51GRI",
-    "DEXX50862703": "GENODE51REI",
-    "DEXX50862835": "GENODE51SHM",
-    "DEXX50862903": "GENODE51GIN",
-    "DEXX50863513": "GENODE51MIC",
-    "DEXX50864322": "GENODE51ORA",
-    "DEXX50865224": "GENODE51MWA",
-    "DEXX50865503": "GENODE51EPT",
-    "DEXX50870005": "DEUTDEFF508",
-    "DEXX50870024": "DEUTDEDB508",
-    "DEXX50880050": "DRESDEFF508",
-    "DEXX50880085": "DRESDEFFJ14",
-    "DEXX50880086": "DRESDEFFJ15",
-    "DEXX50890000": "GENODEF1VBD",
-    "DEXX50890634": "DAAEDED1034",
-    "DEXX50950068": "HELADEF1BEN",
-    "DEXX50951469": "HELADEF1HEP",
-    "DEXX50961206": "GENODE51RBU",
-    "DEXX50961312": "GENODE51GRM",
-    "DEXX50961592": "GENODE51FHO",
-    "DEXX50961685": "GENODE51ABT",
-    "DEXX50970004": "DEUTDEFF509",
-    "DEXX50970024": "DEUTDEDB509",
-    "DEXX51010400": "AARBDE5WXXX",
-    "DEXX51020000": "BHFBDEFF510",
-    "DEXX51020186": "HYVEDEMM478",
-    "DEXX51040038": "COBADEFFXXX",
-    "DEXX51050015": "NASSDE55XXX",
-    "DEXX51051000": "PULSDE5WXXX",
-    "DEXX51070021": "DEUTDEFF510",
-    "DEXX51070024": "DEUTDEDB510",
-    "DEXX51080060": "DRESDEFF510",
-    "DEXX51080085": "DRESDEFFJ16",
-    "DEXX51080086": "DRESDEFFJ17",
-    "DEXX51089410": "DRESDEFFI20",
-    "DEXX51090000": "WIBADE5WXXX",
-    "DEXX51090636": "DAAEDED1036",
-    "DEXX51091500": "GENODE51RGG",
-    "DEXX51091501": "GENODE51RGG",
-    "DEXX51091700": "VRBUDE51XXX",
-    "DEXX51091711": "VRBUDE51XXX",
-    "DEXX51140029": "COBADEFFXXX",
-    "DEXX51150018": "HELADEF1LIM",
-    "DEXX51151919": "HELADEF1WEI",
-    "DEXX51161606": "GENODE51LDD",
-    "DEXX51170010": "DEUTDEFF511",
-    "DEXX51170024": "DEUTDEDB511",
-    "DEXX51180041": "DRESDEFF511",
-    "DEXX51190000": "GENODE51LIM",
-    "DEXX51191200": "GENODE51CAM",
-    "DEXX51191800": "GENODE51SBH",
-    "DEXX51192200": "GENODE51WEM",
-    "DEXX51210600": "BNPADEFFXXX",
-    "DEXX51210606": "BNPADEFFXXX",
-    "DEXX51210699": "BNPADEFFXXX",
-    "DEXX51210700": "NZFMDEF1XXX",
-    "DEXX51210800": "SOGEDEFFXXX",
-    "DEXX51210801": "SOGEDEFFXXX",
-    "DEXX51210802": "SOGEDEFFXXX",
-    "DEXX51211000": "NATXDEFPXXX",
-    "DEXX51220200": "ESSEDEFFXXX",
-    "DEXX51220211": "ESSEDE5F512",
-    "DEXX51220400": "SIHRDEH1FFM",
-    "DEXX51220700": "TCZBDEFFXXX",
-    "DEXX51220800": "BRASDEFFXXX",
-    "DEXX51220900": "MSFFDEFPXXX",
-    "DEXX51220910": "MSFFDEFXCND",
-    "DEXX51230500": "SCBLDEFXXXX",
-    "DEXX51230502": "SCBLDEFXXXX",
-    "DEXX51230555": "PLFGDE5AIKB",
-    "DEXX51230600": "ARABDEFFXXX",
-    "DEXX51230800": "WIREDEMMXXX",
-    "DEXX51230801": "WIREDEMMXXX",
-    "DEXX51230802": "WIREDEMMXXX",
-    "DEXX51230805": "WIREDEMMXXX",
-    "DEXX51250000": "HELADEF1TSK",
-    "DEXX51300000": "MARKDEF1513",
-    "DEXX51340013": "COBADEFFXXX",
-    "DEXX51343224": "COBADEFFXXX",
-    "DEXX51350025": "SKGIDE5FXXX",
-    "DEXX51351526": "HELADEF1GRU",
-    "DEXX51352227": "HELADEF1LAU",
-    "DEXX51361021": "GENODE51HHE",
-    "DEXX51370008": "DEUTDEFF513",
-    "DEXX51370024": "DEUTDEDB513",
-    "DEXX51380040": "DRESDEFF513",
-    "DEXX51380085": "DRESDEFFJ18",
-    "DEXX51390000": "VBMHDE5FXXX",
-    "DEXX51410600": "MELBDEF1XXX",
-    "DEXX51410700": "BKCHDEFFXXX",
-    "DEXX51410800": "BOURDEFFXXX",
-    "DEXX51420200": "MIBEDEFFXXX",
-    "DEXX51420300": "BAERDEF1XXX",
-    "DEXX51420600": "HANDDEFFXXX",
-    "DEXX51430300": "NDEADEFFXXX",
-    "DEXX51430321": "NDEADEFF321",
-    "DEXX51430345": "NDEADEFFDKK",
-    "DEXX51430400": "GOLDDEFFXXX",
-    "DEXX51540037": "COBADEFFXXX",
-    "DEXX51550035": "HELADEF1WET",
-    "DEXX51570008": "DEUTDEFF515",
-    "DEXX51570024": "DEUTDEDB515",
-    "DEXX51580044": "DRESDEFF515",
-    "DEXX51591300": "GENODE51WBO",
-    "DEXX51640043": "COBADEFFXXX",
-    "DEXX51650045": "HELADEF1DIL",
-    "DEXX51690000": "GENODE51DIL",
-    "DEXX51691500": "GENODE51HER",
-    "DEXX51752267": "HELADEF1BAT",
-    "DEXX51762434": "GENODE51BIK",
-    "DEXX51850079": "HELADEF1FRI",
-    "DEXX51861325": "GENODEF1BVB",
-    "DEXX51861403": "GENODE51BUT",
-    "DEXX51861616": "GENODE51REW",
-    "DEXX51861806": "GENODE51OBM",
-    "DEXX51961023": "GENODE51ULR",
-    "DEXX51961515": "GENODE51HSH",
-    "DEXX51961801": "GENODE51FEL",
-    "DEXX51990000": "GENODE51LB1",
-    "DEXX52040021": "COBADEFFXXX",
-    "DEXX52050000": "HELADEFF520",
-    "DEXX52050353": "HELADEF1KAS",
-    "DEXX52051373": "HELADEF1BOR",
-    "DEXX52051555": "HELADEF1FEL",
-    "DEXX52051877": "HELADEF1GRE",
-    "DEXX52052154": "HELADEF1MEG",
-    "DEXX52053458": "HELADEF1SWA",
-    "DEXX52060000": "GENODEFF520",
-    "DEXX52060208": "GENODEF1KS2",
-    "DEXX52060410": "GENODEF1EK1",
-    "DEXX52061303": "GENODEF1BOR",
-    "DEXX52062200": "GENODEF1GUB",
-    "DEXX52062601": "GENODEF1HRV",
-    "DEXX52063369": "GENODEF1SPB",
-    "DEXX52063550": "GENODEF1WOH",
-    "DEXX52064156": "GENODEF1BTA",
-    "DEXX52065220": "GENODEF1CAL",
-    "DEXX52069013": "GENODEF1BHN",
-    "DEXX52069029": "GENODEF1GMD",
-    "DEXX52069065": "GENODEF1BUR",
-    "DEXX52069103": "GENODEF1TBG",
-    "DEXX52069149": "GENODEF1VLM",
-    "DEXX52069519": "GENODEF1FBK",
-    "DEXX52070012": "DEUTDEFF520",
-    "DEXX52070024": "DEUTDEDB520",
-    "DEXX52071212": "DEUTDEFF521",
-    "DEXX52071224": "DEUTDEDB521",
-    "DEXX52080080": "DRESDEFF520",
-    "DEXX52080085": "DRESDEFFJ19",
-    "DEXX52090000": "GENODE51KS1",
-    "DEXX52090611": "DAAEDED1011",
-    "DEXX52240006": "COBADEFFXXX",
-    "DEXX52250030": "HELADEF1ESW",
-    "DEXX52260385": "GENODEF1ESW",
-    "DEXX52270012": "DEUTDEFF522",
-    "DEXX52270024": "DEUTDEDB522",
-    "DEXX52350005": "HELADEF1KOR",
-    "DEXX52360059": "GENODEF1KBW",
-    "DEXX52410300": "RBAGDEF1XXX",
-    "DEXX52410310": "RBAGDEF1CMI",
-    "DEXX52410400": "KOEXDEFAXXX",
-    "DEXX52411000": "CAGBDEF1XXX",
-    "DEXX52411010": "CAGBDEF1CMI",
-    "DEXX52420000": "BSUIDEFFXXX",
-    "DEXX52420300": "SHBKDEFFXXX",
-    "DEXX52420600": "ABGRDEFFXXX",
-    "DEXX52420700": "SECGDEFFXXX",
-    "DEXX52430000": "CMCIDEF1XXX",
-    "DEXX53040012": "COBADEFFXXX",
-    "DEXX53050180": "HELADEF1FDS",
-    "DEXX53051396": "HELADEF1SLU",
-    "DEXX53060180": "GENODE51FUL",
-    "DEXX53061230": "GENODEF1HUE",
-    "DEXX53061313": "GENODE51SLU",
-    "DEXX53062035": "GENODEF1GLU",
-    "DEXX53062350": "GENODEF1PBG",
-    "DEXX53064023": "GENODEF1FLN",
-    "DEXX53070007": "DEUTDEFF530",
-    "DEXX53070024": "DEUTDEDB530",
-    "DEXX53080030": "DRESDEFF530",
-    "DEXX53093200": "GENODE51ALS",
-    "DEXX53093255": "GENODE51AGR",
-    "DEXX53240048": "COBADEFFXXX",
-    "DEXX53250000": "HELADEF1HER",
-    "DEXX53260145": "GENODEF1HFA",
-    "DEXX53261202": "GENODEF1BEB",
-    "DEXX53261342": "GENODEF1RAW",
-    "DEXX53262073": "GENODEF1HNT",
-    "DEXX53262455": "GENODEF1ROH",
-    "DEXX53270012": "DEUTDEFF532",
-    "DEXX53270024": "DEUTDEDB518",
-    "DEXX53280081": "DRESDEFF532",
-    "DEXX53290000": "GENODE51BHE",
-    "DEXX53340024": "COBADEFFXXX",
-    "DEXX53350000": "HELADEF1MAR",
-    "DEXX53361724": "GENODEF1EBG",
-    "DEXX53370008": "DEUTDEFF533",
-    "DEXX53370024": "DEUTDEDB533",
-    "DEXX53380042": "DRESDEFF533",
-    "DEXX53381843": "DRESDEFF568",
-    "DEXX53390635": "DAAEDED1035",
-    "DEXX54020090": "HYVEDEMM482",
-    "DEXX54030011": "SCRUDE51XXX",
-    "DEXX54040042": "COBADEFFXXX",
-    "DEXX54050110": "MALADE51KLS",
-    "DEXX54050220": "MALADE51KLK",
-    "DEXX54051550": "MALADE51KUS",
-    "DEXX54051660": "MALADE51LAS",
-    "DEXX54051990": "MALADE51ROK",
-    "DEXX54061650": "GENODE61LAN",
-    "DEXX54062027": "GENODE61ALB",
-    "DEXX54070024": "DEUTDEDB540",
-    "DEXX54070092": "DEUTDESM540",
-    "DEXX54080021": "DRESDEFF540",
-    "DEXX54090000": "GENODE61KL1",
-    "DEXX54091700": "GENODE61LEK",
-    "DEXX54091800": "GENODE61OB1",
-    "DEXX54092400": "GENODE61GLM",
-    "DEXX54220091": "HYVEDEMM485",
-    "DEXX54240032": "COBADEFFXXX",
-    "DEXX54250010": "MALADE51SWP",
-    "DEXX54261700": "GENODE61ROA",
-    "DEXX54270024": "DEUTDEDB542",
-    "DEXX54270096": "DEUTDESM542",
-    "DEXX54280023": "DRESDEFF542",
-    "DEXX54290000": "GENODE61PS1",
-    "DEXX54291200": "GENODE61DAH",
-    "DEXX54500000": "MARKDEF1545",
-    "DEXX54510067": "PBNKDEFFXXX",
-    "DEXX54520194": "HYVEDEMM483",
-    "DEXX54540033": "COBADEFFXXX",
-    "DEXX54550010": "LUHSDE6AXXX",
-    "DEXX54550120": "MALADE51LUH",
-    "DEXX54561310": "GENODE61LBS",
-    "DEXX54570024": "DEUTDEDB545",
-    "DEXX54570094": "DEUTDESM545",
-    "DEXX54580020": "DRESDEFF545",
-    "DEXX54620093": "HYVEDEMM620",
-    "DEXX54640035": "COBADEFFXXX",
-    "DEXX54651240": "MALADE51DKH",
-    "DEXX54661800": "GENODE61FSH",
-    "DEXX54663270": "GENODE61FHR",
-    "DEXX54670024": "DEUTDEDB546",
-    "DEXX54670095": "DEUTDESM546",
-    "DEXX54680022": "DRESDEFF546",
-    "DEXX54690623": "DAAEDED1023",
-    "DEXX54691200": "GENODE61DUW",
-    "DEXX54750010": "MALADE51SPY",
-    "DEXX54790000": "GENODE61SPE",
-    "DEXX54850010": "SOLADES1SUW",
-    "DEXX54851440": "MALADE51KAD",
-    "DEXX54861190": "GENODE61EDH",
-    "DEXX54862390": "GENODE61HXH",
-    "DEXX54862500": "GENODE61SUW",
-    "DEXX54891300": "GENODE61BZA",
-    "DEXX55000000": "MARKDEF1550",
-    "DEXX55010400": "AARBDE5WDOM",
-    "DEXX55010424": "AARBDE5W550",
-    "DEXX55010625": "AARBDE5WCLE",
-    "DEXX55010800": "ISBRDE55XXX",
-    "DEXX55020000": "BHFBDEFF550",
-    "DEXX55020100": "BKMZDE51XXX",
-    "DEXX55020486": "HYVEDEMM486",
-    "DEXX55020500": "BFSWDE33MNZ",
-    "DEXX55020555": "BFSWDE33MNZ",
-    "DEXX55020600": "IMMODE5MXXX",
-    "DEXX55020700": "SUFGDE51XXX",
-    "DEXX55030500": "CPLADE55XXX",
-    "DEXX55033300": "SCFBDE33XXX",
-    "DEXX55040022": "COBADEFFXXX",
-    "DEXX55040060": "COBADEFFXXX",
-    "DEXX55040061": "COBADEFFXXX",
-    "DEXX55050000": "SOLADEST550",
-    "DEXX55050120": "MALADE51MNZ",
-    "DEXX55060321": "GENODE51MZ4",
-    "DEXX55060417": "GENODE51MZ2",
-    "DEXX55060611": "GENODE51MZ6",
-    "DEXX55060831": "DAAEDED1031",
-    "DEXX55061303": "GENODE51BUD",
-    "DEXX55061507": "GENODE51HDS",
-    "DEXX55061907": "GENODE51NIS",
-    "DEXX55070024": "DEUTDEDBMAI",
-    "DEXX55070040": "DEUTDE5MXXX",
-    "DEXX55080044": "COBADEFFXXX",
-    "DEXX55080065": "DRESDEFF550",
-    "DEXX55080085": "DRESDEFFJ20",
-    "DEXX55080086": "DRESDEFFJ21",
-    "DEXX55080088": "DRESDEFF555",
-    "DEXX55090500": "GENODEF1S01",
-    "DEXX55091200": "GENODE61AZY",
-    "DEXX55150098": "MALADE51EMZ",
-    "DEXX55160195": "GENODED1PA4",
-    "DEXX55190000": "MVBMDE55XXX",
-    "DEXX55190028": "MVBMDE51028",
-    "DEXX55190050": "MVBMDE51050",
-    "DEXX55190064": "MVBMDE51064",
-    "DEXX55190065": "MVBMDE51065",
-    "DEXX55190068": "MVBMDE51068",
-    "DEXX55190088": "MVBMDE51088",
-    "DEXX55190094": "MVBMDE51094",
-    "DEXX55340041": "COBADEFFXXX",
-    "DEXX55350010": "MALADE51WOR",
-    "DEXX55361202": "GENODE51AHM",
-    "DEXX55362071": "GENODE51BEC",
-    "DEXX55390000": "GENODE61WO1",
-    "DEXX56020086": "HYVEDEMM515",
-    "DEXX56050180": "MALADE51KRE",
-    "DEXX56051790": "MALADE51SIM",
-    "DEXX56061151": "GENODED1KSL",
-    "DEXX56061472": "GENODED1KHK",
-    "DEXX56062227": "GENODED1RBO",
-    "DEXX56070024": "DEUTDEDB560",
-    "DEXX56070040": "DEUTDE5M560",
-    "DEXX56090000": "GENODE51KRE",
-    "DEXX56240050": "COBADEFFXXX",
-    "DEXX56250030": "BILADE55XXX",
-    "DEXX56261735": "GENODED1FIN",
-    "DEXX56270024": "DEUTDEDB562",
-    "DEXX56270044": "DEUTDE5M562",
-    "DEXX56290000": "GENODE51IDO",
-    "DEXX57000000": "MARKDEF1570",
-    "DEXX57020086": "HYVEDEMM401",
-    "DEXX57020301": "MKBKDE51XXX",
-    "DEXX57020500": "OYAKDE5KXXX",
-    "DEXX57020600": "DEBKDE51XXX",
-    "DEXX57040044": "COBADEFFXXX",
-    "DEXX57050120": "MALADE51KOB",
-    "DEXX57051001": "MALADE51BMB",
-    "DEXX57051870": "MALADE51COC",
-    "DEXX57060000": "GENODEDD570",
-    "DEXX57060612": "DAAEDED1012",
-    "DEXX57062675": "GENODE51NWA",
-    "DEXX57064221": "GENODED1MKA",
-    "DEXX57069067": "GENODED1LUH",
-    "DEXX57069081": "GENODED1MOK",
-    "DEXX57069144": "GENODED1KAI",
-    "DEXX57069238": "GENODED1ASN",
-    "DEXX57069257": "GENODED1UMO",
-    "DEXX57069315": "GENODED1SRH",
-    "DEXX57069361": "GENODED1WLG",
-    "DEXX57069727": "GENODED1IRR",
-    "DEXX57069806": "GENODED1MBA",
-    "DEXX57070024": "DEUTDEDB570",
-    "DEXX57070045": "DEUTDE5M570",
-    "DEXX57080070": "DRESDEFF570",
-    "DEXX57090000": "GENODE51KOB",
-    "DEXX57090010": "GENODE51KOB",
-    "DEXX57090900": "GENODEF1P12",
-    "DEXX57091000": "GENODE51MON",
-    "DEXX57091100": "GENODE51HGR",
-    "DEXX57092800": "GENODE51DIE",
-    "DEXX57263015": "GENODE51ARZ",
-    "DEXX57351030": "MALADE51AKI",
-    "DEXX57361476": "GENODED1GBS",
-    "DEXX57363243": "GENODED1NFB",
-    "DEXX57391200": "GENODE51DAA",
-    "DEXX57391500": "GENODE51HAM",
-    "DEXX57391800": "GENODE51WW1",
-    "DEXX57450120": "MALADE51NWD",
-    "DEXX57460117": "GENODED1NWD",
-    "DEXX57461759": "GENODED1MRW",
-    "DEXX57470024": "DEUTDEDB574",
-    "DEXX57470047": "DEUTDE5M574",
-    "DEXX57650010": "MALADE51MYN",
-    "DEXX57661253": "GENODED1KEH",
-    "DEXX57662263": "GENODED1MPO",
-    "DEXX57751310": "MALADE51AHR",
-    "DEXX57761591": "GENODED1BNA",
-    "DEXX57761599": "GENODED1BNA",
-    "DEXX57762265": "GENODED1GRO",
-    "DEXX58520086": "HYVEDEMM437",
-    "DEXX58540035": "COBADEFFXXX",
-    "DEXX58550130": "TRISDE55XXX",
-    "DEXX58560103": "GENODED1TVB",
-    "DEXX58560294": "GENODED1PA3",
-    "DEXX58561626": "GENODED1SRB",
-    "DEXX58561771": "GENODED1MLW",
-    "DEXX58564788": "GENODED1HWM",
-    "DEXX58570024": "DEUTDEDB585",
-    "DEXX58570048": "DEUTDE5M585",
-    "DEXX58580074": "DRESDEFF585",
-    "DEXX58590900": "GENODEF1P21",
-    "DEXX58650030": "MALADE51BIT",
-    "DEXX58651240": "MALADE51DAU",
-    "DEXX58660101": "GENODED1BIT",
-    "DEXX58661901": "GENODED1WSC",
-    "DEXX58662653": "GENODED1OSE",
-    "DEXX58668818": "GENODED1NBL",
-    "DEXX58691500": "GENODED1PRU",
-    "DEXX58751230": "MALADE51BKS",
-    "DEXX58760954": "GENODED1WTL",
-    "DEXX58761343": "GENODED1BPU",
-    "DEXX58771224": "DEUTDEDB587",
-    "DEXX58771242": "DEUTDE5M587",
-    "DEXX59000000": "MARKDEF1590",
-    "DEXX59010011": "PBNKDEFFXXX",
-    "DEXX59010012": "PBNKDEFFXXX",
-    "DEXX59010013": "PBNKDEFFXXX",
-    "DEXX59010014": "PBNKDEFFXXX",
-    "DEXX59010015": "PBNKDEFF015",
-    "DEXX59010016": "PBNKDEFFXXX",
-    "DEXX59010017": "PBNKDEFF017",
-    "DEXX59010018": "PBNKDEFFXXX",
-    "DEXX59010019": "PBNKDEFF019",
-    "DEXX59010021": "PBNKDEFF021",
-    "DEXX59010022": "PBNKDEFF022",
-    "DEXX59010023": "PBNKDEFF023",
-    "DEXX59010024": "PBNKDEFFXXX",
-    "DEXX59010025": "PBNKDEFF025",
-    "DEXX59010026": "PBNKDEFFXXX",
-    "DEXX59010027": "PBNKDEFFXXX",
-    "DEXX59010028": "PBNKDEFFXXX",
-    "DEXX59010029": "PBNKDEFFXXX",
-    "DEXX59010031": "PBNKDEFFXXX",
-    "DEXX59010032": "PBNKDEFF032",
-    "DEXX59010033": "PBNKDEFF033",
-    "DEXX59010034": "PBNKDEFFXXX",
-    "DEXX59010035": "PBNKDEFFXXX",
-    "DEXX59010036": "PBNKDEFFXXX",
-    "DEXX59010037": "PBNKDEFF037",
-    "DEXX59010038": "PBNKDEFFXXX",
-    "DEXX59010039": "PBNKDEFF039",
-    "DEXX59010040": "PBNKDEFFXXX",
-    "DEXX59010041": "PBNKDEFFXXX",
-    "DEXX59010042": "PBNKDEFF042",
-    "DEXX59010044": "PBNKDEFF044",
-    "DEXX59010045": "PBNKDEFFXXX",
-    "DEXX59010047": "PBNKDEFF047",
-    "DEXX59010048": "PBNKDEFFXXX",
-    "DEXX59010049": "PBNKDEFF049",
-    "DEXX59010051": "PBNKDEFFXXX",
-    "DEXX59010052": "PBNKDEFFXXX",
-    "DEXX59010053": "PBNKDEFF053",
-    "DEXX59010054": "PBNKDEFFXXX",
-    "DEXX59010055": "PBNKDEFFXXX",
-    "DEXX59010056": "PBNKDEFFXXX",
-    "DEXX59010057": "PBNKDEFFXXX",
-    "DEXX59010058": "PBNKDEFFXXX",
-    "DEXX59010059": "PBNKDEFFXXX",
-    "DEXX59010061": "PBNKDEFFXXX",
-    "DEXX59010062": "PBNKDEFFXXX",
-    "DEXX59010063": "PBNKDEFFXXX",
-    "DEXX59010064": "PBNKDEFFXXX",
-    "DEXX59010065": "PBNKDEFFXXX",
-    "DEXX59010066": "PBNKDEFFXXX",
-    "DEXX59010068": "PBNKDEFFXXX",
-    "DEXX59010069": "PBNKDEFFXXX",
-    "DEXX59010071": "PBNKDEFFXXX",
-    "DEXX59010072": "PBNKDEFFXXX",
-    "DEXX59010073": "PBNKDEFFXXX",
-    "DEXX59010074": "PBNKDEFFXXX",
-    "DEXX59010400": "SIKBDE55XXX",
-    "DEXX59020090": "HYVEDEMM432",
-    "DEXX59020400": "MEGHDE81XXX",
-    "DEXX59040000": "COBADEFFXXX",
-    "DEXX59050000": "SALADE55XXX",
-    "DEXX59050101": "SAKSDE55XXX",
-    "DEXX59051090": "SALADE51VKS",
-    "DEXX59070000": "DEUTDE5M555",
-    "DEXX59070070": "DEUTDEDB595",
-    "DEXX59080090": "DRESDEFF590",
-    "DEXX59090626": "DAAEDED1026",
-    "DEXX59090900": "GENODEF1P19",
-    "DEXX59092000": "GENODE51SB2",
-    "DEXX59099550": "GENODE51NOH",
-    "DEXX59190000": "SABADE5SXXX",
-    "DEXX59190200": "GENODE51SLS",
-    "DEXX59251020": "SALADE51WND",
-    "DEXX59252046": "SALADE51NKS",
-    "DEXX59291000": "GENODE51WEN",
-    "DEXX59291200": "GENODE51BEX",
-    "DEXX59320087": "HYVEDEMM838",
-    "DEXX59350110": "KRSADE55XXX",
-    "DEXX59351040": "MERZDE55XXX",
-    "DEXX59390100": "GENODE51SLF",
-    "DEXX59391200": "GENODE51UBH",
-    "DEXX59392000": "GENODE51DSA",
-    "DEXX59392200": "GENODE51LOS",
-    "DEXX59393000": "GENODE51LEB",
-    "DEXX59450010": "SALADE51HOM",
-    "DEXX59491300": "GENODE51MBT",
-    "DEXX60000000": "MARKDEF1600",
-    "DEXX60010070": "PBNKDEFFXXX",
-    "DEXX60010111": "ESSEDE5F600",
-    "DEXX60010424": "AARBDE5W600",
-    "DEXX60010700": "LKBWDE6K600",
-    "DEXX60020030": "SOLADEST601",
-    "DEXX60020100": "SCHWDESSXXX",
-    "DEXX60020290": "HYVEDEMM473",
-    "DEXX60020300": "VONEDE33STG",
-    "DEXX60030000": "MEBEDE6SDCB",
-    "DEXX60030100": "BHBADES1XXX",
-    "DEXX60030200": "ELGEDES1XXX",
-    "DEXX60030600": "CPLUDES1XXX",
-    "DEXX60030666": "CPLUDES1666",
-    "DEXX60030700": "AKBADES1XXX",
-    "DEXX60030900": "ISBKDEFXSTU",
-    "DEXX60031000": "TRUFDE66XXX",
-    "DEXX60033000": "BSWLDE61XXX",
-    "DEXX60035810": "IBKBDES1XXX",
-    "DEXX60040060": "COBADEFFXXX",
-    "DEXX60040061": "COBADEFFXXX",
-    "DEXX60040071": "COBADEFFXXX",
-    "DEXX60040075": "COBADEFFXXX",
-    "DEXX60050000": "SOLADESTXXX",
-    "DEXX60050101": "SOLADEST600",
-    "DEXX60060000": "GENODESGXXX",
-    "DEXX60060202": "GENODESTXXX",
-    "DEXX60060396": "GENODES1UTV",
-    "DEXX60062775": "GENODES1ECH",
-    "DEXX60062909": "GENODES1MCH",
-    "DEXX60069017": "GENODES1DMS",
-    "DEXX60069066": "GENODES1RBA",
-    "DEXX60069075": "GENODES1RVG",
-    "DEXX60069147": "GENODES1RSF",
-    "DEXX60069158": "GENODES1SAA",
-    "DEXX60069206": "GENODES1AID",
-    "DEXX60069224": "GENODES1GWS",
-    "DEXX60069239": "GENODES1BPF",
-    "DEXX60069242": "GENODES1RGR",
-    "DEXX60069245": "GENODES1RVG",
-    "DEXX60069251": "GENODES1RDI",
-    "DEXX60069302": "GENODES1ERM",
-    "DEXX60069303": "GENODES1RBS",
-    "DEXX60069308": "GENODES1RIN",
-    "DEXX60069315": "GENODES1MDH",
-    "DEXX60069336": "GENODES1RMA",
-    "DEXX60069343": "GENODES1RRI",
-    "DEXX60069346": "GENODES1REH",
-    "DEXX60069350": "GENODES1RRG",
-    "DEXX60069355": "GENODES1EHN",
-    "DEXX60069378": "GENODES1DEH",
-    "DEXX60069387": "GENODES1DBE",
-    "DEXX60069417": "GENODES1KIB",
-    "DEXX60069419": "GENODES1UHL",
-    "DEXX60069420": "GENODES1MBI",
-    "DEXX60069431": "GENODES1OED",
-    "DEXX60069442": "GENODES1RFS",
-    "DEXX60069455": "GENODES1RVS",
-    "DEXX60069457": "GENODES1OTT",
-    "DEXX60069461": "GENODES1RRE",
-    "DEXX60069462": "GENODES1WBB",
-    "DEXX60069463": "GENODES1RKH",
-    "DEXX60069476": "GENODES1DEA",
-    "DEXX60069485": "GENODES1ROW",
-    "DEXX60069505": "GENODES1VMT",
-    "DEXX60069517": "GENODES1SCA",
-    "DEXX60069527": "GENODES1RNS",
-    "DEXX60069538": "GENODES1LOC",
-    "DEXX60069544": "GENODES1RWN",
-    "DEXX60069545": "GENODES1NUF",
-    "DEXX60069553": "GENODES1HAR",
-    "DEXX60069564": "GENODES1RVA",
-    "DEXX60069595": "GENODES1SBB",
-    "DEXX60069639": "GENODES1RIH",
-    "DEXX60069648": "GENODES1EHZ",
-    "DEXX60069669": "GENODES1EHB",
-    "DEXX60069673": "GENODES1ABR",
-    "DEXX60069680": "GENODES1BRZ",
-    "DEXX60069685": "GENODES1RWA",
-    "DEXX60069705": "GENODES1SLA",
-    "DEXX60069706": "GENODES1MEH",
-    "DEXX60069710": "GENODES1RGF",
-    "DEXX60069714": "GENODES1IBR",
-    "DEXX60069727": "GENODES1ROF",
-    "DEXX60069738": "GENODES1FAN",
-    "DEXX60069766": "GENODES1BBO",
-    "DEXX60069795": "GENODES1HHB",
-    "DEXX60069798": "GENODES1RHB",
-    "DEXX60069817": "GENODES1RMO",
-    "DEXX60069832": "GENODES1URB",
-    "DEXX60069842": "GENODES1DHB",
-    "DEXX60069858": "GENODES1VAI",
-    "DEXX60069860": "GENODES1FED",
-    "DEXX60069876": "GENODES1ROG",
-    "DEXX60069896": "GENODES1PLE",
-    "DEXX60069904": "GENODES1RUW",
-    "DEXX60069905": "GENODES1REM",
-    "DEXX60069911": "GENODES1ERL",
-    "DEXX60069926": "GENODES1VBG",
-    "DEXX60069927": "GENODES1BHB",
-    "DEXX60069931": "GENODES1BGH",
-    "DEXX60069950": "GENODES1TUN",
-    "DEXX60069976": "GENODES1BOE",
-    "DEXX60069980": "GENODES1RMH",
-    "DEXX60070024": "DEUTDEDBSTG",
-    "DEXX60070070": "DEUTDESSXXX",
-    "DEXX60080000": "DRESDEFF600",
-    "DEXX60080055": "DRESDEFF608",
-    "DEXX60080057": "DRESDEFF609",
-    "DEXX60080085": "DRESDEFFI50",
-    "DEXX60080086": "DRESDEFFI54",
-    "DEXX60080087": "DRESDEFFI57",
-    "DEXX60080088": "DRESDEFFI58",
-    "DEXX60089450": "DRESDEFFI21",
-    "DEXX60090100": "VOBADESSXXX",
-    "DEXX60090133": "VOBADESSXXX",
-    "DEXX60090300": "GENODES1ZUF",
-    "DEXX60090609": "DAAEDED1009",
-    "DEXX60090700": "SWBSDESSXXX",
-    "DEXX60090800": "GENODEF1S02",
-    "DEXX60090900": "GENODEF1P20",
-    "DEXX60120200": "BHFBDEFF600",
-    "DEXX60120500": "BFSWDE33STG",
-    "DEXX60133300": "SCFBDE33XXX",
-    "DEXX60241074": "COBADEFFXXX",
-    "DEXX60250010": "SOLADES1WBN",
-    "DEXX60261329": "GENODES1FBB",
-    "DEXX60261622": "GENODES1WNS",
-    "DEXX60261818": "GENODES1RWT",
-    "DEXX60262063": "GENODES1KOR",
-    "DEXX60262693": "GENODES1KRN",
-    "DEXX60270024": "DEUTDEDB606",
-    "DEXX60270073": "DEUTDESS606",
-    "DEXX60290110": "GENODES1VWN",
-    "DEXX60291120": "GENODES1VBK",
-    "DEXX60320291": "HYVEDEMM858",
-    "DEXX60340071": "COBADEFFXXX",
-    "DEXX60350130": "BBKRDE6BXXX",
-    "DEXX60361923": "GENODES1WES",
-    "DEXX60380002": "DRESDEFF601",
-    "DEXX60390000": "GENODES1BBV",
-    "DEXX60390300": "GENODES1LEO",
-    "DEXX60391310": "GENODES1VBH",
-    "DEXX60391420": "GENODES1MAG",
-    "DEXX60410600": "WUEHDE61XXX",
-    "DEXX60420000": "WBAGDE61XXX",
-    "DEXX60420020": "WBAGDEA1XXX",
-    "DEXX60420021": "WBAGDEA1XXX",
-    "DEXX60420186": "HYVEDEMM860",
-    "DEXX60422000": "SABUDES1XXX",
-    "DEXX60440073": "COBADEFFXXX",
-    "DEXX60450050": "SOLADES1LBG",
-    "DEXX60460142": "GENODES1EGL",
-    "DEXX60462808": "GENODES1AMT",
-    "DEXX60470024": "DEUTDEDB604",
-    "DEXX60470082": "DEUTDESS604",
-    "DEXX60480008": "DRESDEFF604",
-    "DEXX60490150": "GENODES1LBG",
-    "DEXX60491430": "GENODES1VBB",
-    "DEXX60661906": "GENODES1WIM",
-    "DEXX60663084": "GENODES1RCW",
-    "DEXX60670024": "DEUTDEDB659",
-    "DEXX60670070": "DEUTDESS659",
-    "DEXX61030000": "MARBDE6GXXX",
-    "DEXX61040014": "COBADEFFXXX",
-    "DEXX61050000": "GOPSDE6GXXX",
-    "DEXX61060500": "GENODES1VGP",
-    "DEXX61070024": "DEUTDEDB610",
-    "DEXX61070078": "DEUTDESS610",
-    "DEXX61080006": "DRESDEFF610",
-    "DEXX61091200": "GENODES1DGG",
-    "DEXX61120286": "HYVEDEMM859",
-    "DEXX61140071": "COBADEFFXXX",
-    "DEXX61150020": "ESSLDE66XXX",
-    "DEXX61161696": "GENODES1NHB",
-    "DEXX61170024": "DEUTDEDB611",
-    "DEXX61170076": "DEUTDESS611",
-    "DEXX61180004": "DRESDEFF611",
-    "DEXX61190110": "GENODES1ESS",
-    "DEXX61191310": "GENODES1VBP",
-    "DEXX61240048": "COBADEFFXXX",
-    "DEXX61261213": "GENODES1TEC",
-    "DEXX61261339": "GENODES1HON",
-    "DEXX61262258": "GENODES1WLF",
-    "DEXX61262345": "GENODES1BBF",
-    "DEXX61281007": "DRESDEFF612",
-    "DEXX61290120": "GENODES1NUE",
-    "DEXX61340079": "COBADEFFXXX",
-    "DEXX61361722": "GENODES1HEU",
-    "DEXX61361975": "GENODES1RML",
-    "DEXX61370024": "DEUTDEDB613",
-    "DEXX61370086": "DEUTDESS613",
-    "DEXX61390140": "GENODES1VGD",
-    "DEXX61391410": "GENODES1WEL",
-    "DEXX61420086": "HYVEDEMM272",
-    "DEXX61440086": "COBADEFFXXX",
-    "DEXX61450050": "OASPDE6AXXX",
-    "DEXX61480001": "DRESDEFF614",
-    "DEXX61490150": "GENODES1AAV",
-    "DEXX61491010": "GENODES1ELL",
-    "DEXX62020000": "HOEBDE61XXX",
-    "DEXX62020100": "FBHNDE61XXX",
-    "DEXX62040060": "COBADEFFXXX",
-    "DEXX62050000": "HEISDE66XXX",
-    "DEXX62061991": "GENODES1VOS",
-    "DEXX62062215": "GENODES1BIA",
-    "DEXX62062643": "GENODES1VFT",
-    "DEXX62063263": "GENODES1VLS",
-    "DEXX62070024": "DEUTDEDB620",
-    "DEXX62070081": "DEUTDESS620",
-    "DEXX62080012": "DRESDEFF620",
-    "DEXX62090100": "GENODES1VHN",
-    "DEXX62091400": "GENODES1VBR",
-    "DEXX62091600": "GENODES1VMN",
-    "DEXX62091800": "GENODES1VHL",
-    "DEXX62220000": "BSHHDE61XXX",
-    "DEXX62240048": "COBADEFFXXX",
-    "DEXX62250030": "SOLADES1SHA",
-    "DEXX62251550": "SOLADES1KUN",
-    "DEXX62280012": "DRESDEFF622",
-    "DEXX62290110": "GENODES1SHA",
-    "DEXX62291020": "GENODES1CRV",
-    "DEXX62391420": "GENODES1VVT",
-    "DEXX63000000": "MARKDEF1630",
-    "DEXX63020086": "HYVEDEMM461",
-    "DEXX63040053": "COBADEFFXXX",
-    "DEXX63050000": "SOLADES1ULM",
-    "DEXX63061486": "GENODES1LBK",
-    "DEXX63070024": "DEUTDEDB630",
-    "DEXX63070088": "DEUTDESS630",
-    "DEXX63080015": "DRESDEFF630",
-    "DEXX63080085": "DRESDEFFI59",
-    "DEXX63090100": "ULMVDE66XXX",
-    "DEXX63091010": "GENODES1EHI",
-    "DEXX63091200": "GENODES1BLA",
-    "DEXX63091300": "GENODES1LAI",
-    "DEXX63220090": "HYVEDEMM271",
-    "DEXX63240016": "COBADEFFXXX",
-    "DEXX63250030": "SOLADES1HDH",
-    "DEXX63290110": "GENODES1HDH",
-    "DEXX64000000": "MARKDEF1640",
-    "DEXX64020186": "HYVEDEMM374",
-    "DEXX64040033": "COBADEFFXXX",
-    "DEXX64040045": "COBADEFFXXX",
-    "DEXX64050000": "SOLADES1REU",
-    "DEXX64061854": "GENODES1STW",
-    "DEXX64070024": "DEUTDEDB640",
-    "DEXX64070085": "DEUTDESS640",
-    "DEXX64080014": "DRESDEFF640",
-    "DEXX64090100": "VBRTDE6RXXX",
-    "DEXX64091200": "GENODES1MTZ",
-    "DEXX64091300": "GENODES1MUN",
-    "DEXX64140036": "COBADEFFXXX",
-    "DEXX64150020": "SOLADES1TUB",
-    "DEXX64161397": "GENODES1AMM",
-    "DEXX64161608": "GENODES1RHK",
-    "DEXX64161956": "GENODES1VMO",
-    "DEXX64163225": "GENODES1VHZ",
-    "DEXX64180014": "DRESDEFF641",
-    "DEXX64190110": "GENODES1TUE",
-    "DEXX64191030": "GENODES1NAG",
-    "DEXX64191700": "GENODES1HOR",
-    "DEXX64240048": "COBADEFFXXX",
-    "DEXX64240071": "COBADEFFXXX",
-    "DEXX64250040": "SOLADES1RWL",
-    "DEXX64251060": "SOLADES1FDS",
-    "DEXX64261363": "GENODES1BAI",
-    "DEXX64261626": "GENODES1MMO",
-    "DEXX64261853": "GENODES1PGW",
-    "DEXX64262408": "GENODES1VDS",
-    "DEXX64290120": "GENODES1VRW",
-    "DEXX64291010": "GENODES1FDS",
-    "DEXX64291420": "GENODES1VDL",
-    "DEXX64292020": "GENODES1SBG",
-    "DEXX64292310": "GENODES1TRO",
-    "DEXX64350070": "SOLADES1TUT",
-    "DEXX64361359": "GENODES1RDH",
-    "DEXX64380011": "DRESDEFF643",
-    "DEXX64390130": "GENODES1TUT",
-    "DEXX65020186": "HYVEDEMM588",
-    "DEXX65040073": "COBADEFFXXX",
-    "DEXX65050110": "SOLADES1RVB",
-    "DEXX65061219": "GENODES1AUL",
-    "DEXX65062577": "GENODES1RRV",
-    "DEXX65063086": "GENODES1SAG",
-    "DEXX65070024": "DEUTDEDB650",
-    "DEXX65070084": "DEUTDESS650",
-    "DEXX65080009": "DRESDEFF650",
-    "DEXX65090100": "ULMVDE66XXX",
-    "DEXX65091040": "GENODES1LEU",
-    "DEXX65091300": "GENODES1BWB",
-    "DEXX65091600": "GENODES1VWG",
-    "DEXX65092010": "GENODES1WAN",
-    "DEXX65092200": "GENODES1VAH",
-    "DEXX65093020": "GENODES1SLG",
-    "DEXX65110200": "IBBFDE81XXX",
-    "DEXX65140072": "COBADEFFXXX",
-    "DEXX65161497": "GENODES1GMB",
-    "DEXX65162832": "GENODES1OTE",
-    "DEXX65180005": "DRESDEFF651",
-    "DEXX65190110": "GENODES1VFN",
-    "DEXX65191500": "GENODES1TET",
-    "DEXX65340004": "COBADEFFXXX",
-    "DEXX65341204": "COBADEFFXXX",
-    "DEXX65351050": "SOLADES1SIG",
-    "DEXX65351260": "SOLADES1BAL",
-    "DEXX65361469": "GENODES1HBM",
-    "DEXX65361898": "GENODES1WLB",
-    "DEXX65361989": "GENODES1ONS",
-    "DEXX65362499": "GENODES1GEI",
-    "DEXX65370024": "DEUTDEDB653",
-    "DEXX65370075": "DEUTDESS653",
-    "DEXX65380003": "DRESDEFF653",
-    "DEXX65390120": "GENODES1EBI",
-    "DEXX65391210": "GENODES1BAL",
-    "DEXX65392030": "GENODES1TAI",
-    "DEXX65440087": "COBADEFFXXX",
-    "DEXX65450070": "SBCRDE66XXX",
-    "DEXX65461878": "GENODES1WAR",
-    "DEXX65462231": "GENODES1ERO",
-    "DEXX65491320": "GENODES1VBL",
-    "DEXX65491510": "GENODES1VRR",
-    "DEXX66000000": "MARKDEF1660",
-    "DEXX66010075": "PBNKDEFFXXX",
-    "DEXX66010200": "BBSPDE6KXXX",
-    "DEXX66010700": "LKBWDE6KXXX",
-    "DEXX66020020": "SOLADEST663",
-    "DEXX66020286": "HYVEDEMM475",
-    "DEXX66020500": "BFSWDE33KRL",
-    "DEXX66020566": "BFSWDE33KRL",
-    "DEXX66030600": "ISBKDEFXXXX",
-    "DEXX66040018": "COBADEFFXXX",
-    "DEXX66040026": "COBADEFFXXX",
-    "DEXX66050000": "SOLADEST660",
-    "DEXX66050101": "KARSDE66XXX",
-    "DEXX66051220": "SOLADES1ETT",
-    "DEXX66060000": "GENODE6KXXX",
-    "DEXX66060300": "GENODE61KA3",
-    "DEXX66061407": "GENODE61RH2",
-    "DEXX66061724": "GENODE61WGA",
-    "DEXX66062138": "GENODE61EGG",
-    "DEXX66062366": "GENODE61DET",
-    "DEXX66069103": "GENODE61ELZ",
-    "DEXX66069104": "GENODE61DAC",
-    "DEXX66069342": "GENODE61KTH",
-    "DEXX66070004": "DEUTDESM660",
-    "DEXX66070024": "DEUTDEDB660",
-    "DEXX66080052": "DRESDEFF660",
-    "DEXX66090621": "DAAEDED1021",
-    "DEXX66090800": "GENODE61BBB",
-    "DEXX66090900": "GENODEF1P10",
-    "DEXX66091200": "GENODE61ETT",
-    "DEXX66190000": "GENODE61KA1",
-    "DEXX66240002": "COBADEFFXXX",
-    "DEXX66250030": "SOLADES1BAD",
-    "DEXX66251434": "SOLADES1BHL",
-    "DEXX66261092": "GENODE61BHT",
-    "DEXX66261416": "GENODE61ALR",
-    "DEXX66270001": "DEUTDESM662",
-    "DEXX66270024": "DEUTDEDB662",
-    "DEXX66280053": "DRESDEFF662",
-    "DEXX66290000": "VBRADE6KXXX",
-    "DEXX66291300": "GENODE61ACH",
-    "DEXX66291400": "GENODE61BHL",
-    "DEXX66340018": "COBADEFFXXX",
-    "DEXX66350036": "BRUSDE66XXX",
-    "DEXX66391200": "GENODE61BTT",
-    "DEXX66391600": "GENODE61ORH",
-    "DEXX66432700": "FAITDE66XXX",
-    "DEXX66440084": "COBADEFFXXX",
-    "DEXX66450050": "SOLADES1OFG",
-    "DEXX66451346": "SOLADES1GEB",
-    "DEXX66451548": "SOLADES1HAL",
-    "DEXX66451862": "SOLADES1KEL",
-    "DEXX66452776": "SOLADES1WOF",
-    "DEXX66470024": "DEUTDEDB968",
-    "DEXX66470035": "DEUTDE6F664",
-    "DEXX66490000": "GENODE61OG1",
-    "DEXX66492600": "GENODE61APP",
-    "DEXX66492700": "GENODE61KZT",
-    "DEXX66550070": "SOLADES1RAS",
-    "DEXX66562053": "GENODE61DUR",
-    "DEXX66562300": "GENODE61IFF",
-    "DEXX66640035": "COBADEFFXXX",
-    "DEXX66650085": "PZHSDE66XXX",
-    "DEXX66661244": "GENODE61NBT",
-    "DEXX66661329": "GENODE61KBR",
-    "DEXX66661454": "GENODE61NFO",
-    "DEXX66662155": "GENODE61ERS",
-    "DEXX66662220": "GENODE61KBS",
-    "DEXX66670006": "DEUTDESM666",
-    "DEXX66670024": "DEUTDEDB666",
-    "DEXX66680013": "DRESDEFF666",
-    "DEXX66690000": "VBPFDE66XXX",
-    "DEXX66692300": "GENODE61WIR",
-    "DEXX66762332": "GENODE61KIR",
-    "DEXX66762433": "GENODE61NEU",
-    "DEXX67020190": "HYVEDEMM489",
-    "DEXX67040031": "COBADEFFXXX",
-    "DEXX67040060": "COBADEFFXXX",
-    "DEXX67040061": "COBADEFFXXX",
-    "DEXX67040085": "COBADEFFXXX",
-    "DEXX67050505": "MANSDE66XXX",
-    "DEXX67051203": "SOLADES1HOC",
-    "DEXX67060031": "GENODE61MA3",
-    "DEXX67070010": "DEUTDESMXXX",
-    "DEXX67070024": "DEUTDEDBMAN",
-    "DEXX67080050": "DRESDEFF670",
-    "DEXX67080085": "DRESDEFFI60",
-    "DEXX67080086": "DRESDEFFI61",
-    "DEXX67089440": "DRESDEFFI22",
-    "DEXX67090000": "GENODE61MA2",
-    "DEXX67090617": "DAAEDED1017",
-    "DEXX67092300": "GENODE61WNM",
-    "DEXX67220286": "HYVEDEMM479",
-    "DEXX67230000": "MLPBDE61XXX",
-    "DEXX67230001": "MLPBDE61001",
-    "DEXX67240039": "COBADEFFXXX",
-    "DEXX67250020": "SOLADES1HDB",
-    "DEXX67262243": "GENODE61WIB",
-    "DEXX67262550": "GENODE61LRO",
-    "DEXX67270003": "DEUTDESM672",
-    "DEXX67270024": "DEUTDEDB672",
-    "DEXX67280051": "DRESDEFF672",
-    "DEXX67290000": "GENODE61HD1",
-    "DEXX67290100": "GENODE61HD3",
-    "DEXX67291700": "GENODE61NGD",
-    "DEXX67291900": "GENODE61SSH",
-    "DEXX67292200": "GENODE61WIE",
-    "DEXX67352565": "SOLADES1TBB",
-    "DEXX67390000": "GENODE61WTH",
-    "DEXX67450048": "SOLADES1MOS",
-    "DEXX67460041": "GENODE61MOS",
-    "DEXX67461424": "GENODE61BUC",
-    "DEXX67461733": "GENODE61RNG",
-    "DEXX67462368": "GENODE61LMB",
-    "DEXX67462480": "GENODE61SOB",
-    "DEXX68000000": "MARKDEF1680",
-    "DEXX68020186": "HYVEDEMM357",
-    "DEXX68030000": "BKMADE61XXX",
-    "DEXX68040007": "COBADEFFXXX",
-    "DEXX68050101": "FRSPDE66XXX",
-    "DEXX68051004": "SOLADES1HSW",
-    "DEXX68051207": "SOLADES1BND",
-    "DEXX68052230": "SOLADES1STB",
-    "DEXX68052328": "SOLADES1STF",
-    "DEXX68052863": "SOLADES1SCH",
-    "DEXX68061505": "GENODE61IHR",
-    "DEXX68062105": "GENODE61DEN",
-    "DEXX68062730": "GENODE61WYH",
-    "DEXX68063479": "GENODE61VOK",
-    "DEXX68064222": "GENODE61GUN",
-    "DEXX68070024": "DEUTDEDBFRE",
-    "DEXX68070030": "DEUTDE6FXXX",
-    "DEXX68080030": "DRESDEFF680",
-    "DEXX68080031": "DRESDEFFI44",
-    "DEXX68080085": "DRESDEFFI62",
-    "DEXX68080086": "DRESDEFFJ22",
-    "DEXX68090000": "GENODE61FR1",
-    "DEXX68090622": "DAAEDED1022",
-    "DEXX68090900": "GENODEF1P07",
-    "DEXX68091900": "GENODE61MHL",
-    "DEXX68092000": "GENODE61EMM",
-    "DEXX68092300": "GENODE61STF",
-    "DEXX68270024": "DEUTDEDB682",
-    "DEXX68270033": "DEUTDE6F682",
-    "DEXX68290000": "GENODE61LAH",
-    "DEXX68340058": "COBADEFFXXX",
-    "DEXX68350048": "SKLODE66XXX",
-    "DEXX68351557": "SOLADES1SFH",
-    "DEXX68351865": "SOLADES1MGL",
-    "DEXX68370024": "DEUTDEDB683",
-    "DEXX68370034": "DEUTDE6F683",
-    "DEXX68390000": "VOLODE66XXX",
-    "DEXX68391500": "GENODE61SPF",
-    "DEXX68452290": "SKHRDE6WXXX",
-    "DEXX68462427": "GENODE61WUT",
-    "DEXX68490000": "GENODE61BSK",
-    "DEXX68492200": "GENODE61WT1",
-    "DEXX69020190": "HYVEDEMM591",
-    "DEXX69040045": "COBADEFFXXX",
-    "DEXX69050001": "SOLADES1KNZ",
-    "DEXX69051410": "SOLADES1REN",
-    "DEXX69051620": "SOLADES1PFD",
-    "DEXX69051725": "SOLADES1SAL",
-    "DEXX69061800": "GENODE61UBE",
-    "DEXX69070024": "DEUTDEDB690",
-    "DEXX69070032": "DEUTDE6F690",
-    "DEXX69091200": "GENODE61HAG",
-    "DEXX69091600": "GENODE61PFD",
-    "DEXX69220186": "HYVEDEMM590",
-    "DEXX69240075": "COBADEFFXXX",
-    "DEXX69250035": "SOLADES1SNG",
-    "DEXX69251445": "SOLADES1ENG",
-    "DEXX69251755": "SOLADES1STO",
-    "DEXX69270024": "DEUTDEDB692",
-    "DEXX69270038": "DEUTDE6F692",
-    "DEXX69280035": "DRESDEFF692",
-    "DEXX69290000": "GENODE61SIN",
-    "DEXX69291000": "GENODE61RAD",
-    "DEXX69291099": "GENODE61RAD",
-    "DEXX69362032": "GENODE61MES",
-    "DEXX69400000": "MARKDEF1694",
-    "DEXX69440007": "COBADEFFXXX",
-    "DEXX69440060": "COBADEFFXXX",
-    "DEXX69450065": "SOLADES1VSS",
-    "DEXX69451070": "SOLADES1DOE",
-    "DEXX69470024": "DEUTDEDB694",
-    "DEXX69470039": "DEUTDE6F694",
-    "DEXX69490000": "GENODE61VS1",
-    "DEXX69491700": "GENODE61TRI",
-    "DEXX70000000": "MARKDEF1700",
-    "DEXX70010080": "PBNKDEFFXXX",
-    "DEXX70010111": "ESSEDE5F700",
-    "DEXX70010424": "AARBDE5W700",
-    "DEXX70010500": "REBMDEMMXXX",
-    "DEXX70010555": "REBMDEMM555",
-    "DEXX70010570": "REBMDE7CXXX",
-    "DEXX70010800": "KHMIDEMMXXX",
-    "DEXX70011100": "DEKTDE7GXXX",
-    "DEXX70011110": "DEKTDE7GXXX",
-    "DEXX70011200": "VONTDEM1XXX",
-    "DEXX70011300": "AUZDDEM1XXX",
-    "DEXX70011400": "BFWODE71XXX",
-    "DEXX70011500": "SIBADEMMXXX",
-    "DEXX70011600": "WEGBDE77XXX",
-    "DEXX70011700": "BVDHDEMMXXX",
-    "DEXX70011900": "ICRDDE71XXX",
-    "DEXX70012000": "CLABDEM1XXX",
-    "DEXX70012300": "VBANDEMMXXX",
-    "DEXX70012400": "FLGMDE77XXX",
-    "DEXX70012600": "SUSKDEM1XXX",
-    "DEXX70012700": "DEPDDEMMXXX",
-    "DEXX70013000": "EBSGDEMXXXX",
-    "DEXX70013010": "EFSGDEM1XXX",
-    "DEXX70013100": "BVWBDE2WXXX",
-    "DEXX70013199": "BVWBDE2WXXX",
-    "DEXX70013400": "CSHHDE71XXX",
-    "DEXX70013500": "HERZDEM1XXX",
-    "DEXX70015000": "TEZGDEB1XXX",
-    "DEXX70015015": "TEZGDEB1001",
-    "DEXX70015025": "TEZGDEB1002",
-    "DEXX70015035": "TEZGDEB1003",
-    "DEXX70017000": "PAGMDEM1XXX",
-    "DEXX70020270": "HYVEDEMMXXX",
-    "DEXX70020300": "WKVBDEM1XXX",
-    "DEXX70020500": "BFSWDE33MUE",
-    "DEXX70020570": "BFSWDE33MUE",
-    "DEXX70020800": "BCITDEFFMUC",
-    "DEXX70021180": "HYVEDEMM418",
-    "DEXX70022200": "FDDODEMMXXX",
-    "DEXX70025175": "HYVEDEMM643",
-    "DEXX70030014": "FUBKDE71MUC",
-    "DEXX70030300": "CHDBDEHHXXX",
-    "DEXX70030400": "MEFIDEMMXXX",
-    "DEXX70031000": "BHLSDEM1XXX",
-    "DEXX70032500": "GAKDDEM1XXX",
-    "DEXX70033100": "BDWBDEMMXXX",
-    "DEXX70035000": "OLBODEH2700",
-    "DEXX70040041": "COBADEFFXXX",
-    "DEXX70040045": "COBADEFFXXX",
-    "DEXX70040048": "COBADEFFXXX",
-    "DEXX70040060": "COBADEFFXXX",
-    "DEXX70040061": "COBADEFFXXX",
-    "DEXX70040062": "COBADEFFXXX",
-    "DEXX70040063": "COBADEFFXXX",
-    "DEXX70040070": "COBADEFFXXX",
-    "DEXX70045050": "COBADEFFXXX",
-    "DEXX70050000": "BYLADEMMXXX",
-    "DEXX70051003": "BYLADEM1FSI",
-    "DEXX70051540": "BYLADEM1DAH",
-    "DEXX70051805": "BYLADEM1EBE",
-    "DEXX70051995": "BYLADEM1ERD",
-    "DEXX70052060": "BYLADEM1LLD",
-    "DEXX70053070": "BYLADEM1FFB",
-    "DEXX70054306": "BYLADEM1WOR",
-    "DEXX70070010": "DEUTDEMMXXX",
-    "DEXX70070024": "DEUTDEDBMUC",
-    "DEXX70080000": "DRESDEFF700",
-    "DEXX70080056": "DRESDEFF714",
-    "DEXX70080057": "DRESDEFF724",
-    "DEXX70080085": "DRESDEFFI55",
-    "DEXX70080086": "DRESDEFFJ23",
-    "DEXX70080087": "DRESDEFFJ24",
-    "DEXX70080088": "DRESDEFFJ25",
-    "DEXX70089470": "DRESDEFFI23",
-    "DEXX70089472": "DRESDEFFI45",
-    "DEXX70090100": "GENODEF1M04",
-    "DEXX70090124": "GENODEF1MU4",
-    "DEXX70090500": "GENODEF1S04",
-    "DEXX70090606": "DAAEDED1006",
-    "DEXX70091500": "GENODEF1DCA",
-    "DEXX70091510": "GENODEF1DCA",
-    "DEXX70091600": "GENODEF1DSS",
-    "DEXX70091900": "GENODEF1EDV",
-    "DEXX70093200": "GENODEF1STH",
-    "DEXX70093400": "GENODEF1ISV",
-    "DEXX70110088": "PBNKDEFFXXX",
-    "DEXX70110500": "MHYPDEMMXXX",
-    "DEXX70120100": "SBOSDEMXXXX",
-    "DEXX70120400": "DABBDEMMXXX",
-    "DEXX70120500": "FMBKDEMMXXX",
-    "DEXX70120600": "AGBMDEMMXXX",
-    "DEXX70120700": "OBKLDEMXXXX",
-    "DEXX70130700": "LENZDEM1XXX",
-    "DEXX70130799": "LENZDEM1XXX",
-    "DEXX70130800": "GENODEF1M06",
-    "DEXX70133300": "SCFBDE33XXX",
-    "DEXX70150000": "SSKMDEMMXXX",
-    "DEXX70160000": "GENODEFF701",
-    "DEXX70163370": "GENODEF1FFB",
-    "DEXX70166486": "GENODEF1OHC",
-    "DEXX70169132": "GENODEF1HFG",
-    "DEXX70169165": "GENODEF1SBC",
-    "DEXX70169168": "GENODEF1RIW",
-    "DEXX70169186": "GENODEF1ODZ",
-    "DEXX70169190": "GENODEF1GKT",
-    "DEXX70169191": "GENODEF1TEI",
-    "DEXX70169195": "GENODEF1TRU",
-    "DEXX70169310": "GENODEF1ALX",
-    "DEXX70169331": "GENODEF1SSB",
-    "DEXX70169333": "GENODEF1EUR",
-    "DEXX70169351": "GENODEF1ELB",
-    "DEXX70169356": "GENODEF1EDR",
-    "DEXX70169382": "GENODEF1GIL",
-    "DEXX70169383": "GENODEF1GMU",
-    "DEXX70169388": "GENODEF1HMA",
-    "DEXX70169402": "GENODEF1HHK",
-    "DEXX70169410": "GENODEF1HZO",
-    "DEXX70169413": "GENODEF1HUA",
-    "DEXX70169450": "GENODEF1ASG",
-    "DEXX70169459": "GENODEF1MTW",
-    "DEXX70169460": "GENODEF1MOO",
-    "DEXX70169464": "GENODEF1M07",
-    "DEXX70169465": "GENODEF1M08",
-    "DEXX70169466": "GENODEF1M03",
-    "DEXX70169470": "GENODEF1GAA",
-    "DEXX70169474": "GENODEF1NSV",
-    "DEXX70169476": "GENODEF1NBK",
-    "DEXX70169509": "GENODEF1PEI",
-    "DEXX70169521": "GENODEF1RIG",
-    "DEXX70169524": "GENODEF1RME",
-    "DEXX70169530": "GENODEF1RWZ",
-    "DEXX70169538": "GENODEF1SWO",
-    "DEXX70169541": "GENODEF1THG",
-    "DEXX70169543": "GENODEF1HHS",
-    "DEXX70169558": "GENODEF1SGA",
-    "DEXX70169566": "GENODEF1TAV",
-    "DEXX70169568": "GENODEF1TAE",
-    "DEXX70169571": "GENODEF1DTZ",
-    "DEXX70169575": "GENODEF1TRH",
-    "DEXX70169576": "GENODEF1TUS",
-    "DEXX70169585": "GENODEF1UNS",
-    "DEXX70169598": "GENODEF1MIB",
-    "DEXX70169599": "GENODEF1WEI",
-    "DEXX70169602": "GENODEF1WM1",
-    "DEXX70169605": "GENODEF1ISE",
-    "DEXX70169614": "GENODEF1FSR",
-    "DEXX70169619": "GENODEF1ZOR",
-    "DEXX70169653": "GENODEF1AIG",
-    "DEXX70169693": "GENODEF1RHT",
-    "DEXX70190000": "GENODEF1M01",
-    "DEXX70190010": "GENODEF1M1Y",
-    "DEXX70220000": "LFFBDEMMXXX",
-    "DEXX70220200": "BHFBDEFF700",
-    "DEXX70220300": "BMWBDEMUXXX",
-    "DEXX70220800": "VVAGDEM1XXX",
-    "DEXX70220900": "DRESDEFFBFC",
-    "DEXX70230600": "ISBKDEFXMUN",
-    "DEXX70250150": "BYLADEM1KMS",
-    "DEXX70320090": "HYVEDEMM654",
-    "DEXX70321194": "HYVEDEMM466",
-    "DEXX70322192": "HYVEDEMM664",
-    "DEXX70350000": "BYLADEM1GAP",
-    "DEXX70351030": "BYLADEM1WHM",
-    "DEXX70362595": "GENODEF1WAK",
-    "DEXX70380006": "DRESDEFF703",
-    "DEXX70390000": "GENODEF1GAP",
-    "DEXX70390010": "GENODEF1GAP",
-    "DEXX70391800": "GENODEF1PZB",
-    "DEXX71020072": "HYVEDEMM410",
-    "DEXX71021270": "HYVEDEMM629",
-    "DEXX71022182": "HYVEDEMM453",
-    "DEXX71023173": "HYVEDEMM632",
-    "DEXX71050000": "BYLADEM1BGL",
-    "DEXX71051010": "BYLADEM1AOE",
-    "DEXX71052050": "BYLADEM1TST",
-    "DEXX71061009": "GENODEF1AOE",
-    "DEXX71062802": "GENODEF1AGE",
-    "DEXX71090000": "GENODEF1BGL",
-    "DEXX71120077": "HYVEDEMM448",
-    "DEXX71120078": "HYVEDEMM644",
-    "DEXX71121176": "HYVEDEMM438",
-    "DEXX71122183": "HYVEDEMM457",
-    "DEXX71140041": "COBADEFFXXX",
-    "DEXX71141041": "COBADEFFXXX",
-    "DEXX71142041": "COBADEFFXXX",
-    "DEXX71150000": "BYLADEM1ROS",
-    "DEXX71151020": "BYLADEM1MDF",
-    "DEXX71152570": "BYLADEM1MIB",
-    "DEXX71152680": "BYLADEM1WSB",
-    "DEXX71160000": "GENODEF1VRR",
-    "DEXX71160161": "GENODEF1ROR",
-    "DEXX71161964": "GENODEF1PRV",
-    "DEXX71162355": "GENODEF1OBD",
-    "DEXX71162804": "GENODEF1ASU",
-    "DEXX71165150": "GENODEF1AIB",
-    "DEXX71180005": "DRESDEFF711",
-    "DEXX71190000": "GENODEF1ROV",
-    "DEXX71191000": "GENODEF1MUL",
-    "DEXX72000000": "MARKDEF1720",
-    "DEXX72012300": "BTVADE61XXX",
-    "DEXX72020070": "HYVEDEMM408",
-    "DEXX72020700": "AUGBDE77XXX",
-    "DEXX72021271": "HYVEDEMM236",
-    "DEXX72021876": "HYVEDEMM259",
-    "DEXX72030014": "FUBKDE71XXX",
-    "DEXX72030227": "ANHODE77XXX",
-    "DEXX72030260": "ANHODE77PAY",
-    "DEXX72040046": "COBADEFFXXX",
-    "DEXX72050000": "AUGSDE77XXX",
-    "DEXX72050101": "BYLADEM1AUG",
-    "DEXX72051210": "BYLADEM1AIC",
-    "DEXX72051840": "BYLADEM1GZK",
-    "DEXX72062152": "GENODEF1MTG",
-    "DEXX72069002": "GENODEF1ADZ",
-    "DEXX72069005": "GENODEF1AIL",
-    "DEXX72069034": "GENODEF1BSI",
-    "DEXX72069036": "GENODEF1BOI",
-    "DEXX72069043": "GENODEF1GZ2",
-    "DEXX72069105": "GENODEF1HTF",
-    "DEXX72069113": "GENODEF1HZH",
-    "DEXX72069114": "GENODEF1HZR",
-    "DEXX72069119": "GENODEF1ICH",
-    "DEXX72069123": "GENODEF1JET",
-    "DEXX72069126": "GENODEF1BBT",
-    "DEXX72069132": "GENODEF1KRR",
-    "DEXX72069135": "GENODEF1LST",
-    "DEXX72069155": "GENODEF1MRI",
-    "DEXX72069179": "GENODEF1BWI",
-    "DEXX72069181": "GENODEF1OFF",
-    "DEXX72069193": "GENODEF1RLI",
-    "DEXX72069209": "GENODEF1RGB",
-    "DEXX72069220": "GENODEF1SMU",
-    "DEXX72069235": "GENODEF1THS",
-    "DEXX72069263": "GENODEF1WTS",
-    "DEXX72069274": "GENODEF1ZUS",
-    "DEXX72069308": "GENODEF1WDN",
-    "DEXX72069329": "GENODEF1NOE",
-    "DEXX72069736": "GENODEF1BLT",
-    "DEXX72069789": "GENODEF1PFA",
-    "DEXX72070001": "DEUTDEMM720",
-    "DEXX72070024": "DEUTDEDB720",
-    "DEXX72080001": "DRESDEFF720",
-    "DEXX72090000": "GENODEF1AUB",
-    "DEXX72090500": "GENODEF1S03",
-    "DEXX72090900": "GENODEF1P14",
-    "DEXX72091800": "GENODEF1GZ1",
-    "DEXX72120078": "HYVEDEMM426",
-    "DEXX72122181": "HYVEDEMM665",
-    "DEXX72140052": "COBADEFFXXX",
-    "DEXX72150000": "BYLADEM1ING",
-    "DEXX72151340": "BYLADEM1EIS",
-    "DEXX72151650": "BYLADEM1PAF",
-    "DEXX72151880": "BYLADEM1SSH",
-    "DEXX72152070": "BYLADEM1NEB",
-    "DEXX72160818": "GENODEF1INP",
-    "DEXX72169013": "GENODEF1ARH",
-    "DEXX72169080": "GENODEF1GSB",
-    "DEXX72169218": "GENODEF1SBN",
-    "DEXX72169246": "GENODEF1WFN",
-    "DEXX72169380": "GENODEF1BLN",
-    "DEXX72169745": "GENODEF1WDF",
-    "DEXX72169756": "GENODEF1ND2",
-    "DEXX72169764": "GENODEF1WRI",
-    "DEXX72169812": "GENODEF1GAH",
-    "DEXX72169831": "GENODEF1RBL",
-    "DEXX72170007": "DEUTDEMM721",
-    "DEXX72170024": "DEUTDEDB721",
-    "DEXX72180002": "DRESDEFF721",
-    "DEXX72191600": "GENODEF1PFI",
-    "DEXX72220074": "HYVEDEMM255",
-    "DEXX72223182": "HYVEDEMM263",
-    "DEXX72250000": "BYLADEM1NLG",
-    "DEXX72250160": "BYLADEM1DON",
-    "DEXX72251520": "BYLADEM1DLG",
-    "DEXX72261754": "GENODEF1RLH",
-    "DEXX72262401": "GENODEF1DLG",
-    "DEXX72290100": "GENODEF1DON",
-    "DEXX73050000": "BYLADEM1NUL",
-    "DEXX73061191": "GENODEF1NU1",
-    "DEXX73090000": "GENODEF1NUV",
-    "DEXX73120075": "HYVEDEMM436",
-    "DEXX73140046": "COBADEFFXXX",
-    "DEXX73150000": "BYLADEM1MLM",
-    "DEXX73160000": "GENODEF1MIR",
-    "DEXX73180011": "DRESDEFF731",
-    "DEXX73190000": "GENODEF1MM1",
-    "DEXX73191500": "ULMVDE66XXX",
-    "DEXX73320073": "HYVEDEMM428",
-    "DEXX73321177": "HYVEDEMM567",
-    "DEXX73322380": "HYVEDEMM570",
-    "DEXX73331700": "GABLDE71XXX",
-    "DEXX73340046": "COBADEFFXXX",
-    "DEXX73350000": "BYLADEM1ALG",
-    "DEXX73351635": "BYLADEM1ALR",
-    "DEXX73369264": "GENODEF1DTA",
-    "DEXX73369821": "GENODEF1LBB",
-    "DEXX73369823": "GENODEF1WWA",
-    "DEXX73369826": "GENODEF1LIA",
-    "DEXX73369851": "GENODEF1AIT",
-    "DEXX73369854": "GENODEF1FCH",
-    "DEXX73369859": "GENODEF1BIN",
-    "DEXX73369871": "GENODEF1EGB",
-    "DEXX73369881": "GENODEF1HWG",
-    "DEXX73369902": "GENODEF1KM1",
-    "DEXX73369918": "GENODEF1OKI",
-    "DEXX73369920": "GENODEF1SFO",
-    "DEXX73369933": "GENODEF1RHP",
-    "DEXX73369936": "GENODEF1SER",
-    "DEXX73369954": "GENODEF1WGO",
-    "DEXX73370008": "DEUTDEMM733",
-    "DEXX73370024": "DEUTDEDB733",
-    "DEXX73380004": "DRESDEFF733",
-    "DEXX73390000": "GENODEF1KEV",
-    "DEXX73392000": "GENODEF1IMV",
-    "DEXX73420071": "HYVEDEMM427",
-    "DEXX73421478": "HYVEDEMM666",
-    "DEXX73440048": "COBADEFFXXX",
-    "DEXX73450000": "BYLADEM1KFB",
-    "DEXX73451450": "BYLADEM1SOG",
-    "DEXX73460046": "GENODEF1KFB",
-    "DEXX73480013": "DRESDEFF734",
-    "DEXX74020074": "HYVEDEMM445",
-    "DEXX74020100": "RZOODE77XXX",
-    "DEXX74020150": "RZOODE77050",
-    "DEXX74040082": "COBADEFFXXX",
-    "DEXX74050000": "BYLADEM1PAS",
-    "DEXX74051230": "BYLADEM1FRG",
-    "DEXX74061101": "GENODEF1RGS",
-    "DEXX74061564": "GENODEF1NUI",
-    "DEXX74061670": "GENODEF1ORT",
-    "DEXX74061813": "GENODEF1PFK",
-    "DEXX74061814": "GENODEF1PFK",
-    "DEXX74062490": "GENODEF1VIR",
-    "DEXX74062786": "GENODEF1TIE",
-    "DEXX74064593": "GENODEF1WSD",
-    "DEXX74065782": "GENODEF1SZT",
-    "DEXX74066749": "GENODEF1HZN",
-    "DEXX74067000": "GENODEF1POC",
-    "DEXX74069744": "GENODEF1GRT",
-    "DEXX74069752": "GENODEF1HHU",
-    "DEXX74069758": "GENODEF1TKI",
-    "DEXX74069768": "GENODEF1NHD",
-    "DEXX74090000": "GENODEF1PA1",
-    "DEXX74092400": "GENODEF1VIV",
-    "DEXX74120071": "HYVEDEMM415",
-    "DEXX74131000": "TEKRDE71XXX",
-    "DEXX74140048": "COBADEFFXXX",
-    "DEXX74150000": "BYLADEM1DEG",
-    "DEXX74151450": "BYLADEM1REG",
-    "DEXX74160025": "GENODEF1DEG",
-    "DEXX74161608": "GENODEF1HBW",
-    "DEXX74164149": "GENODEF1RGE",
-    "DEXX74165013": "GENODEF1AUS",
-    "DEXX74180009": "DRESDEFF741",
-    "DEXX74190000": "GENODEF1DGV",
-    "DEXX74191000": "GENODEF1LND",
-    "DEXX74220075": "HYVEDEMM452",
-    "DEXX74221170": "HYVEDEMM675",
-    "DEXX74240062": "COBADEFFXXX",
-    "DEXX74250000": "BYLADEM1SRG",
-    "DEXX74251020": "BYLADEM1CHM",
-    "DEXX74260110": "GENODEF1SR2",
-    "DEXX74261024": "GENODEF1CHA",
-    "DEXX74290000": "GENODEF1SR1",
-    "DEXX74290100": "CBSRDE71XXX",
-    "DEXX74320073": "HYVEDEMM433",
-    "DEXX74340077": "COBADEFFXXX",
-    "DEXX74350000": "BYLADEM1LAH",
-    "DEXX74351430": "BYLADEM1EGF",
-    "DEXX74351740": "BYLADEM1MSB",
-    "DEXX74361211": "GENODEF1ARF",
-    "DEXX74362663": "GENODEF1ERG",
-    "DEXX74364689": "GENODEF1PFF",
-    "DEXX74366666": "GENODEF1GSH",
-    "DEXX74369068": "GENODEF1LWE",
-    "DEXX74369088": "GENODEF1GPF",
-    "DEXX74369130": "GENODEF1PST",
-    "DEXX74369146": "GENODEF1RZK",
-    "DEXX74369656": "GENODEF1ENA",
-    "DEXX74369662": "GENODEF1EBV",
-    "DEXX74369704": "GENODEF1MKO",
-    "DEXX74380007": "DRESDEFF743",
-    "DEXX74390000": "GENODEF1LH1",
-    "DEXX74391300": "GENODEF1DGF",
-    "DEXX74391400": "GENODEF1EGR",
-    "DEXX74392300": "GENODEF1VBV",
-    "DEXX75000000": "MARKDEF1750",
-    "DEXX75020073": "HYVEDEMM447",
-    "DEXX75021174": "HYVEDEMM804",
-    "DEXX75040062": "COBADEFFXXX",
-    "DEXX75050000": "BYLADEM1RBG",
-    "DEXX75051040": "BYLADEM1SAD",
-    "DEXX75051565": "BYLADEM1KEH",
-    "DEXX75060150": "GENODEF1R02",
-    "DEXX75061168": "GENODEF1SWN",
-    "DEXX75061851": "GENODEF1REF",
-    "DEXX75062026": "GENODEF1DST",
-    "DEXX75069014": "GENODEF1ABS",
-    "DEXX75069015": "GENODEF1NGG",
-    "DEXX75069020": "GENODEF1BUK",
-    "DEXX75069038": "GENODEF1FKS",
-    "DEXX75069050": "GENODEF1GRW",
-    "DEXX75069055": "GENODEF1HGA",
-    "DEXX75069061": "GENODEF1HEM",
-    "DEXX75069078": "GENODEF1SZV",
-    "DEXX75069081": "GENODEF1KTZ",
-    "DEXX75069094": "GENODEF1PAR",
-    "DEXX75069110": "GENODEF1NKN",
-    "DEXX75069171": "GENODEF1SWD",
-    "DEXX75070013": "DEUTDEMM750",
-    "DEXX75070024": "DEUTDEDB750",
-    "DEXX75080003": "DRESDEFF750",
-    "DEXX75090000": "GENODEF1R01",
-    "DEXX75090300": "GENODEF1M05",
-    "DEXX75090500": "GENODEF1S05",
-    "DEXX75090629": "DAAEDED1029",
-    "DEXX75090900": "GENODEF1P18",
-    "DEXX75091400": "GENODEF1BLF",
-    "DEXX75220070": "HYVEDEMM405",
-    "DEXX75240000": "COBADEFFXXX",
-    "DEXX75250000": "BYLADEM1ABG",
-    "DEXX75261700": "GENODEF1SZH",
-    "DEXX75290000": "GENODEF1AMV",
-    "DEXX75320075": "HYVEDEMM454",
-    "DEXX75340090": "COBADEFFXXX",
-    "DEXX75350000": "BYLADEM1WEN",
-    "DEXX75351960": "BYLADEM1ESB",
-    "DEXX75360011": "GENODEF1WEO",
-    "DEXX75362039": "GENODEF1FLS",
-    "DEXX75363189": "GENODEF1NEW",
-    "DEXX75390000": "GENODEF1WEV",
-    "DEXX76000000": "MARKDEF1760",
-    "DEXX76010085": "PBNKDEFFXXX",
-    "DEXX76020070": "HYVEDEMM460",
-    "DEXX76020099": "HYVEDEMMCAR",
-    "DEXX76026000": "NORSDE71XXX",
-    "DEXX76030080": "CSDBDE71XXX",
-    "DEXX76030600": "ISBKDEFXNUR",
-    "DEXX76030800": "BIWBDE33760",
-    "DEXX76032000": "TEAMDE71XXX",
-    "DEXX76032001": "TEAMDE71TAT",
-    "DEXX76035000": "UMWEDE7NXXX",
-    "DEXX76040060": "COBADEFFXXX",
-    "DEXX76040061": "COBADEFFXXX",
-    "DEXX76040062": "COBADEFFXXX",
-    "DEXX76040065": "COBADEFFXXX",
-    "DEXX76050000": "BYLADEMMXXX",
-    "DEXX76050101": "SSKNDE77XXX",
-    "DEXX76052080": "BYLADEM1NMA",
-    "DEXX76060000": "GENODEFF760",
-    "DEXX76060618": "GENODEF1N02",
-    "DEXX76060620": "GENODEF1N02",
-    "DEXX76061025": "GENODEF1LAU",
-    "DEXX76061482": "GENODEF1HSB",
-    "DEXX76069369": "GENODEF1AUO",
-    "DEXX76069372": "GENODEF1WDS",
-    "DEXX76069378": "GENODEF1BEH",
-    "DEXX76069404": "GENODEF1DSB",
-    "DEXX76069409": "GENODEF1DIH",
-    "DEXX76069410": "GENODEF1DIM",
-    "DEXX76069440": "GENODEF1FEC",
-    "DEXX76069441": "GENODEF1FEW",
-    "DEXX76069448": "GENODEF1FRD",
-    "DEXX76069449": "GENODEF1FYS",
-    "DEXX76069462": "GENODEF1GDG",
-    "DEXX76069468": "GENODEF1GU1",
-    "DEXX76069486": "GENODEF1HSC",
-    "DEXX76069512": "GENODEF1N08",
-    "DEXX76069553": "GENODEF1NM1",
-    "DEXX76069559": "GENODEF1NEA",
-    "DEXX76069564": "GENODEF1BTO",
-    "DEXX76069576": "GENODEF1BPL",
-    "DEXX76069598": "GENODEF1RSS",
-    "DEXX76069602": "GENODEF1HSE",
-    "DEXX76069611": "GENODEF1SDM",
-    "DEXX76069635": "GENODEF1URS",
-    "DEXX76069663": "GENODEF1WBA",
-    "DEXX76069669": "GENODEF1ZIR",
-    "DEXX76070012": "DEUTDEMM760",
-    "DEXX76070024": "DEUTDEDB760",
-    "DEXX76080040": "DRESDEFF760",
-    "DEXX76080053": "DRESDEFFAGI",
-    "DEXX76080055": "DRESDEFFI25",
-    "DEXX76080085": "DRESDEFFJ26",
-    "DEXX76080086": "DRESDEFFJ27",
-    "DEXX76089480": "DRESDEFFI24",
-    "DEXX76089482": "DRESDEFFI46",
-    "DEXX76090400": "GENODEF1N03",
-    "DEXX76090500": "GENODEF1S06",
-    "DEXX76090613": "DAAEDED1013",
-    "DEXX76090900": "GENODEF1P17",
-    "DEXX76211900": "GENODEF1WHD",
-    "DEXX76220073": "HYVEDEMM419",
-    "DEXX76230000": "QUBADE71XXX",
-    "DEXX76240011": "COBADEFFXXX",
-    "DEXX76250000": "BYLADEM1SFU",
-    "DEXX76251020": "BYLADEM1NEA",
-    "DEXX76260451": "GENODEF1FUE",
-    "DEXX76320072": "HYVEDEMM417",
-    "DEXX76340061": "COBADEFFXXX",
-    "DEXX76350000": "BYLADEM1ERH",
-    "DEXX76351040": "BYLADEM1FOR",
-    "DEXX76351560": "BYLADEM1HOS",
-    "DEXX76360033": "GENODEF1ER1",
-    "DEXX76391000": "GENODEF1FOH",
-    "DEXX76420080": "HYVEDEMM065",
-    "DEXX76450000": "BYLADEM1SRS",
-    "DEXX76460015": "GENODEF1SWR",
-    "DEXX76461485": "GENODEF1HPN",
-    "DEXX76520071": "HYVEDEMM406",
-    "DEXX76550000": "BYLADEM1ANS",
-    "DEXX76551020": "BYLADEM1DKB",
-    "DEXX76551540": "BYLADEM1GUN",
-    "DEXX76551860": "BYLADEM1ROT",
-    "DEXX76560060": "GENODEF1ANS",
-    "DEXX76591000": "GENODEF1DKV",
-    "DEXX77020070": "HYVEDEMM411",
-    "DEXX77040080": "COBADEFFXXX",
-    "DEXX77050000": "BYLADEM1SKB",
-    "DEXX77060100": "GENODEF1BA2",
-    "DEXX77061004": "GENODEF1ALK",
-    "DEXX77061425": "GENODEF1EBR",
-    "DEXX77062014": "GENODEF1BGB",
-    "DEXX77062139": "GENODEF1SFF",
-    "DEXX77069044": "GENODEF1KC2",
-    "DEXX77069051": "GENODEF1HIS",
-    "DEXX77069052": "GENODEF1HOB",
-    "DEXX77069091": "GENODEF1SFD",
-    "DEXX77069461": "GENODEF1GBF",
-    "DEXX77069739": "GENODEF1THA",
-    "DEXX77069746": "GENODEF1ETB",
-    "DEXX77069764": "GENODEF1KEM",
-    "DEXX77069782": "GENODEF1SPK",
-    "DEXX77069836": "GENODEF1BGO",
-    "DEXX77069868": "GENODEF1MGA",
-    "DEXX77069870": "GENODEF1SZF",
-    "DEXX77069906": "GENODEF1WSZ",
-    "DEXX77069908": "GENODEF1ZSP",
-    "DEXX77091800": "GENODEF1LIF",
-    "DEXX77120073": "HYVEDEMM289",
-    "DEXX77140061": "COBADEFFXXX",
-    "DEXX77150000": "BYLADEM1KUB",
-    "DEXX77190000": "GENODEF1KU1",
-    "DEXX77300000": "MARKDEF1773",
-    "DEXX77320072": "HYVEDEMM412",
-    "DEXX77322200": "FODBDE77XXX",
-    "DEXX77340076": "COBADEFFXXX",
-    "DEXX77350110": "BYLADEM1SBT",
-    "DEXX77361600": "GENODEF1KC1",
-    "DEXX77363749": "GENODEF1GFS",
-    "DEXX77365792": "GENODEF1HWA",
-    "DEXX77390000": "GENODEF1BT1",
-    "DEXX77390628": "DAAEDED1028",
-    "DEXX78020070": "HYVEDEMM424",
-    "DEXX78040081": "COBADEFFXXX",
-    "DEXX78050000": "BYLADEM1HOF",
-    "DEXX78055050": "BYLADEM1FIG",
-    "DEXX78060896": "GENODEF1HO1",
-    "DEXX78140000": "COBADEFFXXX",
-    "DEXX78160069": "GENODEF1MAK",
-    "DEXX78161575": "GENODEF1WSS",
-    "DEXX78320076": "HYVEDEMM480",
-    "DEXX78340091": "COBADEFFXXX",
-    "DEXX78350000": "BYLADEM1COB",
-    "DEXX78360000": "GENODEF1COS",
-    "DEXX79000000": "MARKDEF1790",
-    "DEXX79020076": "HYVEDEMM455",
-    "DEXX79030001": "FUCEDE77XXX",
-    "DEXX79032038": "BSHADE71XXX",
-    "DEXX79040047": "COBADEFFXXX",
-    "DEXX79050000": "BYLADEM1SWU",
-    "DEXX79061000": "GENODEF1OCH",
-    "DEXX79062106": "GENODEF1HAB",
-    "DEXX79063060": "GENODEF1EFD",
-    "DEXX79063122": "GENODEF1HBG",
-    "DEXX79065028": "GENODEF1BRK",
-    "DEXX79069001": "GENODEF1WED",
-    "DEXX79069010": "GENODEF1ATE",
-    "DEXX79069031": "GENODEF1BHD",
-    "DEXX79069150": "GENODEF1GEM",
-    "DEXX79069165": "GENODEF1MLV",
-    "DEXX79069181": "GENODEF1NDL",
-    "DEXX79069188": "GENODEF1SLZ",
-    "DEXX79069213": "GENODEF1RNM",
-    "DEXX79069271": "GENODEF1THH",
-    "DEXX79070016": "DEUTDEMM790",
-    "DEXX79070024": "DEUTDEDB790",
-    "DEXX79080052": "DRESDEFF790",
-    "DEXX79080085": "DRESDEFFJ28",
-    "DEXX79090000": "GENODEF1WU1",
-    "DEXX79090624": "DAAEDED1024",
-    "DEXX79161058": "GENODEF1ERN",
-    "DEXX79161499": "GENODEF1OBR",
-    "DEXX79190000": "GENODEF1KT1",
-    "DEXX79320075": "HYVEDEMM451",
-    "DEXX79330111": "FLESDEMMXXX",
-    "DEXX79340054": "COBADEFFXXX",
-    "DEXX79350000": "BYLADEM1SSW",
-    "DEXX79350101": "BYLADEM1KSW",
-    "DEXX79351010": "BYLADEM1KIS",
-    "DEXX79351730": "BYLADEM1HAS",
-    "DEXX79353090": "BYLADEM1NES",
-    "DEXX79362081": "GENODEF1GZH",
-    "DEXX79363016": "GENODEF1NDT",
-    "DEXX79363151": "GENODEF1HAS",
-    "DEXX79364069": "GENODEF1FWH",
-    "DEXX79380051": "DRESDEFF793",
-    "DEXX79520070": "HYVEDEMM407",
-    "DEXX79540049": "COBADEFFXXX",
-    "DEXX79550000": "BYLADEM1ASA",
-    "DEXX79561348": "GENODEF1BAG",
-    "DEXX79562514": "GENODEF1AB1",
-    "DEXX79565568": "GENODEF1WAA",
-    "DEXX79567531": "GENODEF1ALZ",
-    "DEXX79568518": "GENODEF1HAC",
-    "DEXX79570024": "DEUTDEDB795",
-    "DEXX79570051": "DEUTDEFF795",
-    "DEXX79580099": "DRESDEFF795",
-    "DEXX79589402": "DRESDEFFI47",
-    "DEXX79590000": "GENODEF1AB2",
-    "DEXX79650000": "BYLADEM1MIL",
-    "DEXX79665540": "GENODEF1EAU",
-    "DEXX79666548": "GENODEF1OBE",
-    "DEXX79668509": "GENODEF1ENB",
-    "DEXX79690000": "GENODEF1MIL",
-    "DEXX80020086": "HYVEDEMM440",
-    "DEXX80020087": "HYVEDEMM462",
-    "DEXX80040000": "COBADEFFXXX",
-    "DEXX80050500": "NOLADE21MQU",
-    "DEXX80053000": "NOLADE21BLK",
-    "DEXX80053572": "NOLADE21DES",
-    "DEXX80053622": "NOLADE21KOT",
-    "DEXX80053722": "NOLADE21BTF",
-    "DEXX80053762": "NOLADE21HAL",
-    "DEXX80054000": "NOLADE21WSF",
-    "DEXX80055008": "NOLADE21EIL",
-    "DEXX80055500": "NOLADE21SES",
-    "DEXX80062608": "GENODEF1JE1",
-    "DEXX80063508": "GENODEF1QLB",
-    "DEXX80063558": "GENODEF1SGH",
-    "DEXX80063598": "GENODEF1WB1",
-    "DEXX80063628": "GENODEF1KOE",
-    "DEXX80063648": "GENODEF1NMB",
-    "DEXX80063678": "GENODEF1ZTZ",
-    "DEXX80063718": "GENODEF1EIL",
-    "DEXX80080000": "DRESDEFF800",
-    "DEXX80093574": "GENODEF1DS1",
-    "DEXX80093784": "GENODEF1HAL",
-    "DEXX80550101": "NOLADE21WBL",
-    "DEXX80550200": "NOLADE21ZER",
-    "DEXX81000000": "MARKDEF1810",
-    "DEXX81020500": "BFSWDE33MAG",
-    "DEXX81040000": "COBADEFFXXX",
-    "DEXX81050555": "NOLADE21SDL",
-    "DEXX81052000": "NOLADE21HRZ",
-    "DEXX81053272": "NOLADE21MDG",
-    "DEXX81054000": "NOLADE21JEL",
-    "DEXX81055000": "NOLADE21HDL",
-    "DEXX81055555": "NOLADE21SAW",
-    "DEXX81063028": "GENODEF1KAB",
-    "DEXX81063238": "GENODEF1BRG",
-    "DEXX81068106": "GENODED1KDM",
-    "DEXX81069052": "GENODEF1WZL",
-    "DEXX81070000": "DEUTDE8MXXX",
-    "DEXX81070024": "DEUTDEDBMAG",
-    "DEXX81080000": "DRESDEFF810",
-    "DEXX81093034": "GENODEF1GA1",
-    "DEXX81093054": "GENODEF1SDL",
-    "DEXX81093274": "GENODEF1MD1",
-    "DEXX82000000": "MARKDEF1820",
-    "DEXX82020086": "HYVEDEMM498",
-    "DEXX82020087": "HYVEDEMM098",
-    "DEXX82020088": "HYVEDEMM824",
-    "DEXX82040000": "COBADEFFXXX",
-    "DEXX82040085": "COBADEFFXXX",
-    "DEXX82050000": "HELADEFF820",
-    "DEXX82051000": "HELADEF1WEM",
-    "DEXX82052020": "HELADEF1GTH",
-    "DEXX82054052": "HELADEF1NOR",
-    "DEXX82055000": "HELADEF1KYF",
-    "DEXX82056060": "HELADEF1MUE",
-    "DEXX82057070": "HELADEF1EIC",
-    "DEXX82060197": "GENODED1PA5",
-    "DEXX82064038": "GENODEF1MU2",
-    "DEXX82064088": "GENODEF1ESA",
-    "DEXX82064168": "GENODEF1GTH",
-    "DEXX82064188": "GENODEF1WE1",
-    "DEXX82064228": "ERFBDE8EXXX",
-    "DEXX82070000": "DEUTDE8EXXX",
-    "DEXX82070024": "DEUTDEDBERF",
-    "DEXX82080000": "DRESDEFF827",
-    "DEXX82094004": "GENODEF1HIG",
-    "DEXX82094054": "GENODEF1NDS",
-    "DEXX83020086": "HYVEDEMM468",
-    "DEXX83020087": "HYVEDEMM463",
-    "DEXX83020088": "HYVEDEMM484",
-    "DEXX83040000": "COBADEFFXXX",
-    "DEXX83050000": "HELADEF1GER",
-    "DEXX83050200": "HELADEF1ALT",
-    "DEXX83050303": "HELADEF1SAR",
-    "DEXX83050505": "HELADEF1SOK",
-    "DEXX83053030": "HELADEF1JEN",
-    "DEXX83064488": "GENODEF1HMF",
-    "DEXX83064568": "GENODEF1GEV",
-    "DEXX83065408": "GENODEF1SLR",
-    "DEXX83080000": "DRESDEFF830",
-    "DEXX83094444": "GENODEF1PN1",
-    "DEXX83094454": "GENODEF1RUJ",
-    "DEXX83094494": "GENODEF1ESN",
-    "DEXX83094495": "GENODEF1ETK",
-    "DEXX84020087": "HYVEDEMM458",
-    "DEXX84040000": "COBADEFFXXX",
-    "DEXX84050000": "HELADEF1RRS",
-    "DEXX84051010": "HELADEF1ILK",
-    "DEXX84054040": "HELADEF1HIL",
-    "DEXX84054722": "HELADEF1SON",
-    "DEXX84055050": "HELADEF1WAK",
-    "DEXX84064798": "GENODEF1MLF",
-    "DEXX84069065": "GENODEF1SSG",
-    "DEXX84080000": "DRESDEFF843",
-    "DEXX84094754": "GENODEF1SAL",
-    "DEXX84094755": "GENODEF1SAL",
-    "DEXX84094814": "GENODEF1SHL",
-    "DEXX85000000": "MARKDEF1850",
-    "DEXX85010500": "SABDDE81XXX",
-    "DEXX85020086": "HYVEDEMM496",
-    "DEXX85020500": "BFSWDE33DRE",
-    "DEXX85040000": "COBADEFFXXX",
-    "DEXX85040060": "COBADEFFXXX",
-    "DEXX85040061": "COBADEFFXXX",
-    "DEXX85050100": "WELADED1GRL",
-    "DEXX85050300": "OSDDDE81XXX",
-    "DEXX85055000": "SOLADES1MEI",
-    "DEXX85060000": "GENODEF1PR2",
-    "DEXX85065028": "GENODEF1SEB",
-    "DEXX85080000": "DRESDEFF850",
-    "DEXX85080085": "DRESDEFFJ29",
-    "DEXX85080086": "DRESDEFFJ30",
-    "DEXX85080200": "DRESDEFF857",
-    "DEXX85089270": "DRESDEFFI15",
-    "DEXX85090000": "GENODEF1DRS",
-    "DEXX85094984": "GENODEF1RIE",
-    "DEXX85095004": "GENODEF1MEI",
-    "DEXX85550000": "SOLADES1BAT",
-    "DEXX85590000": "GENODEF1BZV",
-    "DEXX85590100": "GENODEF1NGS",
-    "DEXX85591000": "GENODEF1GR1",
-    "DEXX86000000": "MARKDEF1860",
-    "DEXX86010090": "PBNKDEFFXXX",
-    "DEXX86010424": "AARBDE5W860",
-    "DEXX86020086": "HYVEDEMM495",
-    "DEXX86020500": "BFSWDE33LPZ",
-    "DEXX86033300": "SCFBDE33XXX",
-    "DEXX86040000": "COBADEFFXXX",
-    "DEXX86040060": "COBADEFFXXX",
-    "DEXX86040061": "COBADEFFXXX",
-    "DEXX86050000": "SOLADEST861",
-    "DEXX86050200": "SOLADES1GRM",
-    "DEXX86050600": "WELADED1TGU",
-    "DEXX86055002": "SOLADES1DES",
-    "DEXX86055462": "SOLADES1DLN",
-    "DEXX86055592": "WELADE8LXXX",
-    "DEXX86065448": "GENODEF1BOA",
-    "DEXX86065468": "GENODEF1DL1",
-    "DEXX86065483": "GENODEF1GMR",
-    "DEXX86069070": "GENODEF1TGB",
-    "DEXX86070000": "DEUTDE8LXXX",
-    "DEXX86070024": "DEUTDEDBLEG",
-    "DEXX86080000": "DRESDEFF860",
-    "DEXX86080055": "DRESDEFF862",
-    "DEXX86080057": "DRESDEFF867",
-    "DEXX86080085": "DRESDEFFJ31",
-    "DEXX86080086": "DRESDEFFJ32",
-    "DEXX86089280": "DRESDEFFI16",
-    "DEXX86095484": "GENODEF1GMV",
-    "DEXX86095554": "GENODEF1DZ1",
-    "DEXX86095604": "GENODEF1LVB",
-    "DEXX87000000": "MARKDEF1870",
-    "DEXX87020086": "HYVEDEMM497",
-    "DEXX87020087": "HYVEDEMM481",
-    "DEXX87020088": "HYVEDEMM441",
-    "DEXX87040000": "COBADEFFXXX",
-    "DEXX87050000": "CHEKDE81XXX",
-    "DEXX87051000": "WELADED1MTW",
-    "DEXX87052000": "WELADED1FGX",
-    "DEXX87054000": "WELADED1STB",
-    "DEXX87055000": "WELADED1ZWI",
-    "DEXX87058000": "WELADED1PLX",
-    "DEXX87069075": "GENODEF1MBG",
-    "DEXX87069077": "GENODEF1BST",
-    "DEXX87070000": "DEUTDE8CXXX",
-    "DEXX87070024": "DEUTDEDBCHE",
-    "DEXX87080000": "DRESDEFF870",
-    "DEXX87095824": "GENODEF1PL1",
-    "DEXX87095899": "GENODEF1EXT",
-    "DEXX87095934": "GENODEF1Z01",
-    "DEXX87095974": "GENODEF1GC1",
-    "DEXX87096124": "GENODEF1MIW",
-    "DEXX87096214": "GENODEF1CH1",
-}
+"""
+Access to the IBAN→BIC dataset shipped as ``bicdata.bin`` next to this module.
+
+The file is generated by ``update_bic_info.py`` and consists of a header, a directory of per-country partitions and
+fixed-width records::
+
+    header:     magic (8 bytes), format version (uint16), key width (uint16), partition count (uint16),
+                record count (uint32), dataset version (16 bytes, ASCII, NUL-padded),
+                SHA-256 of everything following the header (32 bytes)
+    partition:  country code (2 bytes), index of the first record (uint32), number of records (uint32)
+    record:     key (key width bytes, ASCII, NUL-padded), BIC (11 bytes, ASCII)
+
+Within a partition, records are sorted by key. Keys are prefixes of the BBAN, i.e. of the IBAN without country code
+and check digits. The file is memory-mapped on first use instead of being parsed at import time, so loading it is cheap
+and processes that never look up a BIC do not hold thousands of small string objects. The records of a country are
+only read into a dictionary on the first lookup of an IBAN from that country. Bank identifiers have a fixed length
+in most countries, so a lookup probes this dictionary once per distinct key length of the partition, longest first.
+"""
+import hashlib
+import mmap
+import os
+import struct
+from functools import lru_cache
+from typing import Optional
+
+MAGIC = b"PSEPABIC"
+FORMAT_VERSION = 3
+HEADER = struct.Struct("<8sHHHI16s32s")
+PARTITION = struct.Struct("<2sII")
+KEY_WIDTH = 12
+BIC_WIDTH = 11
+PATH = os.path.join(os.path.dirname(__file__), "bicdata.bin")
+
+
+class BICDataset:
+    """
+    Read-only view on a buffer in the format described above.
+    """
+
+    def __init__(self, buf):
+        magic, version, key_width, partition_count, count, dataset_version, checksum = HEADER.unpack_from(buf, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError("Unsupported BIC dataset format.")
+        self.version = dataset_version.rstrip(b"\0").decode("ascii")
+        self.checksum = checksum.hex()
+        self._buf = buf
+        self._key_width = key_width
+        self._record_size = key_width + BIC_WIDTH
+        self._count = count
+        self._records_offset = HEADER.size + partition_count * PARTITION.size
+        self._partitions = {}
+        for i in range(partition_count):
+            country, first, num = PARTITION.unpack_from(buf, HEADER.size + i * PARTITION.size)
+            self._partitions[country.decode("ascii")] = (first, num)
+        self._indexes = {}
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def countries(self):
+        return list(self._partitions)
+
+    @property
+    def country_counts(self) -> dict:
+        return {country: num for country, (first, num) in self._partitions.items()}
+
+    def verify(self) -> bool:
+        """
+        Returns whether the contents of the file match the checksum stored in its header.
+        """
+        return hashlib.sha256(self._buf[HEADER.size:]).hexdigest() == self.checksum
+
+    def items(self):
+        """
+        Yields all records as ``(key, bic)`` with keys in the form used by :func:`dump`.
+        """
+        buf, width, size = self._buf, self._key_width, self._record_size
+        for country, (first, num) in self._partitions.items():
+            for i in range(first, first + num):
+                offset = self._records_offset + i * size
+                key = buf[offset:offset + width].rstrip(b"\0").decode("ascii")
+                yield f"{country}XX{key}", buf[offset + width:offset + size].decode("ascii")
+
+    def _index(self, country):
+        if country not in self._indexes:
+            first, num = self._partitions[country]
+            buf, width, size = self._buf, self._key_width, self._record_size
+            keys = {}
+            for offset in range(self._records_offset + first * size, self._records_offset + (first + num) * size, size):
+                keys[buf[offset:offset + width].rstrip(b"\0").decode("ascii")] = (
+                    buf[offset + width:offset + size].decode("ascii")
+                )
+            self._indexes[country] = (keys, tuple(sorted({len(k) for k in keys}, reverse=True)))
+        return self._indexes[country]
+
+    def key_length(self, country: str) -> int:
+        """
+        Returns the length of the longest key of the country's partition, i.e. how many characters of the BBAN can
+        be relevant to identify the bank, or 0 if there is no data for the country.
+        """
+        if country not in self._partitions:
+            return 0
+        return self._index(country)[1][0]
+
+    def lookup(self, country: str, bban: str) -> Optional[str]:
+        """
+        Returns the BIC stored for the longest key of the country's partition that is a prefix of ``bban``.
+        """
+        if country not in self._partitions:
+            return None
+        keys, lengths = self._index(country)
+        for length in lengths:
+            bic = keys.get(bban[:length])
+            if bic is not None:
+                return bic
+        return None
+
+
+@lru_cache(maxsize=1)
+def load() -> BICDataset:
+    with open(PATH, "rb") as f:
+        # The mapping stays valid after the file is closed
+        return BICDataset(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+def dump(mapping: dict, version: str = "") -> bytes:
+    """
+    Serializes a ``{key: bic}`` mapping into the binary format. Keys are IBAN prefixes with the check digits replaced
+    by ``XX``, e.g. ``DEXX10000000``. ``version`` is an arbitrary label of up to 16 characters, such as the date of
+    the update.
+    """
+    if len(version) > 16:
+        raise ValueError("Version label too long.")
+    partitions = {}
+    for key, bic in mapping.items():
+        if len(key) < 5 or key[2:4] != "XX" or len(key) - 4 > KEY_WIDTH or len(bic) != BIC_WIDTH:
+            raise ValueError(f"Invalid record {key} → {bic}")
+        partitions.setdefault(key[:2], {})[key[4:]] = bic
+
+    directory = []
+    records = []
+    for country in sorted(partitions):
+        directory.append(PARTITION.pack(country.encode("ascii"), len(records), len(partitions[country])))
+        for key in sorted(partitions[country]):
+            records.append(key.encode("ascii").ljust(KEY_WIDTH, b"\0") + partitions[country][key].encode("ascii"))
+
+    body = b"".join(directory + records)
+    return HEADER.pack(
+        MAGIC, FORMAT_VERSION, KEY_WIDTH, len(directory), len(records), version.encode("ascii"),
+        hashlib.sha256(body).digest(),
+    ) + body
+
+
+def diff(old: dict, new: dict):
+    """
+    Compares two ``{key: bic}`` mappings and returns the added and removed keys as well as the keys whose BIC
+    changed, each as a sorted list.
+    """
+    added = sorted(new.keys() - old.keys())
+    removed = sorted(old.keys() - new.keys())
+    changed = sorted(k for k in new.keys() & old.keys() if new[k] != old[k])
+    return added, removed, changed
@@ -0,0 +1,26 @@
+"""
+Longest-prefix lookup of the BIC belonging to an IBAN.
+
+Instead of probing a mapping once per possible prefix length, :mod:`pretix_sepadebit.bicdata` only probes the key
+lengths that actually occur in the IBAN's country, which for most countries is a single one.
+"""
+from typing import Optional
+
+from . import bicdata
+
+
+def normalize_iban(iban: str) -> str:
+    """
+    Returns the IBAN without spaces, in upper case, and with the check digits replaced by ``XX``.
+    """
+    iban = iban.replace(" ", "").upper()
+    return iban[0:2] + "XX" + iban[4:]
+
+
+def lookup_bic(iban: str) -> Optional[str]:
+    """
+    Returns the BIC of the most specific known prefix of ``iban``, or ``None`` if we do not know the bank.
+    """
+    # The check digits are not part of the keys, so there is no need to normalize them
+    iban = iban.replace(" ", "").upper()
+    return bicdata.load().lookup(iban[0:2], iban[4:])
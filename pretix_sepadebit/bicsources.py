@@ -0,0 +1,75 @@
+"""
+Source adapters used by ``update_bic_info.py`` to build :mod:`pretix_sepadebit.bicdata`.
+
+Every adapter knows where the official list of bank codes of one country can be downloaded and how to turn that file
+into a ``{bban_prefix: bic}`` mapping. Parsing is separate from downloading, so every adapter can be tested against
+a local sample file. Adapters are registered by country code in ``sources``.
+"""
+import re
+from typing import Dict, Optional
+
+BIC_RE = re.compile(r"^[A-Z]{6}[A-Z0-9]{2}([A-Z0-9]{3})?$")
+
+sources = {}
+
+
+def register_source(cls):
+    sources[cls.country] = cls()
+    return cls
+
+
+def normalize_bic(bic) -> Optional[str]:
+    """
+    Returns the BIC in its 11-character form, or ``None`` if the value is not a BIC at all. Lists use placeholders
+    such as ``NAV`` or ``-`` for banks that do not have one.
+    """
+    bic = str(bic or "").strip().upper().replace(" ", "")
+    if not BIC_RE.match(bic):
+        return None
+    return bic if len(bic) == 11 else bic + "XXX"
+
+
+class BICSource:
+    country = None
+    url = None
+
+    def download_url(self) -> str:
+        return self.url
+
+    def fetch(self) -> bytes:
+        import requests
+
+        r = requests.get(self.download_url())
+        r.raise_for_status()
+        return r.content
+
+    def parse(self, content: bytes) -> Dict[str, str]:
+        raise NotImplementedError()
+
+
+@register_source
+class GermanySource(BICSource):
+    """
+    Bankleitzahlendatei of the Deutsche Bundesbank, a fixed-width text file with one line per bank code.
+    """
+    country = "DE"
+    url = "https://www.bundesbank.de/en/tasks/payment-systems/services/bank-sort-codes/download-bank-sort-codes-626218"
+
+    def download_url(self):
+        import requests
+        from bs4 import BeautifulSoup
+
+        page = requests.get(self.url)
+        doc = BeautifulSoup(page.text, "lxml")
+        return doc.select("a[href*='/blz-aktuell-txt-data.txt']")[0].attrs["href"]
+
+    def parse(self, content):
+        result = {}
+        for line in content.decode("iso-8859-1").splitlines():
+            # Only the main entry of each bank code (Merkmal 1) carries the BIC
+            if len(line) < 150 or line[8] != "1" or line[139] == " ":
+                continue
+            bic = normalize_bic(line[139:150])
+            if bic:
+                result[line[0:8]] = bic
+        return result
@@ -0,0 +1,84 @@
+"""
+Cache for the creditor configuration of events.
+
+Building the creditor configuration of an event resolves several settings through the settings hierarchy of the
+event, its organizer and the system. Organizer exports need it for every event with the plugin enabled, so it is kept
+in Django's cache between requests and tasks. All entries are keyed by a settings version that is replaced whenever
+one of the SEPA settings changes on any level, which invalidates all of them at once. Changes to an event itself, e.g.
+its currency, only invalidate the entry of that event.
+"""
+import uuid
+from django.core.cache import cache
+from django.db import transaction
+from pretix.base.models import Event
+
+CACHE_TIMEOUT = 3600
+
+VERSION_KEY = "pretix_sepadebit_settings_version"
+
+# Settings that are part of the cached configuration
+SETTINGS_KEYS = {
+    "payment_sepadebit_creditor_name",
+    "payment_sepadebit_creditor_iban",
+    "payment_sepadebit_creditor_bic",
+    "payment_sepadebit_creditor_id",
+    "payment_sepadebit_prenotification_days",
+}
+
+
+def settings_version():
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        version = uuid.uuid4().hex
+        if not cache.add(VERSION_KEY, version, timeout=None):
+            version = cache.get(VERSION_KEY, version)
+    return version
+
+
+def _cache_key(event_id, version):
+    return "pretix_sepadebit_creditor_{}_{}".format(event_id, version)
+
+
+def creditor_config(event):
+    return (
+        ("name", event.settings.payment_sepadebit_creditor_name),
+        ("IBAN", event.settings.payment_sepadebit_creditor_iban),
+        ("BIC", event.settings.payment_sepadebit_creditor_bic),
+        ("batch", True),
+        ("creditor_id", event.settings.payment_sepadebit_creditor_id),
+        ("currency", event.currency),
+    )
+
+
+def get_creditor_configs(event_ids):
+    """
+    Returns a dictionary that maps the given event IDs to a dictionary with the creditor configuration of the event
+    (``config``, as used for the export files) and its raw ``prenotification_days`` setting. Only the events that
+    are not in the cache are loaded from the database.
+    """
+    version = settings_version()
+    keys = {event_id: _cache_key(event_id, version) for event_id in event_ids}
+    cached = cache.get_many(keys.values())
+    result = {event_id: cached[key] for event_id, key in keys.items() if key in cached}
+
+    missing = Event.objects.select_related("organizer").in_bulk([e for e in keys if e not in result])
+    for event_id, event in missing.items():
+        result[event_id] = {
+            "config": creditor_config(event),
+            "prenotification_days": event.settings.payment_sepadebit_prenotification_days,
+        }
+    if missing:
+        cache.set_many({keys[event_id]: result[event_id] for event_id in missing}, CACHE_TIMEOUT)
+    return result
+
+
+def invalidate_creditor_configs(event=None):
+    """
+    Invalidates the cached configuration of ``event``, or of all events if no event is given, as soon as the current
+    transaction has been committed.
+    """
+    if event is None:
+        transaction.on_commit(lambda: cache.set(VERSION_KEY, uuid.uuid4().hex, timeout=None))
+    else:
+        event_id = event.pk
+        transaction.on_commit(lambda: cache.delete(_cache_key(event_id, settings_version())))
@@ -0,0 +1,31 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("pretixbase", "0287_organizer_plugins"),
+        ("pretix_sepadebit", "0009_org_level"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SepaBlocklistEntry",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False)),
+                ("prefix_hash", models.CharField(max_length=64)),
+                ("datetime", models.DateTimeField(auto_now_add=True)),
+                (
+                    "organizer",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="sepa_blocklist_entries",
+                        to="pretixbase.organizer",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("organizer", "prefix_hash")},
+            },
+        ),
+    ]
@@ -0,0 +1,76 @@
+import gzip
+import hashlib
+from django.db import migrations, models
+
+BATCH_SIZE = 100
+
+
+def _batches(SepaExport, field):
+    last = 0
+    while True:
+        batch = list(
+            SepaExport.objects.filter(pk__gt=last).order_by("pk").values_list("pk", field)[:BATCH_SIZE]
+        )
+        if not batch:
+            return
+        yield batch
+        last = batch[-1][0]
+
+
+def compress(apps, schema_editor):
+    SepaExport = apps.get_model("pretix_sepadebit", "SepaExport")
+    for batch in _batches(SepaExport, "xmldata"):
+        for pk, xmldata in batch:
+            data = xmldata.encode("utf-8")
+            SepaExport.objects.filter(pk=pk).update(
+                xml_gz=gzip.compress(data, mtime=0),
+                xml_sha256=hashlib.sha256(data).hexdigest(),
+                xml_size=len(data),
+                xmldata="",
+            )
+
+
+def decompress(apps, schema_editor):
+    SepaExport = apps.get_model("pretix_sepadebit", "SepaExport")
+    for batch in _batches(SepaExport, "xml_gz"):
+        for pk, xml_gz in batch:
+            SepaExport.objects.filter(pk=pk).update(
+                xmldata=gzip.decompress(bytes(xml_gz)).decode("utf-8") if xml_gz else "",
+            )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("pretix_sepadebit", "0010_sepablocklistentry"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="sepaexport",
+            name="xml_gz",
+            field=models.BinaryField(default=b""),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="sepaexport",
+            name="xml_sha256",
+            field=models.CharField(default="", max_length=64),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="sepaexport",
+            name="xml_size",
+            field=models.PositiveIntegerField(default=0),
+            preserve_default=False,
+        ),
+        migrations.AlterField(
+            model_name="sepaexport",
+            name="xmldata",
+            field=models.TextField(blank=True),
+        ),
+        migrations.RunPython(compress, decompress),
+        migrations.RemoveField(
+            model_name="sepaexport",
+            name="xmldata",
+        ),
+    ]
@@ -0,0 +1,55 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("pretixbase", "0287_organizer_plugins"),
+        ("pretix_sepadebit", "0011_sepaexport_xml_gz"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SepaExportRun",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False)),
+                ("date", models.DateField()),
+                ("started", models.DateTimeField(auto_now_add=True)),
+                ("finished", models.DateTimeField(blank=True, null=True)),
+                ("state", models.CharField(default="running", max_length=16)),
+                ("result", models.JSONField(default=dict)),
+                ("scheduled", models.BooleanField(default=True)),
+                (
+                    "event",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="sepa_export_runs",
+                        to="pretixbase.event",
+                    ),
+                ),
+                (
+                    "organizer",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="sepa_export_runs",
+                        to="pretixbase.organizer",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        condition=models.Q(("event__isnull", False), ("scheduled", True)),
+                        fields=("event", "date"),
+                        name="pretix_sepadebit_run_event_date",
+                    ),
+                    models.UniqueConstraint(
+                        condition=models.Q(("event__isnull", True), ("scheduled", True)),
+                        fields=("organizer", "date"),
+                        name="pretix_sepadebit_run_organizer_date",
+                    ),
+                ],
+            },
+        ),
+    ]
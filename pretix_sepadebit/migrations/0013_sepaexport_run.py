@@ -0,0 +1,22 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("pretix_sepadebit", "0012_sepaexportrun"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="sepaexport",
+            name="run",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="exports",
+                to="pretix_sepadebit.sepaexportrun",
+            ),
+        ),
+    ]
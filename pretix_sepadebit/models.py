@@ -1,7 +1,32 @@
+import gzip
+import hashlib
+import io
 from datetime import timedelta
 
 from django.db import models
+from django.utils.crypto import salted_hmac
 from django.utils.timezone import now
+from django.utils.translation import gettext_lazy as _
+
+
+def compress_xml(fileobj) -> dict:
+    """
+    Reads the XML document from the binary file ``fileobj`` in chunks and returns the values of the fields of
+    :class:`SepaExport` that store it.
+    """
+    buf = io.BytesIO()
+    checksum = hashlib.sha256()
+    size = 0
+    with gzip.GzipFile(fileobj=buf, mode="wb", mtime=0) as gz:
+        for chunk in iter(lambda: fileobj.read(64 * 1024), b""):
+            gz.write(chunk)
+            checksum.update(chunk)
+            size += len(chunk)
+    return {
+        "xml_gz": buf.getvalue(),
+        "xml_sha256": checksum.hexdigest(),
+        "xml_size": size,
+    }
 
 
 class SepaExport(models.Model):
@@ -19,14 +44,43 @@ class SepaExport(models.Model):
         null=True,
         blank=True,
     )
-    xmldata = models.TextField()
+    # The generated XML file, gzip-compressed, with the SHA-256 hash and size of the uncompressed file
+    xml_gz = models.BinaryField()
+    xml_sha256 = models.CharField(max_length=64)
+    xml_size = models.PositiveIntegerField()
     datetime = models.DateTimeField(auto_now_add=True)
     testmode = models.BooleanField(default=False)
     currency = models.CharField(max_length=9, blank=True)
+    run = models.ForeignKey(
+        "SepaExportRun",
+        related_name="exports",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+    )
 
     def is_reversible(self):
         return now() - self.datetime < timedelta(hours=48)
 
+    def open_xml(self):
+        """
+        Returns a binary file object with the uncompressed XML file.
+        """
+        return gzip.GzipFile(fileobj=io.BytesIO(bytes(self.xml_gz)), mode="rb")
+
+    def write_xml(self, fileobj):
+        for k, v in compress_xml(fileobj).items():
+            setattr(self, k, v)
+
+    @property
+    def xmldata(self) -> str:
+        with self.open_xml() as f:
+            return f.read().decode("utf-8")
+
+    @xmldata.setter
+    def xmldata(self, value: str):
+        self.write_xml(io.BytesIO(value.encode("utf-8")))
+
 
 class SepaExportOrder(models.Model):
     export = models.ForeignKey(SepaExport, on_delete=models.CASCADE)
@@ -47,3 +101,85 @@ class SepaDueDate(models.Model):
     date = models.DateField()
     remind_after = models.DateTimeField()
     reminded = models.BooleanField(default=False)
+
+
+class SepaBlocklistEntry(models.Model):
+    """
+    An IBAN or IBAN prefix blocked for all events of an organizer. Since a full IBAN is personal data, only an HMAC of
+    the prefix with the check digits removed is stored. Checking an IBAN therefore means looking up the HMACs of all
+    of its prefixes.
+
+    Prefixes are short and mostly consist of a well-known bank code, so a plain hash could be reversed by trying all
+    candidates. The HMAC is keyed with the ``SECRET_KEY`` of the installation and the organizer, so the entries can
+    not be reversed or compared across organizers from a copy of the database alone. They can be with the secret key,
+    so this is not a replacement for protecting it. Changing the secret key invalidates all entries, which then need
+    to be imported again.
+    """
+    organizer = models.ForeignKey(
+        "pretixbase.Organizer",
+        related_name="sepa_blocklist_entries",
+        on_delete=models.CASCADE,
+    )
+    prefix_hash = models.CharField(max_length=64)
+    datetime = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = (("organizer", "prefix_hash"),)
+
+    @staticmethod
+    def hash_prefix(organizer_id: int, prefix: str) -> str:
+        return salted_hmac(
+            "pretix_sepadebit.blocklist.{}".format(organizer_id), prefix, algorithm="sha256"
+        ).hexdigest()
+
+
+class SepaExportRun(models.Model):
+    """
+    One export of an organizer or an event, which groups all files it has produced. Scheduled exports are recorded
+    before they start, so the uniqueness constraints guarantee that every schedule runs only once per business day,
+    even if several workers try to start it at the same time. Exports started by hand are recorded once their files
+    have been saved.
+    """
+    STATE_RUNNING = "running"
+    STATE_DONE = "done"
+    STATE_NOTHING = "nothing"
+    STATE_ERROR = "error"
+    STATES = (
+        (STATE_RUNNING, _("running")),
+        (STATE_DONE, _("done")),
+        (STATE_NOTHING, _("nothing to export")),
+        (STATE_ERROR, _("failed")),
+    )
+
+    organizer = models.ForeignKey(
+        "pretixbase.Organizer",
+        related_name="sepa_export_runs",
+        on_delete=models.CASCADE,
+    )
+    event = models.ForeignKey(
+        "pretixbase.Event",
+        related_name="sepa_export_runs",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+    )
+    date = models.DateField()
+    started = models.DateTimeField(auto_now_add=True)
+    finished = models.DateTimeField(null=True, blank=True)
+    state = models.CharField(max_length=16, choices=STATES, default=STATE_RUNNING)
+    result = models.JSONField(default=dict)
+    scheduled = models.BooleanField(default=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["event", "date"],
+                condition=models.Q(event__isnull=False, scheduled=True),
+                name="pretix_sepadebit_run_event_date",
+            ),
+            models.UniqueConstraint(
+                fields=["organizer", "date"],
+                condition=models.Q(event__isnull=True, scheduled=True),
+                name="pretix_sepadebit_run_organizer_date",
+            ),
+        ]
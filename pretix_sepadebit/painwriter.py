@@ -0,0 +1,181 @@
+"""
+Incremental writer for pain.008 direct debit files.
+
+``sepaxml.SepaDD`` keeps the whole document as an element tree and serializes it at once, so a large export exists in
+memory several times over. :class:`Pain008Writer` produces the same document, but serializes every transaction as
+soon as it is added and spools it to a temporary file per batch (payment information block). Only the number of
+transactions and the control sum of every batch are kept in memory. Once all payments have been added,
+:meth:`Pain008Writer.write` writes the group header with the totals, followed by each batch, to a file.
+"""
+import datetime
+import shutil
+import tempfile
+import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from typing import BinaryIO
+
+from sepaxml.utils import (
+    ADDRESS_MAPPING, int_to_decimal_str, make_id, make_msg_id,
+)
+from text_unidecode import unidecode
+
+# Batches are kept in memory up to this size before they are moved to disk
+SPOOL_SIZE = 1024 * 1024
+
+# Versions of the pain.008 format that exports can be created in. These are the versions covered by the
+# implementation guidelines of the European Payments Council.
+SCHEMAS = (
+    "pain.008.001.02",
+    "pain.008.001.08",
+)
+
+
+def _sub(parent, tag, text=None):
+    el = ET.SubElement(parent, tag)
+    if text is not None:
+        el.text = text
+    return el
+
+
+def _address(parent, address):
+    if not address:
+        return
+    node = ET.Element("PstlAdr")
+    for key, tag in ADDRESS_MAPPING:
+        if address.get(key):
+            _sub(node, tag, address[key])
+    for line in address.get("lines", []):
+        _sub(node, "AdrLine", line)
+    if len(node):
+        parent.append(node)
+
+
+class _Batch:
+    def __init__(self):
+        self.spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_SIZE)
+        self.count = 0
+        self.total = 0
+
+
+class Pain008Writer:
+    """
+    Accepts the same configuration and payment dictionaries as ``sepaxml.SepaDD`` in batch mode.
+    """
+
+    def __init__(self, config: dict, schema: str = "pain.008.001.02"):
+        if schema not in SCHEMAS:
+            raise ValueError("Unsupported schema {}.".format(schema))
+        self.schema = schema
+        self.msg_id = make_msg_id()
+        self._config = dict(config)
+        self._config.setdefault("instrument", "CORE")
+        self._config["name"] = unidecode(self._config["name"])[:70]
+        self._batches = OrderedDict()
+
+    @property
+    def _bic_tag(self):
+        return "BIC" if self.schema == "pain.008.001.02" else "BICFI"
+
+    @property
+    def currency(self) -> str:
+        return self._config["currency"]
+
+    @property
+    def count(self) -> int:
+        return sum(b.count for b in self._batches.values())
+
+    @property
+    def total(self) -> int:
+        return sum(b.total for b in self._batches.values())
+
+    def add_payment(self, payment: dict):
+        if not isinstance(payment["amount"], int):
+            raise ValueError("Payment amount needs to be an integer number of cents.")
+        if not isinstance(payment["mandate_date"], datetime.date) or not isinstance(
+            payment["collection_date"], datetime.date
+        ):
+            raise ValueError("Mandate and collection date need to be dates.")
+
+        tx = ET.Element("DrctDbtTxInf")
+        _sub(_sub(tx, "PmtId"), "EndToEndId", payment.get("endtoend_id") or make_id(self._config["name"]))
+        amount = _sub(tx, "InstdAmt", int_to_decimal_str(payment["amount"]))
+        amount.set("Ccy", payment.get("currency", self._config["currency"]))
+        mandate = _sub(_sub(tx, "DrctDbtTx"), "MndtRltdInf")
+        _sub(mandate, "MndtId", payment["mandate_id"])
+        _sub(mandate, "DtOfSgntr", str(payment["mandate_date"]))
+        agent = _sub(_sub(tx, "DbtrAgt"), "FinInstnId")
+        if payment.get("BIC"):
+            _sub(agent, self._bic_tag, payment["BIC"])
+        else:
+            _sub(_sub(agent, "Othr"), "Id", "NOTPROVIDED")
+        debtor = _sub(tx, "Dbtr")
+        _sub(debtor, "Nm", unidecode(payment["name"])[:70])
+        _address(debtor, payment.get("address"))
+        _sub(_sub(_sub(tx, "DbtrAcct"), "Id"), "IBAN", payment["IBAN"])
+        _sub(_sub(tx, "RmtInf"), "Ustrd", unidecode(payment["description"])[:140])
+
+        key = (payment["type"], str(payment["collection_date"]))
+        if key not in self._batches:
+            self._batches[key] = _Batch()
+        batch = self._batches[key]
+        batch.spool.write(ET.tostring(tx, "utf-8", xml_declaration=False))
+        batch.count += 1
+        batch.total += payment["amount"]
+
+    def _payment_info_header(self, seq_type, collection_date, batch):
+        # Everything of the PmtInf element except the transactions and the closing tag
+        pmtinf = ET.Element("PmtInf")
+        _sub(pmtinf, "PmtInfId", make_id(self._config["name"]))
+        _sub(pmtinf, "PmtMtd", "DD")
+        _sub(pmtinf, "BtchBookg", "true")
+        _sub(pmtinf, "NbOfTxs", str(batch.count))
+        _sub(pmtinf, "CtrlSum", int_to_decimal_str(batch.total))
+        tp = _sub(pmtinf, "PmtTpInf")
+        _sub(_sub(tp, "SvcLvl"), "Cd", "SEPA")
+        _sub(_sub(tp, "LclInstrm"), "Cd", self._config["instrument"])
+        _sub(tp, "SeqTp", seq_type)
+        _sub(pmtinf, "ReqdColltnDt", collection_date)
+        creditor = _sub(pmtinf, "Cdtr")
+        _sub(creditor, "Nm", self._config["name"])
+        _address(creditor, self._config.get("address"))
+        _sub(_sub(_sub(pmtinf, "CdtrAcct"), "Id"), "IBAN", self._config["IBAN"])
+        agent = _sub(_sub(pmtinf, "CdtrAgt"), "FinInstnId")
+        if "BIC" in self._config:
+            _sub(agent, self._bic_tag, self._config["BIC"])
+        else:
+            _sub(_sub(agent, "Othr"), "Id", "NOTPROVIDED")
+        _sub(pmtinf, "ChrgBr", "SLEV")
+        other = _sub(_sub(_sub(_sub(pmtinf, "CdtrSchmeId"), "Id"), "PrvtId"), "Othr")
+        _sub(other, "Id", self._config["creditor_id"])
+        _sub(_sub(other, "SchmeNm"), "Prtry", "SEPA")
+        return ET.tostring(pmtinf, "utf-8", xml_declaration=False)[:-len(b"</PmtInf>")]
+
+    def _group_header(self):
+        header = ET.Element("GrpHdr")
+        _sub(header, "MsgId", self.msg_id)
+        _sub(header, "CreDtTm", datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%S"))
+        _sub(header, "NbOfTxs", str(self.count))
+        _sub(header, "CtrlSum", int_to_decimal_str(self.total))
+        party = _sub(header, "InitgPty")
+        _sub(party, "Nm", self._config["name"])
+        _sub(_sub(_sub(_sub(party, "Id"), "OrgId"), "Othr"), "Id", self._config["creditor_id"])
+        return ET.tostring(header, "utf-8", xml_declaration=False)
+
+    def write(self, out: BinaryIO):
+        """
+        Writes the complete document to the binary file ``out``. The writer can not be used any more afterwards.
+        """
+        out.write(b'<?xml version="1.0" encoding="UTF-8"?>')
+        out.write(
+            b'<Document xmlns="urn:iso:std:iso:20022:tech:xsd:' + self.schema.encode()
+            + b'" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"><CstmrDrctDbtInitn>'
+        )
+        out.write(self._group_header())
+        for (seq_type, collection_date), batch in self._batches.items():
+            out.write(self._payment_info_header(seq_type, collection_date, batch))
+            batch.spool.seek(0)
+            shutil.copyfileobj(batch.spool, out)
+            batch.spool.close()
+            out.write(b"</PmtInf>")
+        out.write(b"</CstmrDrctDbtInitn></Document>")
+        self._batches.clear()
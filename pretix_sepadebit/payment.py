@@ -1,8 +1,10 @@
 from typing import Union
 
+import json
 import logging
 from collections import OrderedDict
 from datetime import date, timedelta
+from functools import lru_cache
 from django import forms
 from django.conf import settings
 from django.core.exceptions import ValidationError
@@ -21,26 +23,61 @@ from pretix.base.models import Order, OrderPayment, OrderRefund, Quota
 from pretix.base.payment import (
     BasePaymentProvider, PaymentException, PaymentProviderForm,
 )
+from pretix.multidomain.urlreverse import eventreverse_absolute
 
-from pretix_sepadebit.models import SepaDueDate
+from pretix_sepadebit import bicdata
+from pretix_sepadebit.bankaccounts import bic_matches
+from pretix_sepadebit.biclookup import lookup_bic
+from pretix_sepadebit.models import SepaBlocklistEntry, SepaDueDate
 
 logger = logging.getLogger(__name__)
 
 
+def _strip_check_digits(iban):
+    return iban[:2] + iban[4:]
+
+
+@lru_cache(maxsize=64)
+def compile_blocklist(blocklist: str):
+    """
+    Turns the text of the ``iban_blocklist`` setting into a tuple of ``(length, prefixes)`` with the check digits
+    removed from all prefixes, so an IBAN can be checked with one set lookup per distinct prefix length. The result is
+    cached by the setting's value, so changing the setting automatically leads to a new matcher.
+    """
+    by_length = {}
+    for line in blocklist.splitlines():
+        prefix = _strip_check_digits(line.replace(" ", "").upper())
+        if prefix:
+            by_length.setdefault(len(prefix), set()).add(prefix)
+    return tuple((length, frozenset(prefixes)) for length, prefixes in sorted(by_length.items()))
+
+
+def is_blocklisted(iban: str, blocklist: str) -> bool:
+    iban = _strip_check_digits(iban.replace(" ", "").upper())  # Compare IBAN with blocklist ignoring the check digits
+    return any(iban[:length] in prefixes for length, prefixes in compile_blocklist(blocklist))
+
+
+def blocklist_hashes(iban: str, organizer):
+    """
+    Returns the hashes of all prefixes of ``iban`` as stored in the :class:`SepaBlocklistEntry` of ``organizer``.
+    """
+    iban = _strip_check_digits(iban.replace(" ", "").upper())
+    return [SepaBlocklistEntry.hash_prefix(organizer.pk, iban[:i]) for i in range(1, len(iban) + 1)]
+
+
+def is_blocklisted_by_organizer(iban: str, organizer) -> bool:
+    return SepaBlocklistEntry.objects.filter(
+        organizer=organizer, prefix_hash__in=blocklist_hashes(iban, organizer)
+    ).exists()
+
+
 class NotBlocklisted:
     def __init__(self, pp):
         self.pp = pp
 
     def __call__(self, value):
-        def _compare(iban, prefix):  # Compare IBAN with pretix ignoring the check digits
-            iban = iban[:2] + iban[4:]
-            prefix = prefix[:2] + prefix[4:]
-            return iban.startswith(prefix)
-
-        if any(
-            _compare(value.replace(" ", ""), b)
-            for b in (self.pp.settings.iban_blocklist or "").splitlines()
-            if b
+        if is_blocklisted(value, self.pp.settings.iban_blocklist or "") or is_blocklisted_by_organizer(
+            value, self.pp.event.organizer
         ):
             raise ValidationError(
                 _(
@@ -53,29 +90,21 @@ class NotBlocklisted:
 
 class SEPAPaymentProviderForm(PaymentProviderForm):
     def clean(self):
-        from .bicdata import DATA
-
         d = super().clean()
 
         if d.get("iban"):
-            iban_without_checksum = d["iban"][0:2] + "XX" + d["iban"][4:]
-            for k in range(6, 15):
-                if iban_without_checksum[:k] in DATA:
-                    correct_bic = DATA[iban_without_checksum[:k]]
-                    input_bic = d.get("bic", "")
-                    if len(input_bic) < len(correct_bic):
-                        input_bic += "XXX"
-                    bic_match = correct_bic == input_bic or (
-                        correct_bic.startswith("COBADE")
-                        and input_bic.startswith("COBADE")
-                    )  # https://github.com/pretix/pretix-sepadebit/issues/34
-                    if not bic_match:
-                        raise ValidationError(
-                            _(
-                                "The BIC number {bic} does not match the IBAN. Please double, check your banking "
-                                "details. According to our data, the correct BIC would be {correctbic}."
-                            ).format(bic=input_bic, correctbic=correct_bic)
-                        )
+            correct_bic = lookup_bic(d["iban"])
+            if correct_bic:
+                input_bic = d.get("bic", "")
+                if len(input_bic) < len(correct_bic):
+                    input_bic += "XXX"
+                if not bic_matches(correct_bic, input_bic):
+                    raise ValidationError(
+                        _(
+                            "The BIC number {bic} does not match the IBAN. Please double, check your banking "
+                            "details. According to our data, the correct BIC would be {correctbic}."
+                        ).format(bic=input_bic, correctbic=correct_bic)
+                    )
 
         return d
 
@@ -205,7 +234,8 @@ class SepaDebit(BasePaymentProvider):
                                 "e.g. if you had lots of failed payments already from a specific person. You can also list "
                                 'country codes such as "GB" if you never want to accept IBANs from a specific country. '
                                 "The check digits will be ignored for comparison, so you can e.g. ban DE0012345 to ban "
-                                "all German IBANs with the bank identifier starting with 12345."
+                                "all German IBANs with the bank identifier starting with 12345. Entries of the "
+                                "organizer-wide blocklist apply in addition to this list."
                             ),
                             _(
                                 "Adding whole countries to your blocklist is considered SEPA discrimination, illegal in "
@@ -254,7 +284,9 @@ class SepaDebit(BasePaymentProvider):
                         label=_("Pre-notification mail body"),
                         help_text=_(
                             "The body of the notification email. "
-                            "This email is only sent if the earliest debit due date option is used."
+                            "This email is only sent if the earliest debit due date option is used. "
+                            "{due_date} is the day the debit will be collected: the due date, or the next bank "
+                            "business day if the due date is a weekend day or a TARGET2 holiday."
                         ),
                         required=False,
                         widget=I18nTextarea,
@@ -369,12 +401,15 @@ class SepaDebit(BasePaymentProvider):
 
     def payment_form_render(self, request) -> str:
         template = get_template("pretix_sepadebit/checkout_payment_form.html")
+        dataset = bicdata.load()
         ctx = {
             "request": request,
             "event": self.event,
             "settings": self.settings,
             "form": self.payment_form(request),
             "date": self._due_date(),
+            "bic_url": eventreverse_absolute(False, "plugins:pretix_sepadebit:bic"),
+            "bic_key_lengths": json.dumps({c: dataset.key_length(c) for c in dataset.countries}),
         }
         return template.render(ctx)
 
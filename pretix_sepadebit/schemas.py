@@ -0,0 +1,138 @@
+"""
+Validation of generated files against the XSD schemas shipped with sepaxml.
+
+Compiling a schema takes a lot longer than validating a typical file against it, so every schema is only compiled
+once per process and then reused for all files. Validation is CPU-bound, so :func:`validate_files` spreads large
+batches of files across a pool of processes. Its workers compile all schemas when they start, since starting a worker
+takes far longer than validating a small file. Every process has at most one pool, which is kept for consecutive
+batches but shut down once it has not been used for ``POOL_IDLE_TIMEOUT`` seconds, as well as when the process exits,
+so idle web and task workers do not keep extra interpreters around. This module must not depend on Django, since the
+pool processes are started fresh.
+"""
+import atexit
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from typing import List, Sequence, Tuple
+
+from sepaxml import validation
+
+from pretix_sepadebit.painwriter import SCHEMAS
+
+logger = logging.getLogger(__name__)
+
+# Batches of files smaller than this are validated in the current process. Serial validation takes about as long
+# for 1 MiB as starting the pool and compiling the schemas in its workers.
+PARALLEL_MIN_SIZE = 4 * 1024 * 1024
+
+POOL_SIZE = os.cpu_count() or 1
+POOL_IDLE_TIMEOUT = 300
+
+_pool = None
+_pool_pid = None
+_pool_users = 0
+_pool_timer = None
+_pool_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def get_schema(name: str):
+    """
+    Returns the compiled ``xmlschema.XMLSchema`` for a schema name such as ``pain.008.001.02``.
+    """
+    import xmlschema  # xmlschema does some weird monkeypatching in etree, if we import it globally, things fail
+
+    return xmlschema.XMLSchema(
+        os.path.join(os.path.dirname(validation.__file__), "schemas", name + ".xsd")
+    )
+
+
+def validation_errors(name: str, source) -> List[str]:
+    """
+    Validates ``source``, which can be anything ``xmlschema`` accepts, e.g. a string or a file object, and returns
+    the list of errors.
+    """
+    return [str(e) for e in get_schema(name).iter_errors(source)]
+
+
+def _warm_up(names):
+    for name in names:
+        get_schema(name)
+
+
+def _acquire_pool() -> ProcessPoolExecutor:
+    global _pool, _pool_pid, _pool_users
+    with _pool_lock:
+        # Forked processes must not use the pool of their parent
+        if _pool is None or _pool_pid != os.getpid():
+            _pool = ProcessPoolExecutor(
+                max_workers=POOL_SIZE,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_warm_up,
+                initargs=(SCHEMAS,),
+            )
+            _pool_pid = os.getpid()
+            _pool_users = 0
+        if _pool_timer is not None:
+            _pool_timer.cancel()
+        _pool_users += 1
+        return _pool
+
+
+def _release_pool(broken=False):
+    global _pool_users, _pool_timer
+    with _pool_lock:
+        _pool_users -= 1
+        if _pool_users == 0:
+            _pool_timer = threading.Timer(0 if broken else POOL_IDLE_TIMEOUT, shutdown_pool, kwargs={"idle_only": True})
+            _pool_timer.daemon = True
+            _pool_timer.start()
+
+
+def shutdown_pool(idle_only=False):
+    """
+    Shuts down the pool of the current process, if there is one. With ``idle_only``, the pool is kept if it is in
+    use again.
+    """
+    global _pool, _pool_timer
+    with _pool_lock:
+        if _pool is None or _pool_pid != os.getpid() or (idle_only and _pool_users):
+            return
+        pool, _pool = _pool, None
+        if _pool_timer is not None:
+            _pool_timer.cancel()
+            _pool_timer = None
+    pool.shutdown(wait=True, cancel_futures=True)
+
+
+atexit.register(shutdown_pool)
+
+
+def validate_files(files: Sequence[Tuple[str, str]], parallel: bool = True) -> List[List[str]]:
+    """
+    Validates a sequence of ``(schema name, file path)`` pairs and returns the list of errors of every file, in the
+    same order. If ``parallel`` is set and the files are larger than ``PARALLEL_MIN_SIZE`` in total, they are
+    validated in the pool of the process, unless we are running in a daemonic process that is not allowed to start
+    child processes or the pool can not be started, in which case they are validated one by one.
+    """
+    if (
+        parallel
+        and POOL_SIZE > 1
+        and len(files) > 1
+        and not multiprocessing.current_process().daemon
+        and sum(os.path.getsize(path) for name, path in files) >= PARALLEL_MIN_SIZE
+    ):
+        pool = _acquire_pool()
+        broken = False
+        try:
+            return list(pool.map(validation_errors, *zip(*files)))
+        except (OSError, BrokenProcessPool):
+            broken = True
+            logger.exception("Could not validate files in parallel, falling back to serial validation.")
+        finally:
+            _release_pool(broken)
+    return [validation_errors(name, path) for name, path in files]
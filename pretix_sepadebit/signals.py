@@ -1,5 +1,7 @@
-from datetime import date
+import io
+from datetime import date, time
 from decimal import Decimal
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.urls import resolve, reverse
 from django.utils.timezone import now
@@ -10,6 +12,10 @@ from pretix.base.email import (
     SimpleFunctionalMailTextPlaceholder, get_email_context,
 )
 from pretix.base.i18n import language
+from pretix.base.models import (
+    Event, Event_SettingsStore, GlobalSettingsObject_SettingsStore,
+    Organizer_SettingsStore,
+)
 from pretix.base.models.orders import OrderPayment
 from pretix.base.settings import settings_hierarkey
 from pretix.base.shredder import BaseDataShredder
@@ -21,8 +27,13 @@ from pretix.base.signals import (
 )
 from pretix.base.templatetags.money import money_filter
 from pretix.control.signals import nav_event, nav_organizer
+from pretix.helpers.periodic import minimum_interval
 
+from .bankdays import next_business_day
+from .creditors import SETTINGS_KEYS, invalidate_creditor_configs
+from .models import compress_xml
 from .payment import SepaDebit, SepaDueDate
+from .tasks import start_scheduled_exports
 
 
 @receiver(register_payment_providers, dispatch_uid="payment_sepadebit")
@@ -84,7 +95,20 @@ def control_nav_orga_sepadebit(sender, request=None, **kwargs):
                 url.namespace == "plugins:pretix_sepadebit" and url.url_name == "export"
             ),
             "icon": "bank",
-        }
+        },
+        {
+            "label": _("SEPA blocklist"),
+            "url": reverse(
+                "plugins:pretix_sepadebit:blocklist",
+                kwargs={
+                    "organizer": request.organizer.slug,
+                },
+            ),
+            "active": (
+                url.namespace == "plugins:pretix_sepadebit" and url.url_name == "blocklist"
+            ),
+            "icon": "ban",
+        },
     ]
 
 
@@ -108,7 +132,7 @@ def register_csv_multievent(sender, **kwargs):
 DueDatePlaceholder = SimpleFunctionalMailTextPlaceholder(
     "due_date",
     ["sepadebit_payment"],
-    lambda sepadebit_payment: sepadebit_payment.sepadebit_due.date,
+    lambda sepadebit_payment: next_business_day(sepadebit_payment.sepadebit_due.date),
     sample=date.today(),
 )
 AccountHolderPlaceholder = SimpleFunctionalMailTextPlaceholder(
@@ -219,6 +243,28 @@ def send_payment_reminders(sender, **kwargs):
                 due_date.save()
 
 
+@receiver(signal=periodic_task, dispatch_uid="payment_sepadebit_scheduled_exports")
+@minimum_interval(minutes_after_success=5)
+def scheduled_exports(sender, **kwargs):
+    with scopes_disabled():
+        start_scheduled_exports()
+
+
+@receiver([post_save, post_delete], sender=Event_SettingsStore, dispatch_uid="payment_sepadebit_settings_event")
+@receiver([post_save, post_delete], sender=Organizer_SettingsStore, dispatch_uid="payment_sepadebit_settings_orga")
+@receiver(
+    [post_save, post_delete], sender=GlobalSettingsObject_SettingsStore, dispatch_uid="payment_sepadebit_settings_global"
+)
+def invalidate_creditor_settings(sender, instance, **kwargs):
+    if instance.key in SETTINGS_KEYS:
+        invalidate_creditor_configs()
+
+
+@receiver(post_save, sender=Event, dispatch_uid="payment_sepadebit_event_saved")
+def invalidate_creditor_event(sender, instance, **kwargs):
+    invalidate_creditor_configs(instance)
+
+
 @receiver(
     signal=logentry_display,
     dispatch_uid="payment_sepadebit_send_payment_reminders_logentry",
@@ -232,6 +278,19 @@ def payment_reminder_logentry(sender, logentry, **kwargs):
     )
 
 
+@receiver(
+    signal=logentry_display,
+    dispatch_uid="payment_sepadebit_blocklist_logentry",
+)
+def blocklist_logentry(sender, logentry, **kwargs):
+    if logentry.action_type != "pretix_sepadebit.blocklist.imported":
+        return
+
+    if logentry.parsed_data.get("replace"):
+        return _("The SEPA blocklist has been replaced with {num} entries.").format(num=logentry.parsed_data["added"])
+    return _("{num} entries have been added to the SEPA blocklist.").format(num=logentry.parsed_data["added"])
+
+
 class PaymentLogsShredder(BaseDataShredder):
     verbose_name = _("SEPA debit history")
     identifier = "sepadebit_history"
@@ -250,7 +309,7 @@ class PaymentLogsShredder(BaseDataShredder):
             )
 
     def shred_data(self):
-        self.event.sepa_exports.update(xmldata="<shredded></shredded>")
+        self.event.sepa_exports.update(**compress_xml(io.BytesIO(b"<shredded></shredded>")))
 
 
 @receiver(register_data_shredders, dispatch_uid="sepadebit_shredders")
@@ -288,3 +347,8 @@ settings_hierarkey.add_default(
 
 
 settings_hierarkey.add_default("payment_sepadebit_earliest_due_date", None, date)
+settings_hierarkey.add_default("payment_sepadebit_export_max_transactions", None, int)
+settings_hierarkey.add_default("payment_sepadebit_export_max_amount", None, Decimal)
+settings_hierarkey.add_default("payment_sepadebit_scheduled_export", "False", bool)
+settings_hierarkey.add_default("payment_sepadebit_scheduled_export_time", "10:00", time)
+settings_hierarkey.add_default("payment_sepadebit_export_schema", "pain.008.001.02", str)
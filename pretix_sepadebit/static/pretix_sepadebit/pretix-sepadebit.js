@@ -0,0 +1,38 @@
+/*globals $*/
+$(function () {
+    "use strict";
+
+    var $iban = $("#id_payment_sepadebit-iban"),
+        $bic = $("#id_payment_sepadebit-bic"),
+        $container = $iban.closest("[data-sepadebit-bic-url]"),
+        url = $container.attr("data-sepadebit-bic-url"),
+        keyLengths = JSON.parse($container.attr("data-sepadebit-bic-key-lengths") || "{}"),
+        lastPrefix = null,
+        lastFilled = null;
+
+    if (!$iban.length || !$bic.length || !url) {
+        return;
+    }
+
+    $iban.on("input change", function () {
+        // The country code and the bank identifier are enough to find the BIC. Neither the check digits nor any
+        // part of the account number are sent, so all customers of a bank share the same, cacheable URL.
+        var iban = $iban.val().replace(/\s/g, "").toUpperCase(),
+            keyLength = keyLengths[iban.substr(0, 2)],
+            prefix = iban.substr(0, 2) + "XX" + iban.substr(4, keyLength);
+        if (!keyLength || iban.length < 4 + keyLength || prefix === lastPrefix) {
+            return;
+        }
+        lastPrefix = prefix;
+        $.getJSON(url, {iban: prefix}, function (data) {
+            if (prefix !== lastPrefix) {
+                return;
+            }
+            // Never overwrite a BIC the customer entered themselves
+            if (data.bic && ($bic.val() === "" || $bic.val() === lastFilled)) {
+                $bic.val(data.bic);
+                lastFilled = data.bic;
+            }
+        });
+    });
+});
@@ -0,0 +1,524 @@
+import datetime
+import json
+import logging
+import os
+import tempfile
+from collections import defaultdict
+from decimal import Decimal
+from django.db import IntegrityError, transaction
+from django.db.models import Count, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Coalesce
+from django.utils.timezone import now
+from django.utils.translation import gettext as _
+from django_scopes import scopes_disabled
+from functools import reduce
+from operator import or_
+from pretix.base.i18n import language
+from pretix.base.models import (
+    Event, Event_SettingsStore, LogEntry, Order, OrderPayment, OrderRefund,
+    Organizer, Organizer_SettingsStore,
+)
+from pretix.base.services.tasks import OrganizerTask, ProfiledEventTask
+from pretix.celery_app import app
+
+from pretix_sepadebit.bankdays import is_business_day, next_business_day
+from pretix_sepadebit.creditors import get_creditor_configs
+from pretix_sepadebit.models import (
+    SepaExport, SepaExportOrder, SepaExportRun,
+)
+from pretix_sepadebit.painwriter import Pain008Writer
+from pretix_sepadebit.schemas import validate_files
+
+logger = logging.getLogger(__name__)
+
+
+class ExportError(Exception):
+    pass
+
+
+# Payments without bank account information, which are failed instead of being exported. The ``info_data`` setter
+# stores an empty dictionary as "{}".
+MISSING_INFO = Q(info__isnull=True) | Q(info__in=("", "{}"))
+
+
+def _with_refund_amount(qs):
+    return qs.annotate(
+        refund_amount=Coalesce(
+            Subquery(
+                OrderRefund.objects.filter(
+                    payment=OuterRef("pk"),
+                    state=OrderRefund.REFUND_STATE_DONE,
+                )
+                .order_by()
+                .values("payment")
+                .annotate(s=Sum("amount"))
+                .values("s")
+            ),
+            Decimal("0.00"),
+        ),
+    )
+
+
+def get_unexported_for_event(event):
+    today = now().astimezone(event.timezone).date()
+    latest_export_due_date = today + datetime.timedelta(
+        days=int(event.settings.payment_sepadebit_prenotification_days or 0)
+    )
+
+    return _with_refund_amount(
+        OrderPayment.objects.filter(
+            order__event=event,
+            provider="sepadebit",
+            state=OrderPayment.PAYMENT_STATE_CONFIRMED,
+            order__testmode=event.testmode,
+            sepaexportorder__isnull=True,
+            sepadebit_due__date__lte=latest_export_due_date,
+        )
+    )
+
+
+def get_unexported_for_organizer(organizer):
+    q_list = []
+    today = now().astimezone(organizer.timezone).today()
+
+    configs = get_creditor_configs(
+        Event.objects.filter(organizer=organizer, plugins__contains="pretix_sepadebit").values_list("pk", flat=True)
+    )
+    for event_id, config in configs.items():
+        try:
+            latest_export_due_date = today + datetime.timedelta(
+                days=int(config["prenotification_days"] or 0)
+            )
+        except (TypeError, ValueError):
+            continue
+
+        q_list.append(
+            Q(order__event=event_id, sepadebit_due__date__lte=latest_export_due_date)
+        )
+
+    if not q_list:
+        return OrderPayment.objects.none()
+
+    return _with_refund_amount(
+        OrderPayment.objects.filter(
+            provider="sepadebit",
+            state=OrderPayment.PAYMENT_STATE_CONFIRMED,
+            order__testmode=False,
+            sepaexportorder__isnull=True,
+        )
+    ).filter(reduce(or_, q_list))
+
+
+def _resolve_collection_dates(groups, events):
+    today = {}
+    plan = {}
+    for event_id, due_date in groups:
+        tz = events[event_id].timezone
+        if tz not in today:
+            today[tz] = now().astimezone(tz).date()
+        plan[event_id, due_date] = next_business_day(max(today[tz], due_date))
+    return plan
+
+
+def plan_collection_dates(payments):
+    """
+    Returns a dictionary that maps every combination of event ID and due date among ``payments`` to the date on which
+    these debits will be collected: the due date, but not before today in the timezone of the event, moved to the
+    next business day. The payments are grouped in the database, so this does not depend on the number of payments.
+    """
+    groups = list(payments.order_by().values_list("order__event", "sepadebit_due__date").distinct())
+    events = Event.objects.in_bulk({event_id for event_id, due_date in groups})
+    return _resolve_collection_dates(groups, events)
+
+
+def preview_exports(payments, mode):
+    """
+    Returns the number of debits and their total amount per creditor account, currency and collection date that an
+    export of ``payments`` in the given mode would contain, as a list of dictionaries. Payments and refunds are
+    aggregated in the database, no payment objects or files are created.
+    """
+    payments = payments.order_by().exclude(MISSING_INFO)
+    rows = list(
+        payments.values("order__event", "sepadebit_due__date").annotate(count=Count("id"), total=Sum("amount"))
+    )
+    refunds = {
+        (r["payment__order__event"], r["payment__sepadebit_due__date"]): r["total"]
+        for r in OrderRefund.objects.filter(
+            payment__in=payments.values("pk"), state=OrderRefund.REFUND_STATE_DONE
+        ).order_by().values("payment__order__event", "payment__sepadebit_due__date").annotate(total=Sum("amount"))
+    }
+    events = Event.objects.in_bulk({r["order__event"] for r in rows})
+    plan = _resolve_collection_dates([(r["order__event"], r["sepadebit_due__date"]) for r in rows], events)
+    latest_collection_date = max(plan.values(), default=None)
+    configs = {pk: dict(c["config"]) for pk, c in get_creditor_configs(events).items()}
+
+    preview = defaultdict(lambda: {"count": 0, "total": Decimal("0.00")})
+    for r in rows:
+        key = (r["order__event"], r["sepadebit_due__date"])
+        config = configs[r["order__event"]]
+        line = preview[
+            config["name"],
+            config["IBAN"],
+            config["currency"],
+            latest_collection_date if mode == "move" else plan[key],
+        ]
+        line["count"] += r["count"]
+        line["total"] += r["total"] - refunds.get(key, Decimal("0.00"))
+
+    return [
+        {
+            "creditor_name": name,
+            "creditor_iban": iban,
+            "currency": currency,
+            "collection_date": collection_date,
+            **line,
+        }
+        for (name, iban, currency, collection_date), line in sorted(
+            preview.items(), key=lambda i: (i[0][3], i[0][0] or "", i[0][1] or "", i[0][2])
+        )
+    ]
+
+
+# Number of payments that are fetched from the database at once during an export
+CHUNK_SIZE = 1000
+
+
+def _iter_chunked(payments):
+    """
+    Iterates over the fields of ``payments`` that are needed to build an export, ordered by ID, in chunks of
+    ``CHUNK_SIZE`` rows. Every chunk is selected by the last ID of the previous one, so no chunk becomes slower when
+    payments before it have been exported in the meantime.
+
+    The payments are locked until the end of the surrounding transaction. Payments that are locked by a concurrent
+    export are skipped, as are payments that a concurrent export has finished with while we were waiting for a chunk.
+    """
+    last_pk = 0
+    while True:
+        chunk = list(
+            payments.filter(pk__gt=last_pk).order_by("pk").select_for_update(skip_locked=True, of=("self",)).values(
+                "pk", "local_id", "amount", "refund_amount", "info", "migrated", "created", "order", "order__code",
+                "order__datetime", "order__event", "order__event__slug", "sepadebit_due__date",
+            )[:CHUNK_SIZE]
+        )
+        if not chunk:
+            return
+        last_pk = chunk[-1]["pk"]
+        exported = set(
+            SepaExportOrder.objects.filter(payment__in=[p["pk"] for p in chunk]).values_list("payment", flat=True)
+        )
+        yield from (p for p in chunk if p["pk"] not in exported)
+
+
+def _fail_missing_info(payments):
+    """
+    Marks the given payments, which lack the bank account information, as failed and their orders as pending again.
+    Returns the event slugs and codes of the affected orders.
+    """
+    if not payments:
+        return []
+
+    with transaction.atomic():
+        OrderPayment.objects.filter(pk__in=[p["pk"] for p in payments]).update(
+            state=OrderPayment.PAYMENT_STATE_FAILED
+        )
+        orders = Order.objects.select_related("event").in_bulk({p["order"] for p in payments})
+        Order.objects.filter(pk__in=orders.keys()).update(status=Order.STATUS_PENDING, last_modified=now())
+        LogEntry.bulk_create_and_postprocess([
+            orders[p["order"]].log_action(
+                "pretix.event.order.payment.failed",
+                data={
+                    "local_id": p["local_id"],
+                    "provider": "sepadebit",
+                    "message": "Bank account information is missing, the payment can not be exported.",
+                },
+                save=False,
+            )
+            for p in payments
+        ])
+    return [{"event": o.event.slug, "code": o.code} for o in orders.values()]
+
+
+def get_export_options(settings_holder):
+    max_amount = settings_holder.settings.payment_sepadebit_export_max_amount
+    return {
+        "max_transactions": settings_holder.settings.payment_sepadebit_export_max_transactions,
+        "max_amount": int(max_amount * 100) if max_amount else None,
+        "schema": settings_holder.settings.payment_sepadebit_export_schema,
+    }
+
+
+@transaction.atomic
+def generate_exports(payments, mode, event=None, organizer=None, set_progress=None, max_transactions=None,
+                     max_amount=None, schema="pain.008.001.02", run=None):
+    """
+    Creates the export files for the given payments, which need to be annotated with ``refund_amount``. Exactly one
+    of ``event`` and ``organizer`` needs to be given as the owner of the new exports. The payments are read in chunks
+    and only their amounts and the IDs of the payments and orders are kept in memory while the files are built.
+
+    ``mode`` is one of ``split`` (one file per collection date), ``move`` (all debits are collected on the latest
+    collection date) and ``mix`` (one file with the correct collection dates). Files with more than
+    ``max_transactions`` debits or a total of more than ``max_amount`` cents are split into several files, in the
+    order of the payment IDs. The files are created in the pain.008 version ``schema`` and validated against it. If
+    any part of a split file does not validate, none of its parts are saved. Payments without bank account
+    information are marked as failed. All new exports are grouped in ``run``, or in a new :class:`SepaExportRun` if
+    none is given. Returns a dictionary with the IDs of the new exports and their run, the validation errors of files
+    that have been skipped and the orders of the failed payments.
+
+    All of this happens in one transaction that locks the exported payments, so concurrent exports of the same
+    payments split them between each other instead of debiting them twice.
+    """
+    set_progress = set_progress or (lambda value: None)
+    valid_payments = defaultdict(list)
+    files = defaultdict(list)
+    plan = plan_collection_dates(payments)
+    if not plan:
+        raise ExportError(_("No valid orders have been found."))
+
+    configs = get_creditor_configs({event_id for event_id, due_date in plan})
+    total_count = payments.count()
+    latest_collection_date = max(plan.values())
+    missing_info = []
+    for i, payment in enumerate(_iter_chunked(payments)):
+        plan_key = (payment["order__event"], payment["sepadebit_due__date"])
+        if plan_key not in plan:
+            # Payment became exportable after the plan was made, it will be part of the next export
+            continue
+
+        info_data = json.loads(payment["info"]) if payment["info"] else {}
+        if not info_data:
+            # Should not happen
+            missing_info.append(payment)
+            continue
+
+        if mode == "move":
+            collection_date = latest_collection_date
+        else:
+            collection_date = plan[plan_key]
+        remaining_amount = payment["amount"] - payment["refund_amount"]
+        payment_dict = {
+            "name": info_data["account"],
+            "IBAN": info_data["iban"],
+            "BIC": info_data["bic"],
+            "amount": int(remaining_amount * 100),
+            "type": "OOFF",
+            "collection_date": collection_date,
+            "mandate_id": info_data["reference"],
+            "mandate_date": (
+                payment["order__datetime"] if payment["migrated"] else payment["created"]
+            ).date(),
+            "description": _("Event ticket {event}-{code}").format(
+                event=payment["order__event__slug"].upper(), code=payment["order__code"]
+            ),
+        }
+
+        config = configs[payment["order__event"]]["config"]
+        if mode == "split":
+            key = (config, collection_date)
+        else:
+            key = config
+
+        parts = files[key]
+        if not parts or (
+            parts[-1].count and (
+                (max_transactions and parts[-1].count >= max_transactions)
+                or (max_amount and parts[-1].total + payment_dict["amount"] > max_amount)
+            )
+        ):
+            parts.append(Pain008Writer(dict(config), schema=schema))
+        file = parts[-1]
+        file.add_payment(payment_dict)
+        valid_payments[file].append((payment["order"], payment["pk"], remaining_amount))
+
+        if i % max(10, total_count // 100) == 0:
+            set_progress(round(i / max(total_count, 1) * 50, 2))
+
+    failed_orders = _fail_missing_info(missing_info)
+    if not valid_payments:
+        if failed_orders:
+            return {"exports": [], "run": None, "errors": [], "failed_orders": failed_orders}
+        raise ExportError(_("No valid orders have been found."))
+
+    # Write all files first and validate them in parallel, before we touch the database
+    all_files = [f for parts in files.values() for f in parts]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        paths = {}
+        for i, f in enumerate(all_files):
+            paths[f] = os.path.join(tmpdir, f"{i}.xml")
+            with open(paths[f], "wb") as tmp:
+                f.write(tmp)
+        set_progress(60)
+        file_errors = dict(zip(all_files, validate_files([(f.schema, paths[f]) for f in all_files])))
+        set_progress(90)
+
+        exports = []
+        errors = []
+        with transaction.atomic():
+            for parts in files.values():
+                errs = [e for f in parts for e in file_errors[f]]
+                if errs:
+                    errors.append(
+                        _(
+                            "The generated file did not validate for the following reasons. "
+                            "Please contact pretix support for more information.\n{}"
+                        ).format("\n".join(errs))
+                    )
+                    continue
+
+                for f in parts:
+                    if run is None:
+                        holder = event or organizer
+                        run = SepaExportRun.objects.create(
+                            organizer=event.organizer if event else organizer,
+                            event=event,
+                            date=now().astimezone(holder.timezone).date(),
+                            scheduled=False,
+                            state=SepaExportRun.STATE_DONE,
+                            finished=now(),
+                        )
+                    if event:
+                        exp = SepaExport(event=event)
+                        exp.testmode = event.testmode
+                    else:
+                        exp = SepaExport(organizer=organizer)
+                        exp.testmode = False
+                    with open(paths[f], "rb") as tmp:
+                        exp.write_xml(tmp)
+                    exp.currency = f.currency
+                    exp.run = run
+                    exp.save()
+                    SepaExportOrder.objects.bulk_create(
+                        [
+                            SepaExportOrder(
+                                order_id=order_id,
+                                payment_id=payment_id,
+                                export=exp,
+                                amount=amount,
+                            )
+                            for order_id, payment_id, amount in valid_payments[f]
+                        ]
+                    )
+                    exports.append(exp.pk)
+        set_progress(100)
+
+    return {
+        "exports": exports,
+        "run": run.pk if exports else None,
+        "errors": errors,
+        "failed_orders": failed_orders,
+    }
+
+
+def _progress_setter(task):
+    def set_progress(value):
+        if not task.request.called_directly:
+            task.update_state(state="PROGRESS", meta={"value": value})
+
+    return set_progress
+
+
+@app.task(base=ProfiledEventTask, bind=True, throws=(ExportError,))
+def export_event(self, event: Event, mode: str, locale: str = None):
+    with language(locale or event.settings.locale):
+        return generate_exports(
+            get_unexported_for_event(event), mode, event=event, set_progress=_progress_setter(self),
+            **get_export_options(event)
+        )
+
+
+@app.task(base=OrganizerTask, bind=True, throws=(ExportError,))
+def export_organizer(self, organizer, mode: str, locale: str = None):
+    with language(locale or organizer.settings.locale):
+        return generate_exports(
+            get_unexported_for_organizer(organizer), mode, organizer=organizer, set_progress=_progress_setter(self),
+            **get_export_options(organizer)
+        )
+
+
+def _scheduled_holders():
+    organizers = Organizer.objects.filter(
+        pk__in=Organizer_SettingsStore.objects.filter(key="payment_sepadebit_scheduled_export", value="True").values(
+            "object"
+        ),
+        plugins__contains="pretix_sepadebit",
+    )
+    events = Event.objects.filter(
+        pk__in=Event_SettingsStore.objects.filter(key="payment_sepadebit_scheduled_export", value="True").values(
+            "object"
+        ),
+        plugins__contains="pretix_sepadebit",
+    ).select_related("organizer")
+    return [(o, None) for o in organizers] + [(e.organizer, e) for e in events]
+
+
+def start_scheduled_exports():
+    """
+    Starts the scheduled export of every organizer and event that has enabled it, if it is a business day in its
+    timezone, the configured time has passed and the export has not run today yet. This is safe to be called by
+    several workers at the same time: every run is recorded as a :class:`SepaExportRun` before it is started, and
+    only one of them can record the run of a schedule on a given day.
+    """
+    current = now()
+    for organizer, event in _scheduled_holders():
+        holder = event or organizer
+        local = current.astimezone(holder.timezone)
+        if not is_business_day(local.date()):
+            continue
+        if local.time() < holder.settings.payment_sepadebit_scheduled_export_time:
+            continue
+        if SepaExportRun.objects.filter(organizer=organizer, event=event, date=local.date(), scheduled=True).exists():
+            continue
+
+        try:
+            with transaction.atomic():
+                run = SepaExportRun.objects.create(organizer=organizer, event=event, date=local.date())
+        except IntegrityError:
+            # Another worker has just started the same run
+            continue
+        run_export.apply_async(args=(run.pk,))
+
+
+@app.task()
+@scopes_disabled()
+def run_export(run: int, mode: str = None, schema: str = None):
+    """
+    Performs the export that has been recorded as the :class:`SepaExportRun` with the ID ``run`` and stores its
+    outcome in the run. ``mode`` and ``schema`` default to the settings of the event or organizer.
+    """
+    run = SepaExportRun.objects.select_related("organizer", "event").get(pk=run)
+    holder = run.event or run.organizer
+    if run.event:
+        payments = get_unexported_for_event(run.event)
+    else:
+        payments = get_unexported_for_organizer(run.organizer)
+    options = get_export_options(holder)
+    if schema:
+        options["schema"] = schema
+
+    try:
+        with language(holder.settings.locale):
+            result = generate_exports(
+                payments,
+                mode or holder.settings.get("payment_sepadebit_export_mode", "split"),
+                event=run.event,
+                organizer=None if run.event else run.organizer,
+                run=run,
+                **options
+            )
+    except ExportError as e:
+        run.state = SepaExportRun.STATE_NOTHING
+        run.result = {"exports": [], "run": None, "errors": [str(e)], "failed_orders": []}
+    except Exception:
+        logger.exception("SEPA export run failed")
+        run.state = SepaExportRun.STATE_ERROR
+        raise
+    else:
+        if result["errors"]:
+            run.state = SepaExportRun.STATE_ERROR
+        elif result["exports"]:
+            run.state = SepaExportRun.STATE_DONE
+        else:
+            run.state = SepaExportRun.STATE_NOTHING
+        run.result = result
+    finally:
+        run.finished = now()
+        run.save()
@@ -0,0 +1,73 @@
+import pytest
+from datetime import timedelta
+from django.utils.timezone import now
+from django_scopes import scopes_disabled
+from pretix.base.models import Event, Order, OrderPayment, Organizer, User
+
+from pretix_sepadebit.models import SepaDueDate
+
+
+@pytest.fixture
+def event():
+    o = Organizer.objects.create(name="Dummy", slug="dummy", plugins="pretix_sepadebit")
+    event = Event.objects.create(
+        organizer=o,
+        name="Dummy",
+        slug="dummy",
+        date_from=now(),
+        plugins="pretix_sepadebit",
+        currency="EUR",
+    )
+    event.settings.set("payment_sepadebit_creditor_name", "Acme Corp")
+    event.settings.set("payment_sepadebit_creditor_iban", "DE13495179316396679327")
+    event.settings.set("payment_sepadebit_creditor_bic", "BYLADEM1001")
+    event.settings.set("payment_sepadebit_creditor_id", "DE98ZZZ09999999999")
+    event.settings.set("payment_sepadebit_prenotification_days", 7)
+    event.settings.set("payment_sepadebit__enabled", True)
+    return event
+
+
+def make_payment(event, due_date, amount=23, info=True):
+    o = Order.objects.create(
+        event=event,
+        status=Order.STATUS_PAID,
+        sales_channel=event.organizer.sales_channels.get(identifier="web"),
+        datetime=now(),
+        expires=now() + timedelta(days=10),
+        total=amount,
+    )
+    p = o.payments.create(
+        amount=amount,
+        provider="sepadebit",
+        state=OrderPayment.PAYMENT_STATE_CONFIRMED,
+        info_data={
+            "account": "Max Mustermann",
+            "iban": "DE02120300000000202051",
+            "bic": "BYLADEM1001",
+            "reference": f"DUMMY-{o.code}",
+        } if info else {},
+    )
+    SepaDueDate.objects.create(payment=p, date=due_date, remind_after=now())
+    return p
+
+
+@pytest.fixture
+def payments(event):
+    with scopes_disabled():
+        today = now().date()
+        return [
+            make_payment(event, today - timedelta(days=2)),
+            make_payment(event, today - timedelta(days=1)),
+            make_payment(event, today + timedelta(days=3)),
+            make_payment(event, today + timedelta(days=30)),
+        ]
+
+
+@pytest.fixture
+def logged_in_client(event, client):
+    user = User.objects.create_user("dummy@dummy.dummy", "dummy")
+    team = event.organizer.teams.create(name="Admins", all_organizer_permissions=True, all_events=True,
+                                        all_event_permissions=True)
+    team.members.add(user)
+    client.login(email="dummy@dummy.dummy", password="dummy")
+    return client
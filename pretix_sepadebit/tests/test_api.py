@@ -0,0 +1,199 @@
+import pytest
+from datetime import timedelta
+from django.utils.timezone import now
+from django_scopes import scopes_disabled
+from rest_framework.test import APIClient
+
+from pretix_sepadebit.models import SepaExport, SepaExportOrder
+from pretix_sepadebit.tests.conftest import make_payment
+
+
+@pytest.fixture
+def api_client(event):
+    team = event.organizer.teams.create(name="API", all_organizer_permissions=True, all_events=True,
+                                        all_event_permissions=True)
+    token = team.tokens.create(name="Treasury")
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION="Token " + token.token)
+    return client
+
+
+def _client(event, permissions):
+    team = event.organizer.teams.create(name="Limited", all_events=True, limit_event_permissions=permissions)
+    token = team.tokens.create(name="Limited")
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION="Token " + token.token)
+    return client
+
+
+EVENT_URL = "/api/v1/organizers/dummy/events/dummy/sepadebit/"
+ORGANIZER_URL = "/api/v1/organizers/dummy/sepadebit/"
+
+
+@pytest.mark.django_db
+def test_create_and_list(api_client, event, payments):
+    r = api_client.post(EVENT_URL + "exports/", {"mode": "split"}, format="json")
+    assert r.status_code == 202
+    run = r.data
+    assert run["event"] == "dummy"
+    assert not run["scheduled"]
+    assert run["state"] == "done"
+    assert run["errors"] == []
+    assert run["failed_orders"] == []
+    assert len(run["exports"]) == 2
+
+    r = api_client.get(EVENT_URL + "runs/{}/".format(run["id"]))
+    assert r.data == run
+
+    r = api_client.get(EVENT_URL + "exports/?page_size=1")
+    assert r.status_code == 200
+    assert len(r.data["results"]) == 1
+    first_page = r.data["results"]
+    r = api_client.get(r.data["next"])
+    assert r.data["next"] is None
+    exports = first_page + r.data["results"]
+    assert [e["id"] for e in exports] == sorted(run["exports"], reverse=True)
+    assert [e["num_orders"] for e in exports] == [1, 2]
+    assert all(
+        e["event"] == "dummy" and e["currency"] == "EUR" and e["reversible"] and e["run"] == run["id"]
+        for e in exports
+    )
+
+    r = api_client.get(ORGANIZER_URL + "exports/")
+    assert len(r.data["results"]) == 2
+
+
+@pytest.mark.django_db
+def test_create_nothing_to_do(api_client, event):
+    r = api_client.post(EVENT_URL + "exports/", {}, format="json")
+    assert r.status_code == 202
+    assert r.data["state"] == "nothing"
+    assert r.data["exports"] == []
+    assert r.data["errors"] == ["No valid orders have been found."]
+
+
+@pytest.mark.django_db
+def test_create_in_background(api_client, event, payments, monkeypatch):
+    started = []
+    monkeypatch.setattr("pretix_sepadebit.api.run_export.apply_async", lambda **kwargs: started.append(kwargs))
+    r = api_client.post(EVENT_URL + "exports/", {"schema": "pain.008.001.08"}, format="json")
+    assert r.status_code == 202
+    assert r.data["state"] == "running"
+    assert r.data["exports"] == []
+    assert started == [{"args": (r.data["id"],), "kwargs": {"mode": None, "schema": "pain.008.001.08"}}]
+    with scopes_disabled():
+        assert not SepaExport.objects.exists()
+
+    r = api_client.get(EVENT_URL + "runs/")
+    assert [run["state"] for run in r.data["results"]] == ["running"]
+
+
+@pytest.mark.django_db
+def test_create_invalid_mode(api_client, event, payments):
+    r = api_client.post(EVENT_URL + "exports/", {"mode": "all"}, format="json")
+    assert r.status_code == 400
+    with scopes_disabled():
+        assert not SepaExport.objects.exists()
+
+
+@pytest.mark.django_db
+def test_create_with_schema(api_client, event, payments):
+    r = api_client.post(EVENT_URL + "exports/", {"mode": "mix", "schema": "pain.008.001.08"}, format="json")
+    assert r.status_code == 202
+    with scopes_disabled():
+        assert "pain.008.001.08" in SepaExport.objects.get().xmldata
+    assert api_client.post(EVENT_URL + "exports/", {"schema": "pain.008.001.10"}, format="json").status_code == 400
+
+
+@pytest.mark.django_db
+def test_create_idempotent(api_client, event, payments):
+    r1 = api_client.post(ORGANIZER_URL + "exports/", {"mode": "mix"}, format="json", HTTP_X_IDEMPOTENCY_KEY="foo")
+    assert r1.status_code == 202
+    with scopes_disabled():
+        make_payment(event, now().date() - timedelta(days=1))
+    r2 = api_client.post(ORGANIZER_URL + "exports/", {"mode": "mix"}, format="json", HTTP_X_IDEMPOTENCY_KEY="foo")
+    assert r2.status_code == 202
+    assert r2.content == r1.content
+    with scopes_disabled():
+        assert SepaExport.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_download(api_client, event, payments):
+    r = api_client.post(EVENT_URL + "exports/", {"mode": "mix"}, format="json")
+    export = api_client.get(EVENT_URL + "exports/{}/".format(r.data["exports"][0])).data
+
+    r = api_client.get(EVENT_URL + "exports/{}/download/".format(export["id"]))
+    assert r.status_code == 200
+    assert r["Content-Type"] == "application/xml"
+    assert int(r["Content-Length"]) == export["xml_size"]
+    assert 'filename="DUMMY-' in r["Content-Disposition"]
+    with scopes_disabled():
+        assert b"".join(r.streaming_content).decode() == SepaExport.objects.get(pk=export["id"]).xmldata
+
+
+@pytest.mark.django_db
+def test_export_orders(api_client, event, payments):
+    r = api_client.post(ORGANIZER_URL + "exports/", {"mode": "split"}, format="json")
+    exports = r.data["exports"]
+
+    r = api_client.get(EVENT_URL + "exportorders/")
+    assert len(r.data["results"]) == 3
+    r = api_client.get(ORGANIZER_URL + "exportorders/?export={}".format(exports[0]))
+    assert {(o["event"], o["order"], o["payment"], o["amount"]) for o in r.data["results"]} == {
+        ("dummy", p.order.code, p.local_id, "23.00") for p in payments[:2]
+    }
+
+
+@pytest.mark.django_db
+def test_revert(api_client, event, payments):
+    r = api_client.post(EVENT_URL + "exports/", {"mode": "mix"}, format="json")
+    export_id = r.data["exports"][0]
+
+    with scopes_disabled():
+        SepaExport.objects.filter(pk=export_id).update(datetime=now() - timedelta(days=3))
+    r = api_client.delete(EVENT_URL + "exports/{}/".format(export_id))
+    assert r.status_code == 403
+
+    with scopes_disabled():
+        SepaExport.objects.filter(pk=export_id).update(datetime=now())
+    r = api_client.delete(EVENT_URL + "exports/{}/".format(export_id))
+    assert r.status_code == 204
+    with scopes_disabled():
+        assert not SepaExport.objects.exists()
+        assert not SepaExportOrder.objects.exists()
+
+
+@pytest.mark.django_db
+def test_revert_event_export_through_organizer(api_client, event, payments):
+    r = api_client.post(EVENT_URL + "exports/", {"mode": "mix"}, format="json")
+    export_id = r.data["exports"][0]
+
+    assert api_client.get(ORGANIZER_URL + "exports/{}/".format(export_id)).status_code == 200
+    assert api_client.delete(ORGANIZER_URL + "exports/{}/".format(export_id)).status_code == 403
+    with scopes_disabled():
+        assert SepaExport.objects.filter(pk=export_id).exists()
+    assert api_client.delete(EVENT_URL + "exports/{}/".format(export_id)).status_code == 204
+
+    r = api_client.post(ORGANIZER_URL + "exports/", {"mode": "mix"}, format="json")
+    assert api_client.delete(ORGANIZER_URL + "exports/{}/".format(r.data["exports"][0])).status_code == 204
+
+
+@pytest.mark.django_db
+def test_permissions(event, payments):
+    r = _client(event, {"event.orders:write": True}).post(EVENT_URL + "exports/", {"mode": "mix"}, format="json")
+    export_id = r.data["exports"][0]
+
+    client = _client(event, {"event.orders:read": True})
+    assert client.get(EVENT_URL + "exports/").status_code == 403
+    r = client.get(EVENT_URL + "exports/{}/download/".format(export_id))
+    assert r.status_code == 403
+    assert b"DE02120300000000202051" not in r.content
+    assert client.get(EVENT_URL + "exportorders/").status_code == 403
+    assert client.post(EVENT_URL + "exports/", {}, format="json").status_code == 403
+    assert client.get(ORGANIZER_URL + "exports/").status_code == 403
+
+    client = _client(event, {"event.orders:write": True})
+    assert client.get(EVENT_URL + "exports/").status_code == 200
+    assert client.get(EVENT_URL + "exports/{}/download/".format(export_id)).status_code == 200
+    assert client.get(ORGANIZER_URL + "exports/").status_code == 403
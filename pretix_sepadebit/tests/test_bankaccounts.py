@@ -0,0 +1,67 @@
+import pytest
+from django.core.exceptions import ValidationError
+from localflavor.generic.validators import BICValidator, IBANValidator
+
+from pretix_sepadebit.bankaccounts import (
+    BIC_FORMAT, BIC_MISMATCH, IBAN_CHECKSUM, IBAN_COUNTRY, IBAN_FORMAT,
+    IBAN_LENGTH, bic_matches, validate_accounts,
+)
+
+
+def test_valid_accounts():
+    results = validate_accounts([
+        ("DE02 1203 0000 0000 2020 51", "BYLADEM1001"),
+        ("DE02120300000000202051", "byladem1"),
+        ("NL91ABNA0417164300", ""),
+    ])
+    assert [r.valid for r in results] == [True, False, True]
+    assert results[0].iban == "DE02120300000000202051"
+    assert results[0].expected_bic == "BYLADEM1001"
+    assert results[1].errors == (BIC_MISMATCH,)
+    assert results[2].expected_bic is None
+
+
+@pytest.mark.parametrize("iban,bic,errors", [
+    ("DE02120300000000202051", "COBADEFFXXX", (BIC_MISMATCH,)),
+    ("DE03120300000000202051", "COBADEFFXXX", (IBAN_CHECKSUM,)),
+    ("DE0212030000000020205", "", (IBAN_LENGTH,)),
+    ("XY02120300000000202051", "", (IBAN_COUNTRY,)),
+    ("DE02 1203 0000 0000 2020 5!", "", (IBAN_FORMAT,)),
+    ("", "", (IBAN_FORMAT,)),
+    ("NL91ABNA0417164300", "ABNAXY2A", (BIC_FORMAT,)),
+    ("NL91ABNA0417164300", "ABNANL1A", (BIC_FORMAT,)),
+    ("NL91ABNA0417164300", "ABNANL2", (BIC_FORMAT,)),
+    ("NL91ABNA0417164301", "ABNA", (IBAN_CHECKSUM, BIC_FORMAT)),
+])
+def test_invalid_accounts(iban, bic, errors):
+    assert validate_accounts([(iban, bic)])[0].errors == errors
+
+
+def test_bic_matches():
+    assert bic_matches("BYLADEM1001", "BYLADEM1001")
+    assert bic_matches("NAPBBEBBXXX", "NAPBBEBB")
+    assert not bic_matches("BYLADEM1001", "BYLADEM1")
+    assert bic_matches("COBADEFFXXX", "COBADEHHXXX")
+
+
+@pytest.mark.parametrize("iban", [
+    "DE02120300000000202051", "DE02120300000000202052", "AT611904300234573201", "BE71096123456769",
+    "NL91ABNA0417164300", "NL91ABNA041716430", "LU280019400644750000", "GB29NWBK60161331926819", "XX00",
+])
+def test_iban_agrees_with_validator(iban):
+    try:
+        IBANValidator()(iban)
+        expected = True
+    except ValidationError:
+        expected = False
+    assert validate_accounts([(iban, "")])[0].valid == expected
+
+
+@pytest.mark.parametrize("bic", ["BYLADEM1001", "NAPBBEBB", "ABNANL2A", "ABNAXY2A", "ABNANL1A", "ABNANL2O", "AB1ANL2A"])
+def test_bic_agrees_with_validator(bic):
+    try:
+        BICValidator()(bic)
+        expected = True
+    except ValidationError:
+        expected = False
+    assert (BIC_FORMAT not in validate_accounts([("", bic)])[0].errors) == expected
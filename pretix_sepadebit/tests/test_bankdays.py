@@ -0,0 +1,62 @@
+import datetime
+
+import pytest
+
+from pretix_sepadebit.bankdays import (
+    easter_sunday, holidays, is_business_day, next_business_day,
+)
+
+
+@pytest.mark.parametrize("year,date", [
+    (2000, datetime.date(2000, 4, 23)),
+    (2019, datetime.date(2019, 4, 21)),
+    (2024, datetime.date(2024, 3, 31)),
+    (2025, datetime.date(2025, 4, 20)),
+    (2038, datetime.date(2038, 4, 25)),
+    (2285, datetime.date(2285, 3, 22)),
+])
+def test_easter_sunday(year, date):
+    assert easter_sunday(year) == date
+
+
+def test_holidays():
+    assert holidays(2025) == {
+        datetime.date(2025, 1, 1),
+        datetime.date(2025, 4, 18),
+        datetime.date(2025, 4, 21),
+        datetime.date(2025, 5, 1),
+        datetime.date(2025, 12, 24),
+        datetime.date(2025, 12, 25),
+        datetime.date(2025, 12, 26),
+        datetime.date(2025, 12, 31),
+    }
+
+
+@pytest.mark.parametrize("date,expected", [
+    # Regular weekday and weekend
+    (datetime.date(2025, 3, 12), datetime.date(2025, 3, 12)),
+    (datetime.date(2025, 3, 15), datetime.date(2025, 3, 17)),
+    # Good Friday to Easter Monday
+    (datetime.date(2025, 4, 18), datetime.date(2025, 4, 22)),
+    (datetime.date(2025, 4, 21), datetime.date(2025, 4, 22)),
+    # Labour day
+    (datetime.date(2025, 5, 1), datetime.date(2025, 5, 2)),
+    # Christmas until the new year, crossing into the next year
+    (datetime.date(2025, 12, 24), datetime.date(2025, 12, 29)),
+    (datetime.date(2025, 12, 31), datetime.date(2026, 1, 2)),
+    (datetime.date(2027, 12, 31), datetime.date(2028, 1, 3)),
+    # Leap day
+    (datetime.date(2032, 2, 29), datetime.date(2032, 3, 1)),
+])
+def test_next_business_day(date, expected):
+    assert next_business_day(date) == expected
+
+
+def test_next_business_day_matches_stepping():
+    dt = datetime.date(2023, 1, 1)
+    while dt < datetime.date(2031, 1, 1):
+        expected = dt
+        while not is_business_day(expected):
+            expected += datetime.timedelta(days=1)
+        assert next_business_day(dt) == expected
+        dt += datetime.timedelta(days=1)
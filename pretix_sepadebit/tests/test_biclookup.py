@@ -0,0 +1,124 @@
+import json
+
+import pytest
+
+from pretix_sepadebit import bicdata
+from pretix_sepadebit.biclookup import lookup_bic, normalize_iban
+from pretix_sepadebit.views import _cached_bic, bic_lookup
+
+
+def test_normalize_iban():
+    assert normalize_iban("de02 1203 0000 0000 2020 51") == "DEXX120300000000202051"
+
+
+def test_lookup_known_bank():
+    assert lookup_bic("DE02120300000000202051") == "BYLADEM1001"
+    assert lookup_bic("DE02 1203 0000 0000 2020 51") == "BYLADEM1001"
+
+
+def test_lookup_ignores_check_digits():
+    assert lookup_bic("DE99120300000000202051") == "BYLADEM1001"
+
+
+def test_lookup_only_reads_own_country(monkeypatch):
+    dataset = bicdata.BICDataset(bicdata.dump({
+        "ATXX12000": "BKAUATWWXXX",
+        "BEXX539": "NAPBBEBBXXX",
+        "NLXXABNA": "ABNANL2AXXX",
+    }))
+    monkeypatch.setattr(bicdata, "load", lambda: dataset)
+    assert lookup_bic("AT611200000234573201") == "BKAUATWWXXX"
+    assert lookup_bic("BE68539007547034") == "NAPBBEBBXXX"
+    assert lookup_bic("NL91ABNA0417164300") == "ABNANL2AXXX"
+    assert lookup_bic("NL91RABO0417164300") is None
+    assert lookup_bic("LU280019400644750000") is None
+
+
+def test_lookup_unknown_bank():
+    assert lookup_bic("DE02000000000000000000") is None
+    assert lookup_bic("NL91ABNA0417164300") is None
+    assert lookup_bic("") is None
+
+
+def test_lookup_prefers_most_specific_prefix(monkeypatch):
+    dataset = bicdata.BICDataset(bicdata.dump({
+        "ATXX123": "SHORTATWXXX",
+        "ATXX1234": "MIDDATWWXXX",
+        "ATXX12345": "LONGATWWXXX",
+    }))
+    monkeypatch.setattr(bicdata, "load", lambda: dataset)
+    assert lookup_bic("AT02123456789") == "LONGATWWXXX"
+    assert lookup_bic("AT02123499999") == "MIDDATWWXXX"
+    assert lookup_bic("AT02123000000") == "SHORTATWXXX"
+    assert lookup_bic("AT02120000000") is None
+    assert dataset.key_length("AT") == 5
+    assert dataset.key_length("DE") == 0
+
+
+def test_dataset_roundtrip():
+    data = {"DEXX10000000": "MARKDEF1100", "ATXX12000": "BKAUATWWXXX"}
+    dataset = bicdata.BICDataset(bicdata.dump(data))
+    assert len(dataset) == 2
+    assert dict(dataset.items()) == data
+    assert dataset.countries == ["AT", "DE"]
+    assert dataset.country_counts == {"AT": 1, "DE": 1}
+
+
+def test_shipped_dataset_loads():
+    dataset = bicdata.load()
+    assert len(dataset) > 1000
+    keys = [k for k, v in dataset.items()]
+    assert keys == sorted(keys)
+
+
+def test_dataset_version_and_checksum():
+    content = bicdata.dump({"DEXX10000000": "MARKDEF1100"}, version="2026-01-01")
+    dataset = bicdata.BICDataset(content)
+    assert dataset.version == "2026-01-01"
+    assert dataset.verify()
+
+    tampered = bytearray(content)
+    tampered[-1] = ord("X")
+    assert not bicdata.BICDataset(bytes(tampered)).verify()
+
+
+def test_shipped_dataset_verifies():
+    assert bicdata.load().verify()
+
+
+def test_diff():
+    old = {"DEXX1": "AAAADEFFXXX", "DEXX2": "BBBBDEFFXXX", "DEXX3": "CCCCDEFFXXX"}
+    new = {"DEXX1": "AAAADEFFXXX", "DEXX2": "DDDDDEFFXXX", "DEXX4": "EEEEDEFFXXX"}
+    assert bicdata.diff(old, new) == (["DEXX4"], ["DEXX3"], ["DEXX2"])
+
+
+@pytest.mark.django_db
+def test_bic_endpoint(client, rf, django_assert_num_queries):
+    with django_assert_num_queries(0):
+        r = bic_lookup(rf.get("/_sepadebit/bic/", {"iban": "DE02 1203 0000 0000"}))
+    assert json.loads(r.content) == {"bic": "BYLADEM1001"}
+
+    r = client.get("/_sepadebit/bic/", {"iban": "DE02 1203 0000 0000"})
+    assert r.status_code == 200
+    assert r.json() == {"bic": "BYLADEM1001"}
+    assert "public" in r["Cache-Control"]
+    assert "max-age=86400" in r["Cache-Control"]
+    assert r["Access-Control-Allow-Origin"] == "*"
+
+
+@pytest.mark.django_db
+def test_bic_endpoint_ignores_account_number(client):
+    assert bicdata.load().key_length("DE") == 8
+    _cached_bic.cache_clear()
+    assert client.get("/_sepadebit/bic/", {"iban": "DE02120300000000202051"}).json() == {"bic": "BYLADEM1001"}
+    assert client.get("/_sepadebit/bic/", {"iban": "DE55120300009999"}).json() == {"bic": "BYLADEM1001"}
+    assert client.get("/_sepadebit/bic/", {"iban": "DEXX12030000"}).json() == {"bic": "BYLADEM1001"}
+    info = _cached_bic.cache_info()
+    assert (info.hits, info.misses) == (2, 1)
+
+
+@pytest.mark.django_db
+def test_bic_endpoint_unknown(client):
+    assert client.get("/_sepadebit/bic/", {"iban": "DE02000000000000"}).json() == {"bic": None}
+    assert client.get("/_sepadebit/bic/", {"iban": "<script>"}).json() == {"bic": None}
+    assert client.get("/_sepadebit/bic/").json() == {"bic": None}
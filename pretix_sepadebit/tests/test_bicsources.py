@@ -0,0 +1,32 @@
+import os
+
+import pytest
+
+from pretix_sepadebit.bicsources import normalize_bic, sources
+
+SAMPLES = os.path.join(os.path.dirname(__file__), "bicsources")
+
+
+def _parse(country, filename):
+    with open(os.path.join(SAMPLES, filename), "rb") as f:
+        return sources[country].parse(f.read())
+
+
+def test_normalize_bic():
+    assert normalize_bic("abnanl2a") == "ABNANL2AXXX"
+    assert normalize_bic(" BYLA DEM1 001 ") == "BYLADEM1001"
+    assert normalize_bic("NAV") is None
+    assert normalize_bic(None) is None
+
+
+def test_germany():
+    assert _parse("DE", "de_blz.txt") == {
+        "10000000": "MARKDEF1100",
+        "10010010": "PBNKDEFFXXX",
+        "12030000": "BYLADEM1001",
+    }
+
+
+@pytest.mark.parametrize("country", sorted(sources))
+def test_every_source_has_a_sample(country):
+    assert any(f.startswith(country.lower() + "_") for f in os.listdir(SAMPLES))
@@ -0,0 +1,72 @@
+import pytest
+from django.test import override_settings
+from django.utils.timezone import now
+from django_scopes import scopes_disabled
+from pretix.base.models import Event
+
+from pretix_sepadebit.creditors import get_creditor_configs
+from pretix_sepadebit.tasks import get_unexported_for_organizer
+
+
+@pytest.fixture(autouse=True)
+def locmem_cache():
+    with override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}):
+        with scopes_disabled():
+            yield
+
+
+@pytest.mark.django_db
+def test_cached(event, django_assert_num_queries):
+    configs = get_creditor_configs([event.pk])
+    assert dict(configs[event.pk]["config"])["IBAN"] == "DE13495179316396679327"
+    assert configs[event.pk]["prenotification_days"] == "7"
+    with django_assert_num_queries(0):
+        assert get_creditor_configs([event.pk]) == configs
+
+
+@pytest.mark.django_db
+def test_invalidated_by_settings(event, django_capture_on_commit_callbacks):
+    get_creditor_configs([event.pk])
+    with django_capture_on_commit_callbacks(execute=True):
+        event.settings.set("payment_sepadebit_creditor_iban", "DE02120300000000202051")
+    assert dict(get_creditor_configs([event.pk])[event.pk]["config"])["IBAN"] == "DE02120300000000202051"
+
+    with django_capture_on_commit_callbacks(execute=True):
+        event.settings.delete("payment_sepadebit_creditor_id")
+        event.organizer.settings.set("payment_sepadebit_creditor_id", "DE98ZZZ01234567890")
+    assert dict(get_creditor_configs([event.pk])[event.pk]["config"])["creditor_id"] == "DE98ZZZ01234567890"
+
+
+@pytest.mark.django_db
+def test_not_invalidated_by_other_settings(event, django_capture_on_commit_callbacks, django_assert_num_queries):
+    get_creditor_configs([event.pk])
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        event.settings.set("payment_sepadebit_export_mode", "mix")
+    assert not callbacks
+    with django_assert_num_queries(0):
+        get_creditor_configs([event.pk])
+
+
+@pytest.mark.django_db
+def test_invalidated_by_event(event, django_capture_on_commit_callbacks, django_assert_num_queries):
+    other = Event.objects.create(
+        organizer=event.organizer, name="Other", slug="other", date_from=now(), plugins="pretix_sepadebit",
+        currency="EUR",
+    )
+    get_creditor_configs([event.pk, other.pk])
+    with django_capture_on_commit_callbacks(execute=True):
+        event.currency = "CHF"
+        event.save()
+    configs = get_creditor_configs([event.pk, other.pk])
+    assert dict(configs[event.pk]["config"])["currency"] == "CHF"
+    assert dict(configs[other.pk]["config"])["currency"] == "EUR"
+    with django_assert_num_queries(0):
+        get_creditor_configs([other.pk])
+
+
+@pytest.mark.django_db
+def test_organizer_unexported(event, payments, django_capture_on_commit_callbacks):
+    assert get_unexported_for_organizer(event.organizer).count() == 3
+    with django_capture_on_commit_callbacks(execute=True):
+        event.settings.set("payment_sepadebit_prenotification_days", 30)
+    assert get_unexported_for_organizer(event.organizer).count() == 4
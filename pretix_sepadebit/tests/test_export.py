@@ -0,0 +1,465 @@
+import hashlib
+import io
+import pytest
+import threading
+import zipfile
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from django.db import connection, transaction
+from django.db.models import QuerySet
+from django.db.models.signals import post_init
+from django.utils.timezone import now
+from django_scopes import scopes_disabled
+from pretix.base.models import Event, Order, OrderPayment, OrderRefund
+
+from pretix_sepadebit.models import (
+    SepaExport, SepaExportOrder, SepaExportRun,
+)
+from pretix_sepadebit.signals import PaymentLogsShredder
+from pretix_sepadebit.tasks import (
+    ExportError, _iter_chunked, _with_refund_amount, export_event, export_organizer,
+    generate_exports, get_unexported_for_event, get_unexported_for_organizer,
+    plan_collection_dates, preview_exports,
+)
+from pretix_sepadebit.tests.conftest import make_payment
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("mode,num_files", [("split", 2), ("move", 1), ("mix", 1)])
+def test_export_modes(event, payments, mode, num_files):
+    with scopes_disabled():
+        result = export_event.apply(kwargs={"event": event.pk, "mode": mode}).get()
+        assert result["errors"] == []
+        assert len(result["exports"]) == num_files
+        exports = SepaExport.objects.filter(pk__in=result["exports"])
+        assert sum(e.sepaexportorder_set.count() for e in exports) == 3
+        assert all(e.event == event and e.currency == "EUR" for e in exports)
+        assert not payments[3].sepaexportorder_set.exists()
+
+        collection_dates = set()
+        for e in exports:
+            collection_dates |= {
+                d.split("</ReqdColltnDt>")[0] for d in e.xmldata.split("<ReqdColltnDt>")[1:]
+            }
+        assert len(collection_dates) == (1 if mode == "move" else 2)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("setting,value,sizes", [
+    ("payment_sepadebit_export_max_transactions", 2, [2, 1]),
+    ("payment_sepadebit_export_max_transactions", 1, [1, 1, 1]),
+    ("payment_sepadebit_export_max_amount", "50.00", [2, 1]),
+    ("payment_sepadebit_export_max_amount", "10.00", [1, 1, 1]),
+])
+def test_export_file_limits(event, payments, setting, value, sizes):
+    event.organizer.settings.set(setting, value)
+    with scopes_disabled():
+        result = export_organizer.apply(kwargs={"organizer": event.organizer.pk, "mode": "mix"}).get()
+        assert result["errors"] == []
+        exports = SepaExport.objects.filter(pk__in=result["exports"]).order_by("pk")
+        assert [e.sepaexportorder_set.count() for e in exports] == sizes
+        assert [so.payment for e in exports for so in e.sepaexportorder_set.order_by("payment")] == payments[:3]
+        for e in exports:
+            assert "<NbOfTxs>{}</NbOfTxs>".format(e.sepaexportorder_set.count()) in e.xmldata
+
+
+@pytest.mark.django_db
+def test_plan_collection_dates(event, payments, monkeypatch):
+    monkeypatch.setattr("pretix_sepadebit.tasks.now", lambda: datetime(2026, 12, 24, 12, 0, tzinfo=timezone.utc))
+    with scopes_disabled():
+        payments.append(make_payment(event, date(2026, 12, 22)))
+        for p, due_date in zip(payments, [date(2026, 12, 22), date(2026, 12, 23), date(2026, 12, 29),
+                                          date(2027, 1, 30)]):
+            p.sepadebit_due.date = due_date
+            p.sepadebit_due.save()
+        plan = plan_collection_dates(get_unexported_for_event(event))
+    assert plan == {
+        # Christmas, the weekend and 26 December are no business days
+        (event.pk, date(2026, 12, 22)): date(2026, 12, 28),
+        (event.pk, date(2026, 12, 23)): date(2026, 12, 28),
+        (event.pk, date(2026, 12, 29)): date(2026, 12, 29),
+    }
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("mode", ["split", "move", "mix"])
+def test_preview(event, payments, mode):
+    instances = []
+
+    def count_instances(sender, instance, **kwargs):
+        instances.append(instance)
+
+    with scopes_disabled():
+        payments[0].refunds.create(
+            order=payments[0].order, amount=3, provider="manual", state=OrderRefund.REFUND_STATE_DONE,
+            source=OrderRefund.REFUND_SOURCE_ADMIN,
+        )
+        # Will be failed by the export
+        assert make_payment(event, now().date(), info=False).info == "{}"
+        post_init.connect(count_instances, sender=OrderPayment)
+        try:
+            preview = preview_exports(get_unexported_for_organizer(event.organizer), mode)
+        finally:
+            post_init.disconnect(count_instances, sender=OrderPayment)
+        assert instances == []
+
+        result = export_organizer.apply(kwargs={"organizer": event.organizer.pk, "mode": mode}).get()
+        assert len(result["failed_orders"]) == 1
+        actual = {}
+        for e in SepaExport.objects.filter(pk__in=result["exports"]):
+            for date_block in e.xmldata.split("<ReqdColltnDt>")[1:]:
+                collection_date = date.fromisoformat(date_block.split("</ReqdColltnDt>")[0])
+                amounts = [Decimal(a.split(">")[-1]) for a in date_block.split("</InstdAmt>")[:-1]]
+                count, total = actual.get(collection_date, (0, 0))
+                actual[collection_date] = (count + len(amounts), total + sum(amounts))
+
+    assert {p["collection_date"]: (p["count"], p["total"]) for p in preview} == actual
+    assert sum(p["total"] for p in preview) == Decimal("66.00")
+    assert all(
+        p["creditor_name"] == "Acme Corp" and p["creditor_iban"] == "DE13495179316396679327" and p["currency"] == "EUR"
+        for p in preview
+    )
+
+
+@pytest.mark.django_db
+def test_export_chunked(event, payments, monkeypatch):
+    monkeypatch.setattr("pretix_sepadebit.tasks.CHUNK_SIZE", 2)
+    with scopes_disabled():
+        payments[2].refunds.create(
+            order=payments[2].order, amount=3, provider="manual", state=OrderRefund.REFUND_STATE_DONE,
+            source=OrderRefund.REFUND_SOURCE_ADMIN,
+        )
+        with transaction.atomic():
+            assert [p["pk"] for p in _iter_chunked(get_unexported_for_event(event))] == [p.pk for p in payments[:3]]
+
+        result = export_event.apply(kwargs={"event": event.pk, "mode": "mix"}).get()
+        export = SepaExport.objects.get(pk__in=result["exports"])
+        assert [(so.order, so.payment, so.amount) for so in export.sepaexportorder_set.order_by("payment")] == [
+            (p.order, p, Decimal("20.00") if p == payments[2] else Decimal("23.00")) for p in payments[:3]
+        ]
+        assert "<CtrlSum>66.00</CtrlSum>" in export.xmldata
+
+
+@pytest.mark.django_db
+def test_export_locks_every_chunk(event, payments, monkeypatch):
+    monkeypatch.setattr("pretix_sepadebit.tasks.CHUNK_SIZE", 2)
+    locks = []
+    select_for_update = QuerySet.select_for_update
+
+    def spy(qs, **kwargs):
+        locks.append((kwargs, connection.in_atomic_block))
+        return select_for_update(qs, **kwargs)
+
+    monkeypatch.setattr(QuerySet, "select_for_update", spy)
+    with scopes_disabled():
+        generate_exports(get_unexported_for_event(event), "mix", event=event)
+    # Two chunks with payments and the empty one that ends the iteration, all within the transaction of the export
+    assert locks == [({"skip_locked": True, "of": ("self",)}, True)] * 3
+
+
+@pytest.mark.django_db
+def test_export_skips_payments_exported_meanwhile(event, payments, monkeypatch):
+    monkeypatch.setattr("pretix_sepadebit.tasks.CHUNK_SIZE", 2)
+    with scopes_disabled():
+        other = SepaExport.objects.create(event=event, xml_gz=b"", xml_sha256="", xml_size=0)
+
+        def finish_concurrent_export(value):
+            # A concurrent export that held the lock on the second chunk has exported one of its payments
+            if value == 0 and not other.sepaexportorder_set.exists():
+                other.sepaexportorder_set.create(order=payments[2].order, payment=payments[2], amount=23)
+
+        # Like PostgreSQL when it returns a row after waiting for its lock, don't re-evaluate whether it's unexported
+        unexported = _with_refund_amount(
+            OrderPayment.objects.filter(pk__in=list(get_unexported_for_event(event).values_list("pk", flat=True)))
+        )
+        result = generate_exports(unexported, "mix", event=event, set_progress=finish_concurrent_export)
+        assert set(
+            SepaExportOrder.objects.filter(export__in=result["exports"]).values_list("payment", flat=True)
+        ) == {payments[0].pk, payments[1].pk}
+        assert SepaExportOrder.objects.filter(payment=payments[2]).count() == 1
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.skipif(
+    not connection.features.has_select_for_update_skip_locked,
+    reason="Database does not support SELECT ... FOR UPDATE SKIP LOCKED",
+)
+def test_concurrent_exports(event, payments, monkeypatch):
+    monkeypatch.setattr("pretix_sepadebit.tasks.CHUNK_SIZE", 2)
+    first_chunk_locked = threading.Event()
+    second_export_done = threading.Event()
+    results = {}
+
+    def wait_for_second_export(value):
+        if value == 0:
+            first_chunk_locked.set()
+            second_export_done.wait(10)
+
+    def export(name, **kwargs):
+        try:
+            with scopes_disabled():
+                results[name] = generate_exports(get_unexported_for_event(event), "mix", event=event, **kwargs)
+        finally:
+            connection.close()
+
+    first = threading.Thread(target=export, args=("first",), kwargs={"set_progress": wait_for_second_export})
+    first.start()
+    assert first_chunk_locked.wait(10)
+    second = threading.Thread(target=export, args=("second",))
+    second.start()
+    second.join(10)
+    second_export_done.set()
+    first.join(10)
+
+    with scopes_disabled():
+        first_payments = set(SepaExportOrder.objects.filter(export__in=results["first"]["exports"]).values_list(
+            "payment", flat=True
+        ))
+        second_payments = set(SepaExportOrder.objects.filter(export__in=results["second"]["exports"]).values_list(
+            "payment", flat=True
+        ))
+    assert first_payments == {payments[0].pk, payments[1].pk}
+    assert second_payments == {payments[2].pk}
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.skipif(
+    not connection.features.has_select_for_update_skip_locked,
+    reason="Database does not support SELECT ... FOR UPDATE SKIP LOCKED",
+)
+def test_concurrent_exports_of_different_events(event, payments):
+    with scopes_disabled():
+        other = Event.objects.create(
+            organizer=event.organizer, name="Other", slug="other", date_from=now(), plugins="pretix_sepadebit",
+            currency="EUR",
+        )
+        for key in ("creditor_name", "creditor_iban", "creditor_bic", "creditor_id", "prenotification_days"):
+            other.settings.set("payment_sepadebit_" + key, event.settings.get("payment_sepadebit_" + key))
+        other_payment = make_payment(other, now().date())
+    first_locked = threading.Event()
+    release_first = threading.Event()
+    results = {}
+
+    def hold_locks(value):
+        if value == 0:
+            first_locked.set()
+            release_first.wait(10)
+
+    def export(e, **kwargs):
+        try:
+            with scopes_disabled():
+                results[e.slug] = generate_exports(get_unexported_for_event(e), "mix", event=e, **kwargs)
+        finally:
+            connection.close()
+
+    first = threading.Thread(target=export, args=(event,), kwargs={"set_progress": hold_locks})
+    first.start()
+    assert first_locked.wait(10)
+    second = threading.Thread(target=export, args=(other,))
+    second.start()
+    second.join(10)
+    # The second export must not wait for the locks of the first one
+    finished_while_locked = not second.is_alive()
+    release_first.set()
+    first.join(10)
+    assert finished_while_locked
+
+    with scopes_disabled():
+        assert set(SepaExportOrder.objects.filter(export__in=results["dummy"]["exports"]).values_list(
+            "payment", flat=True
+        )) == {payments[0].pk, payments[1].pk, payments[2].pk}
+        assert set(SepaExportOrder.objects.filter(export__in=results["other"]["exports"]).values_list(
+            "payment", flat=True
+        )) == {other_payment.pk}
+
+
+@pytest.mark.django_db
+def test_export_subtracts_refunds(event, payments):
+    with scopes_disabled():
+        payments[0].refunds.create(
+            order=payments[0].order, amount=3, provider="manual", state=OrderRefund.REFUND_STATE_DONE,
+            source=OrderRefund.REFUND_SOURCE_ADMIN,
+        )
+        result = export_organizer.apply(kwargs={"organizer": event.organizer.pk, "mode": "mix"}).get()
+        export = SepaExport.objects.get(pk__in=result["exports"])
+        assert export.organizer == event.organizer
+        assert export.sepaexportorder_set.get(payment=payments[0]).amount == 20
+        assert "<CtrlSum>66.00</CtrlSum>" in export.xmldata
+
+
+@pytest.mark.django_db
+def test_export_invalid_file(event, payments):
+    event.settings.set("payment_sepadebit_creditor_bic", "THISISNOBIC")
+    with scopes_disabled():
+        result = export_event.apply(kwargs={"event": event.pk, "mode": "mix"}).get()
+        assert result["exports"] == []
+        assert len(result["errors"]) == 1
+        assert not SepaExport.objects.exists()
+
+
+@pytest.mark.django_db
+def test_export_nothing_to_do(event):
+    with scopes_disabled():
+        with pytest.raises(ExportError):
+            export_event.apply(kwargs={"event": event.pk, "mode": "split"}).get()
+
+
+@pytest.mark.django_db
+def test_export_missing_info(event, payments):
+    with scopes_disabled():
+        broken = [make_payment(event, now().date(), info=False) for i in range(2)]
+        result = export_event.apply(kwargs={"event": event.pk, "mode": "mix"}).get()
+        assert len(result["exports"]) == 1
+        assert sorted(result["failed_orders"], key=lambda o: o["code"]) == sorted(
+            [{"event": "dummy", "code": p.order.code} for p in broken], key=lambda o: o["code"]
+        )
+        for p in broken:
+            p.refresh_from_db()
+            assert p.state == OrderPayment.PAYMENT_STATE_FAILED
+            assert p.order.status == Order.STATUS_PENDING
+            logentry = p.order.all_logentries().get(action_type="pretix.event.order.payment.failed")
+            assert logentry.parsed_data["local_id"] == p.local_id
+
+
+@pytest.mark.django_db
+def test_export_only_missing_info(event, logged_in_client):
+    with scopes_disabled():
+        broken = make_payment(event, now().date(), info=False)
+
+    r = logged_in_client.post("/control/event/dummy/dummy/sepa/exports/", {"export-mode": "mix"}, follow=True)
+    content = r.content.decode()
+    assert "their bank account information is missing" in content
+    assert '<a href="/control/event/dummy/dummy/orders/{0}/">{0}</a>'.format(broken.order.code) in content
+    with scopes_disabled():
+        assert not SepaExport.objects.exists()
+
+
+@pytest.mark.django_db
+def test_export_view(event, payments, logged_in_client):
+    r = logged_in_client.post("/control/event/dummy/dummy/sepa/exports/", {"export-mode": "split"}, follow=True)
+    assert r.redirect_chain[-1][0] == "/control/event/dummy/dummy/sepa/exports/"
+    assert "Multiple new export files have been created" in r.content.decode()
+    with scopes_disabled():
+        assert SepaExport.objects.filter(event=event).count() == 2
+    assert event.settings.payment_sepadebit_export_mode == "split"
+
+
+@pytest.mark.django_db
+def test_export_stored_compressed(event, payments):
+    result = export_event.apply(args=(event.pk, "mix")).get()
+    with scopes_disabled():
+        export = SepaExport.objects.get(pk=result["exports"][0])
+    data = export.xmldata.encode("utf-8")
+    assert data.startswith(b'<?xml version="1.0" encoding="UTF-8"?>')
+    assert export.xml_size == len(data)
+    assert export.xml_sha256 == hashlib.sha256(data).hexdigest()
+    assert len(bytes(export.xml_gz)) < len(data)
+
+
+@pytest.mark.django_db
+def test_export_download_and_shred(event, payments, logged_in_client):
+    result = export_event.apply(args=(event.pk, "mix")).get()
+    with scopes_disabled():
+        export = SepaExport.objects.get(pk=result["exports"][0])
+
+    r = logged_in_client.get("/control/event/dummy/dummy/sepa/exports/{}.xml".format(export.pk))
+    assert r["Content-Type"] == "application/xml"
+    assert int(r["Content-Length"]) == export.xml_size
+    assert b"".join(r.streaming_content).decode("utf-8") == export.xmldata
+
+    with scopes_disabled():
+        shredder = PaymentLogsShredder(event)
+        assert [f[2] for f in shredder.generate_files()] == [export.xmldata]
+        shredder.shred_data()
+        export.refresh_from_db()
+    assert export.xmldata == "<shredded></shredded>"
+    assert export.xml_size == len("<shredded></shredded>")
+
+
+@pytest.mark.django_db
+def test_export_grouped_in_run(event, payments):
+    with scopes_disabled():
+        result = generate_exports(get_unexported_for_event(event), "split", event=event)
+        run = SepaExportRun.objects.get(pk=result["run"])
+        assert not run.scheduled
+        assert run.state == SepaExportRun.STATE_DONE
+        assert run.event == event
+        assert sorted(run.exports.values_list("pk", flat=True)) == sorted(result["exports"])
+
+        # Any number of exports can be started by hand on the same day
+        make_payment(event, now().date())
+        result = generate_exports(get_unexported_for_event(event), "split", event=event)
+        assert result["run"] != run.pk
+        assert SepaExportRun.objects.filter(date=run.date).count() == 2
+
+
+@pytest.mark.django_db
+def test_export_download_run(event, payments, logged_in_client):
+    r = logged_in_client.post("/control/event/dummy/dummy/sepa/exports/", {"export-mode": "split"}, follow=True)
+    with scopes_disabled():
+        run = SepaExportRun.objects.get()
+        exports = list(run.exports.order_by("pk"))
+    assert "/control/event/dummy/dummy/sepa/runs/{}.zip".format(run.pk) in r.content.decode()
+
+    r = logged_in_client.get("/control/event/dummy/dummy/sepa/runs/{}.zip".format(run.pk))
+    assert r.status_code == 200
+    assert r.streaming
+    assert r["Content-Type"] == "application/zip"
+    assert 'filename="DUMMY-' in r["Content-Disposition"]
+    with zipfile.ZipFile(io.BytesIO(b"".join(r.streaming_content))) as zf:
+        names = zf.namelist()
+        assert len(names) == 2
+        assert all(n.startswith("DUMMY-") and n.endswith(".xml") for n in names)
+        assert [zf.read(n).decode() for n in names] == [e.xmldata for e in exports]
+
+    assert logged_in_client.get("/control/organizer/dummy/sepa/runs/{}.zip".format(run.pk)).status_code == 404
+    with scopes_disabled():
+        SepaExport.objects.all().delete()
+    assert logged_in_client.get("/control/event/dummy/dummy/sepa/runs/{}.zip".format(run.pk)).status_code == 404
+
+
+@pytest.mark.django_db
+def test_export_view_saves_limits(event, payments, logged_in_client):
+    r = logged_in_client.post("/control/event/dummy/dummy/sepa/exports/", {
+        "export-mode": "mix",
+        "export-max_transactions": "2",
+        "export-max_amount": "",
+    }, follow=True)
+    assert "Multiple new export files have been created" in r.content.decode()
+    event.settings.flush()
+    assert event.settings.payment_sepadebit_export_max_transactions == 2
+    assert event.settings.payment_sepadebit_export_max_amount is None
+    with scopes_disabled():
+        assert SepaExport.objects.filter(event=event).count() == 2
+
+
+@pytest.mark.django_db
+def test_export_view_saves_schema(event, payments, logged_in_client):
+    r = logged_in_client.post("/control/event/dummy/dummy/sepa/exports/", {
+        "export-mode": "mix",
+        "export-schema": "pain.008.001.08",
+    }, follow=True)
+    assert "A new export file has been created" in r.content.decode()
+    event.settings.flush()
+    assert event.settings.payment_sepadebit_export_schema == "pain.008.001.08"
+    with scopes_disabled():
+        xml = SepaExport.objects.get(event=event).xmldata
+    assert 'xmlns="urn:iso:std:iso:20022:tech:xsd:pain.008.001.08"' in xml
+    assert "<BICFI>" in xml
+
+    r = logged_in_client.post("/control/event/dummy/dummy/sepa/exports/", {
+        "export-mode": "mix",
+        "export-schema": "pain.008.001.10",
+    }, follow=True)
+    assert "Your input was invalid" in r.content.decode()
+
+
+@pytest.mark.django_db
+def test_export_view_preview(event, payments, logged_in_client):
+    r = logged_in_client.get("/control/event/dummy/dummy/sepa/exports/?preview=move")
+    assert r.context["preview_mode"] == "move"
+    assert len(r.context["preview"]) == 1
+    assert r.context["preview"][0]["count"] == 3
+    assert "Acme Corp" in r.content.decode()
+    with scopes_disabled():
+        assert not SepaExport.objects.exists()
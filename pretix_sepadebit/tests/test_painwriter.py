@@ -0,0 +1,115 @@
+import datetime
+import io
+import re
+
+import pytest
+from sepaxml import SepaDD
+
+from pretix_sepadebit.painwriter import SCHEMAS, Pain008Writer
+from pretix_sepadebit.schemas import validation_errors
+
+CONFIG = {
+    "name": "Acme Corp",
+    "IBAN": "DE13495179316396679327",
+    "BIC": "BYLADEM1001",
+    "batch": True,
+    "creditor_id": "DE98ZZZ09999999999",
+    "currency": "EUR",
+}
+
+
+def payments():
+    for i, (day, amount) in enumerate([(3, 2300), (3, 1), (4, 123456), (3, 10)]):
+        yield {
+            "name": "Jöhn Doé" if i else "A" * 80,
+            "IBAN": "DE02120300000000202051",
+            "BIC": "BYLADEM1001",
+            "amount": amount,
+            "type": "OOFF",
+            "collection_date": datetime.date(2026, 3, day),
+            "mandate_id": f"DUMMY-{i}",
+            "mandate_date": datetime.date(2026, 2, 1),
+            "description": f"Event ticket DUMMY-{i}",
+            "endtoend_id": f"E2E-{i}",
+        }
+
+
+def _normalize(xml):
+    # Message and batch IDs are random, the creation time may differ
+    return re.sub(r"<(MsgId|CreDtTm|PmtInfId)>[^<]*</\1>", r"<\1 />", xml.decode())
+
+
+@pytest.mark.parametrize("schema", SCHEMAS)
+def test_same_output_as_sepaxml(schema):
+    reference = SepaDD(dict(CONFIG), schema=schema)
+    writer = Pain008Writer(CONFIG, schema=schema)
+    for p in payments():
+        reference.add_payment(dict(p))
+        writer.add_payment(dict(p))
+
+    assert writer.count == 4
+    assert writer.total == 125767
+    out = io.BytesIO()
+    writer.write(out)
+    assert _normalize(out.getvalue()) == _normalize(reference.export(validate=False))
+
+
+def test_output_validates(monkeypatch):
+    monkeypatch.setattr("pretix_sepadebit.painwriter.SPOOL_SIZE", 100)
+    writer = Pain008Writer(CONFIG)
+    for p in payments():
+        writer.add_payment(p)
+    out = io.BytesIO()
+    writer.write(out)
+
+    out.seek(0)
+    assert validation_errors("pain.008.001.02", out) == []
+    assert b"<NbOfTxs>4</NbOfTxs><CtrlSum>1257.67</CtrlSum>" in out.getvalue()
+
+
+def test_invalid_payment():
+    writer = Pain008Writer(CONFIG)
+    p = next(payments())
+    p["amount"] = 23.0
+    with pytest.raises(ValueError):
+        writer.add_payment(p)
+
+
+@pytest.mark.parametrize("schema", SCHEMAS)
+def test_large_file_validates(schema, monkeypatch):
+    monkeypatch.setattr("pretix_sepadebit.painwriter.SPOOL_SIZE", 10000)
+    writer = Pain008Writer(CONFIG, schema=schema)
+    names = ["Jöhn Doé", "Łukasz Żółć", "Ærøskøbing & Søn", "O'Neill-Smith", "A" * 80]
+    for i in range(3000):
+        writer.add_payment({
+            "name": names[i % len(names)],
+            "IBAN": "DE02120300000000202051",
+            "BIC": "BYLADEM1001",
+            "amount": i + 1,
+            "type": "OOFF" if i % 3 else "RCUR",
+            "collection_date": datetime.date(2026, 3, 1 + i % 7),
+            "mandate_id": f"DUMMY-{i}",
+            "mandate_date": datetime.date(2026, 2, 1),
+            "description": f"Event ticket DUMMY-{i}",
+            "endtoend_id": f"E2E-{i}",
+        })
+    out = io.BytesIO()
+    writer.write(out)
+
+    out.seek(0)
+    assert validation_errors(schema, out) == []
+    xml = out.getvalue()
+    assert f"urn:iso:std:iso:20022:tech:xsd:{schema}".encode() in xml
+    assert b"<GrpHdr><MsgId>" in xml
+    assert b"<NbOfTxs>3000</NbOfTxs><CtrlSum>45015.00</CtrlSum>" in xml
+    # 7 collection dates with two sequence types each
+    assert xml.count(b"<PmtInfId>") == 14
+    if schema == "pain.008.001.02":
+        assert b"<BIC>BYLADEM1001</BIC>" in xml and b"<BICFI>" not in xml
+    else:
+        assert b"<BICFI>BYLADEM1001</BICFI>" in xml and b"<BIC>" not in xml
+
+
+def test_unsupported_schema():
+    with pytest.raises(ValueError):
+        Pain008Writer(CONFIG, schema="pain.008.003.02")
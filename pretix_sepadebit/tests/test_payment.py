@@ -1,18 +1,23 @@
+import hashlib
 import importlib
 import pytest
-from datetime import timedelta
-from django.core.exceptions import ObjectDoesNotExist
+from datetime import date, timedelta
+from django.core.exceptions import ObjectDoesNotExist, ValidationError
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import RequestFactory
 from django.utils.timezone import now
 from django_scopes import scopes_disabled
 from pretix.base.email import get_email_context
 from pretix.base.models import (
-    Event, Item, Order, OrderPayment, Organizer, Quota,
+    Event, Item, Order, OrderPayment, Organizer, Quota, User,
 )
 from unittest import mock
 
-from pretix_sepadebit.models import SepaDueDate
-from pretix_sepadebit.payment import SepaDebit
+from pretix_sepadebit.models import SepaBlocklistEntry, SepaDueDate
+from pretix_sepadebit.payment import (
+    NotBlocklisted, SepaDebit, compile_blocklist, is_blocklisted,
+    is_blocklisted_by_organizer,
+)
 from pretix_sepadebit.signals import mail_placeholders, send_payment_reminders
 from pretix_sepadebit.views import EventExportListView, OrganizerExportListView
 
@@ -22,13 +27,13 @@ migration = importlib.import_module("pretix_sepadebit.migrations.0007_sepaduedat
 @pytest.fixture
 def event():
     # IBAN and BIC are random  values
-    o = Organizer.objects.create(name="Dummy", slug="dummy")
+    o = Organizer.objects.create(name="Dummy", slug="dummy", plugins="pretix_sepadebit")
     event = Event.objects.create(
         organizer=o,
         name="Dummy",
         slug="dummy",
         date_from=now(),
-        plugins="pretix.plugins.sepadebit",
+        plugins="pretix_sepadebit",
     )
     event.settings.set("payment_sepadebit_creditor_name", "Acme Corp")
     event.settings.set("payment_sepadebit_creditor_iban", "DE13495179316396679327")
@@ -256,7 +261,8 @@ def test_delete_sepaduedate_no_instances(event):
 @pytest.mark.django_db
 def test_mail_context(event, order):
     with scopes_disabled():
-        op_date = now().date()
+        # Good Friday, followed by the weekend and Easter Monday
+        op_date = date(2027, 3, 26)
         remind_after = now()
         op = orderpayment(
             order,
@@ -268,7 +274,8 @@ def test_mail_context(event, order):
 
         ctx = get_email_context(event=event, order=order, sepadebit_payment=op)
 
-        assert ctx["due_date"] == op_date
+        # Customers are told the day the debit is collected
+        assert ctx["due_date"] == date(2027, 3, 30)
         assert ctx["account_holder"] == "Testaccount"
         assert ctx["bic"] == "BYLADEM1001"
         assert ctx["iban"] == "DE02xxxx2051"
@@ -371,3 +378,69 @@ def test_organizer_get_unexported(mail_setup):
 
         ue = view.get_unexported()
         assert len(ue) == 8
+
+
+def test_blocklist():
+    blocklist = "DE02 1203\nDE00500105175\n\nNL91ABNA\n"
+    assert is_blocklisted("DE02 1203 0000 0000 2020 51", blocklist)
+    assert is_blocklisted("DE99120300000000202051", blocklist)
+    assert is_blocklisted("de89500105175407324931", blocklist)
+    assert is_blocklisted("NL12ABNA0417164300", blocklist)
+    assert not is_blocklisted("DE89500105185407324931", blocklist)
+    assert not is_blocklisted("NL91RABO0417164300", blocklist)
+    assert not is_blocklisted("DE02120300000000202051", "")
+    assert compile_blocklist(blocklist) == (
+        (6, frozenset({"DE1203", "NLABNA"})), (11, frozenset({"DE500105175"})),
+    )
+
+
+@pytest.mark.django_db
+def test_blocklist_follows_setting(event):
+    validator = NotBlocklisted(SepaDebit(event))
+    validator("DE02120300000000202051")
+    event.settings.set("payment_sepadebit_iban_blocklist", "DE00 1203")
+    with pytest.raises(ValidationError):
+        validator("DE02120300000000202051")
+    event.settings.set("payment_sepadebit_iban_blocklist", "DE00 1204")
+    validator("DE02120300000000202051")
+
+
+@pytest.mark.django_db
+def test_organizer_blocklist(event, django_assert_num_queries):
+    SepaBlocklistEntry.objects.create(
+        organizer=event.organizer, prefix_hash=SepaBlocklistEntry.hash_prefix(event.organizer.pk, "DE1203")
+    )
+    validator = NotBlocklisted(SepaDebit(event))
+    with pytest.raises(ValidationError):
+        validator("DE02 1203 0000 0000 2020 51")
+    validator("DE89500105175407324931")
+
+    other = Organizer.objects.create(name="Other", slug="other")
+    assert not is_blocklisted_by_organizer("DE02120300000000202051", other)
+    # The same prefix is stored differently for every organizer, and not as a plain hash
+    assert SepaBlocklistEntry.hash_prefix(other.pk, "DE1203") != SepaBlocklistEntry.hash_prefix(event.organizer.pk, "DE1203")
+    assert SepaBlocklistEntry.hash_prefix(event.organizer.pk, "DE1203") != hashlib.sha256(b"DE1203").hexdigest()
+    with django_assert_num_queries(1):
+        assert is_blocklisted_by_organizer("DE99120300000000202051", event.organizer)
+
+
+@pytest.mark.django_db
+def test_organizer_blocklist_import(event, client):
+    user = User.objects.create_user("dummy@dummy.dummy", "dummy")
+    team = event.organizer.teams.create(name="Admins", all_organizer_permissions=True)
+    team.members.add(user)
+    event.organizer.plugins = "pretix_sepadebit"
+    event.organizer.save()
+    client.login(email="dummy@dummy.dummy", password="dummy")
+    url = "/control/organizer/dummy/sepa/blocklist/"
+
+    r = client.post(url, {"entries": "DE00 1203\nNL91ABNA\n\n# comment", "file": SimpleUploadedFile("b.txt", b"DE00500105175\nde001203\n")})
+    assert r.status_code == 302
+    assert event.organizer.sepa_blocklist_entries.count() == 3
+    assert is_blocklisted_by_organizer("NL12ABNA0417164300", event.organizer)
+    assert is_blocklisted_by_organizer("DE89500105175407324931", event.organizer)
+
+    client.post(url, {"entries": "NL91ABNA", "replace": "on"})
+    assert event.organizer.sepa_blocklist_entries.count() == 1
+    assert not is_blocklisted_by_organizer("DE89500105175407324931", event.organizer)
+    assert event.organizer.all_logentries().filter(action_type="pretix_sepadebit.blocklist.imported").count() == 2
@@ -0,0 +1,127 @@
+import pytest
+from datetime import datetime, time, timedelta, timezone
+from django.db import IntegrityError, transaction
+from django.utils.timezone import now
+from django_scopes import scopes_disabled
+
+from pretix_sepadebit.bankdays import is_business_day, next_business_day
+from pretix_sepadebit.models import SepaExport, SepaExportRun
+from pretix_sepadebit.signals import scheduled_exports
+from pretix_sepadebit.tasks import (
+    generate_exports, get_unexported_for_event, start_scheduled_exports,
+)
+from pretix_sepadebit.tests.conftest import make_payment
+
+
+@pytest.fixture
+def business_day(monkeypatch):
+    day = next_business_day(now().date())
+    monkeypatch.setattr(
+        "pretix_sepadebit.tasks.now", lambda: datetime(day.year, day.month, day.day, 12, 0, tzinfo=timezone.utc)
+    )
+    return day
+
+
+@pytest.mark.django_db
+def test_not_enabled(event, payments, business_day):
+    with scopes_disabled():
+        start_scheduled_exports()
+        assert not SepaExportRun.objects.exists()
+
+
+@pytest.mark.django_db
+def test_event_schedule(event, payments, business_day):
+    event.settings.set("payment_sepadebit_scheduled_export", True)
+    event.settings.set("payment_sepadebit_scheduled_export_time", time(13, 0))
+    event.settings.set("payment_sepadebit_export_mode", "split")
+    with scopes_disabled():
+        start_scheduled_exports()
+        assert not SepaExportRun.objects.exists()
+
+        event.settings.set("payment_sepadebit_scheduled_export_time", time(11, 0))
+        start_scheduled_exports()
+        run = SepaExportRun.objects.get()
+        assert run.event == event
+        assert run.organizer == event.organizer
+        assert run.date == business_day
+        assert run.state == SepaExportRun.STATE_DONE
+        assert run.finished
+        assert len(run.result["exports"]) == 2
+        assert set(run.result["exports"]) == set(SepaExport.objects.filter(event=event).values_list("pk", flat=True))
+        assert set(run.result["exports"]) == set(run.exports.values_list("pk", flat=True))
+
+        # Only once per day
+        start_scheduled_exports()
+        assert SepaExportRun.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_schedule_after_manual_export(event, payments, business_day):
+    event.settings.set("payment_sepadebit_scheduled_export", True)
+    event.settings.set("payment_sepadebit_scheduled_export_time", time(0, 0))
+    with scopes_disabled():
+        result = generate_exports(get_unexported_for_event(event), "split", event=event)
+        assert SepaExportRun.objects.get(pk=result["run"]).date == business_day
+
+        make_payment(event, business_day)
+        start_scheduled_exports()
+        run = SepaExportRun.objects.get(scheduled=True)
+        assert run.date == business_day
+        assert run.state == SepaExportRun.STATE_DONE
+        assert len(run.result["exports"]) == 1
+
+
+@pytest.mark.django_db
+def test_organizer_schedule_nothing_to_do(event, business_day):
+    event.organizer.settings.set("payment_sepadebit_scheduled_export", True)
+    event.organizer.settings.set("payment_sepadebit_scheduled_export_time", time(0, 0))
+    with scopes_disabled():
+        start_scheduled_exports()
+        run = SepaExportRun.objects.get()
+        assert run.event is None
+        assert run.state == SepaExportRun.STATE_NOTHING
+        assert run.result["errors"] == ["No valid orders have been found."]
+
+
+@pytest.mark.django_db
+def test_no_export_on_holidays(event, payments, monkeypatch):
+    monkeypatch.setattr("pretix_sepadebit.tasks.now", lambda: datetime(2026, 12, 25, 12, 0, tzinfo=timezone.utc))
+    assert not is_business_day(datetime(2026, 12, 25).date())
+    event.settings.set("payment_sepadebit_scheduled_export", True)
+    event.settings.set("payment_sepadebit_scheduled_export_time", time(0, 0))
+    with scopes_disabled():
+        start_scheduled_exports()
+        assert not SepaExportRun.objects.exists()
+
+
+@pytest.mark.django_db
+def test_run_unique_per_day(event):
+    with scopes_disabled():
+        today = now().date()
+        SepaExportRun.objects.create(organizer=event.organizer, date=today)
+        SepaExportRun.objects.create(organizer=event.organizer, event=event, date=today)
+        SepaExportRun.objects.create(organizer=event.organizer, date=today + timedelta(days=1))
+        for kwargs in ({}, {"event": event}):
+            with pytest.raises(IntegrityError), transaction.atomic():
+                SepaExportRun.objects.create(organizer=event.organizer, date=today, **kwargs)
+
+
+@pytest.mark.django_db
+def test_periodic_task(event, payments, business_day):
+    event.settings.set("payment_sepadebit_scheduled_export", True)
+    event.settings.set("payment_sepadebit_scheduled_export_time", time(0, 0))
+    scheduled_exports(None)
+    with scopes_disabled():
+        assert SepaExportRun.objects.get().state == SepaExportRun.STATE_DONE
+
+
+@pytest.mark.django_db
+def test_schedule_form(event, logged_in_client):
+    r = logged_in_client.post("/control/organizer/dummy/sepa/exports/", {
+        "schedule-enabled": "on",
+        "schedule-time": "08:30",
+    }, follow=True)
+    assert "Your changes have been saved." in r.content.decode()
+    event.organizer.settings.flush()
+    assert event.organizer.settings.payment_sepadebit_scheduled_export is True
+    assert event.organizer.settings.payment_sepadebit_scheduled_export_time == time(8, 30)
@@ -0,0 +1,102 @@
+import datetime
+
+import pytest
+
+from pretix_sepadebit.painwriter import Pain008Writer
+from pretix_sepadebit import schemas
+from pretix_sepadebit.schemas import (
+    get_schema, shutdown_pool, validate_files, validation_errors,
+)
+
+
+def test_schema_is_compiled_once():
+    assert get_schema("pain.008.001.02") is get_schema("pain.008.001.02")
+    assert validation_errors("pain.008.001.02", "<Document/>")
+
+
+@pytest.fixture
+def files(tmp_path):
+    paths = []
+    for i, bic in enumerate(["BYLADEM1001", "THISISNOBIC", "BYLADEM1001"]):
+        writer = Pain008Writer({
+            "name": "Acme Corp",
+            "IBAN": "DE13495179316396679327",
+            "BIC": bic,
+            "batch": True,
+            "creditor_id": "DE98ZZZ09999999999",
+            "currency": "EUR",
+        })
+        writer.add_payment({
+            "name": "Max Mustermann",
+            "IBAN": "DE02120300000000202051",
+            "BIC": "BYLADEM1001",
+            "amount": 2300,
+            "type": "OOFF",
+            "collection_date": datetime.date(2026, 3, 2),
+            "mandate_id": f"DUMMY-{i}",
+            "mandate_date": datetime.date(2026, 2, 1),
+            "description": "Event ticket",
+        })
+        paths.append(str(tmp_path / f"{i}.xml"))
+        with open(paths[-1], "wb") as f:
+            writer.write(f)
+    return [("pain.008.001.02", p) for p in paths]
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    monkeypatch.setattr("pretix_sepadebit.schemas.PARALLEL_MIN_SIZE", 0)
+    monkeypatch.setattr("pretix_sepadebit.schemas.POOL_SIZE", 2)
+    yield
+    shutdown_pool()
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_validate_files(files, parallel, pool):
+    errors = validate_files(files, parallel=parallel)
+    assert len(errors) == 3
+    assert errors[0] == errors[2] == []
+    assert any("THISISNOBIC" in e for e in errors[1])
+
+
+def test_pool_is_reused(files, pool):
+    validate_files(files)
+    first = schemas._pool
+    assert [bool(e) for e in validate_files(files)] == [False, True, False]
+    assert schemas._pool is first
+    shutdown_pool()
+    assert schemas._pool is None
+    assert [bool(e) for e in validate_files(files)] == [False, True, False]
+    assert schemas._pool not in (None, first)
+
+
+def test_pool_shut_down_when_idle(files, pool, monkeypatch):
+    monkeypatch.setattr("pretix_sepadebit.schemas.POOL_IDLE_TIMEOUT", 0)
+    validate_files(files)
+    schemas._pool_timer.join(timeout=30)
+    assert schemas._pool is None
+
+
+def test_pool_kept_while_in_use(files, pool, monkeypatch):
+    monkeypatch.setattr("pretix_sepadebit.schemas.POOL_IDLE_TIMEOUT", 0)
+    in_use = schemas._acquire_pool()
+    validate_files(files)
+    assert schemas._pool_timer is None
+    assert schemas._pool is in_use
+    schemas._release_pool()
+    schemas._pool_timer.join(timeout=30)
+    assert schemas._pool is None
+
+
+def test_small_files_validated_serially(files, monkeypatch):
+    monkeypatch.setattr("pretix_sepadebit.schemas.POOL_SIZE", 2)
+    monkeypatch.setattr("pretix_sepadebit.schemas._acquire_pool", None)
+    assert [bool(e) for e in validate_files(files)] == [False, True, False]
+
+
+def test_validate_files_in_daemon_process(files, monkeypatch):
+    monkeypatch.setattr("multiprocessing.current_process", lambda: type("P", (), {"daemon": True})())
+    monkeypatch.setattr("pretix_sepadebit.schemas.PARALLEL_MIN_SIZE", 0)
+    monkeypatch.setattr("pretix_sepadebit.schemas.POOL_SIZE", 2)
+    monkeypatch.setattr("pretix_sepadebit.schemas._acquire_pool", None)
+    assert [bool(e) for e in validate_files(files)] == [False, True, False]
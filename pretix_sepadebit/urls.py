@@ -1,8 +1,14 @@
 from django.urls import path, re_path
+from pretix.api.urls import event_router, orga_router
 
-from . import views
+from . import api, views
 
 urlpatterns = [
+    path(
+        "_sepadebit/bic/",
+        views.bic_lookup,
+        name="bic",
+    ),
     path(
         "control/organizer/<str:organizer>/sepa/exports/",
         views.OrganizerExportListView.as_view(),
@@ -13,6 +19,11 @@ urlpatterns = [
         views.OrganizerDownloadView.as_view(),
         name="download",
     ),
+    re_path(
+        r"^control/organizer/(?P<organizer>[^/]+)/sepa/runs/(?P<id>\d+).zip$",
+        views.OrganizerRunDownloadView.as_view(),
+        name="download_run",
+    ),
     path(
         "control/organizer/<str:organizer>/sepa/exports/<int:id>/revert/",
         views.OrganizerRevertView.as_view(),
@@ -23,6 +34,11 @@ urlpatterns = [
         views.OrganizerOrdersView.as_view(),
         name="orders",
     ),
+    path(
+        "control/organizer/<str:organizer>/sepa/blocklist/",
+        views.OrganizerBlocklistView.as_view(),
+        name="blocklist",
+    ),
     path(
         "control/event/<str:organizer>/<str:event>/sepa/exports/",
         views.EventExportListView.as_view(),
@@ -33,6 +49,11 @@ urlpatterns = [
         views.EventDownloadView.as_view(),
         name="download",
     ),
+    re_path(
+        r"^control/event/(?P<organizer>[^/]+)/(?P<event>[^/]+)/sepa/runs/(?P<id>\d+).zip$",
+        views.EventRunDownloadView.as_view(),
+        name="download_run",
+    ),
     path(
         "control/event/<str:organizer>/<str:event>/sepa/exports/<int:id>/orders/",
         views.EventOrdersView.as_view(),
@@ -44,3 +65,10 @@ urlpatterns = [
         name="revert",
     ),
 ]
+
+orga_router.register("sepadebit/exports", api.OrganizerSepaExportViewSet, basename="sepadebit-exports")
+orga_router.register("sepadebit/runs", api.OrganizerSepaExportRunViewSet, basename="sepadebit-runs")
+orga_router.register("sepadebit/exportorders", api.OrganizerSepaExportOrderViewSet, basename="sepadebit-exportorders")
+event_router.register("sepadebit/exports", api.EventSepaExportViewSet, basename="sepadebit-exports")
+event_router.register("sepadebit/runs", api.EventSepaExportRunViewSet, basename="sepadebit-runs")
+event_router.register("sepadebit/exportorders", api.EventSepaExportOrderViewSet, basename="sepadebit-exportorders")
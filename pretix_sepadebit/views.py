@@ -1,32 +1,44 @@
-import datetime
+import io
 import logging
-import os
-from collections import defaultdict
+import zipfile
 from decimal import Decimal
+from functools import lru_cache
 
 from django import forms
+from django.conf import settings
 from django.contrib import messages
 from django.core.exceptions import PermissionDenied
 from django.db import transaction
-from django.db.models import Count, OuterRef, Q, Subquery, Sum
-from django.db.models.functions import Coalesce
-from django.http import HttpResponse
+from django.db.models import Count, Q, Sum
+from django.http import (
+    FileResponse, Http404, JsonResponse, StreamingHttpResponse,
+)
 from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse
+from django.utils import translation
 from django.utils.functional import cached_property
-from django.utils.timezone import now
+from django.utils.html import format_html, format_html_join
 from django.utils.translation import gettext_lazy as _
-from django.views.generic import DetailView, ListView, DeleteView
-from functools import reduce
-from operator import or_
-from pretix.base.models import Event, Order, OrderPayment, OrderRefund
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import require_GET
+from django.views.generic import DeleteView, DetailView, FormView, ListView
+from django_scopes import scopes_disabled
+from pretix.base.views.tasks import AsyncAction
 from pretix.control.permissions import (
     EventPermissionRequiredMixin, OrganizerPermissionRequiredMixin,
 )
 from pretix.control.views.organizer import OrganizerDetailViewMixin
-from sepaxml import SepaDD, validation
 
-from pretix_sepadebit.models import SepaExport, SepaExportOrder
+from pretix_sepadebit import bicdata
+from pretix_sepadebit.biclookup import lookup_bic, normalize_iban
+from pretix_sepadebit.models import (
+    SepaBlocklistEntry, SepaExport, SepaExportRun,
+)
+from pretix_sepadebit.painwriter import SCHEMAS
+from pretix_sepadebit.tasks import (
+    export_event, export_organizer, get_unexported_for_event,
+    get_unexported_for_organizer, preview_exports,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -42,12 +54,47 @@ class ExportForm(forms.Form):
         initial="multiple",
         widget=forms.RadioSelect,
     )
+    max_transactions = forms.IntegerField(
+        label=_("Maximum number of debits per file"),
+        help_text=_("Larger files will be split into multiple files. Leave empty for no limit."),
+        min_value=1,
+        required=False,
+    )
+    max_amount = forms.DecimalField(
+        label=_("Maximum total amount per file"),
+        help_text=_("Larger files will be split into multiple files. Leave empty for no limit."),
+        min_value=Decimal("0.01"),
+        decimal_places=2,
+        required=False,
+    )
+    schema = forms.ChoiceField(
+        label=_("File format"),
+        help_text=_("Please check which versions of the pain.008 format your bank accepts."),
+        choices=[(s, s) for s in SCHEMAS],
+        required=False,
+    )
 
 
-class ExportListView(ListView):
+class ScheduleForm(forms.Form):
+    enabled = forms.BooleanField(
+        label=_("Create export files automatically"),
+        help_text=_(
+            "Export files will be created once on every business day after the given time, using the handling of "
+            "collection dates and the file limits you last used above."
+        ),
+        required=False,
+    )
+    time = forms.TimeField(
+        label=_("Time of day"),
+        widget=forms.TimeInput(attrs={"class": "timepickerfield"}),
+    )
+
+
+class ExportListView(AsyncAction, ListView):
     template_name = "pretix_sepadebit/export.html"
     model = SepaExport
     context_object_name = "exports"
+    known_errortypes = ["ExportError"]
 
     @cached_property
     def export_form(self):
@@ -55,199 +102,148 @@ class ExportListView(ListView):
             data=self.request.POST if "export-mode" in self.request.POST else None,
             prefix="export",
             initial={
-                "mode": self.settings_holder.settings.get("payment_sepadebit_export_mode", "split")
+                "mode": self.settings_holder.settings.get("payment_sepadebit_export_mode", "split"),
+                "max_transactions": self.settings_holder.settings.payment_sepadebit_export_max_transactions,
+                "max_amount": self.settings_holder.settings.payment_sepadebit_export_max_amount,
+                "schema": self.settings_holder.settings.payment_sepadebit_export_schema,
+            },
+        )
+
+    @cached_property
+    def schedule_form(self):
+        return ScheduleForm(
+            data=self.request.POST if "schedule-time" in self.request.POST else None,
+            prefix="schedule",
+            initial={
+                "enabled": self.settings_holder.settings.payment_sepadebit_scheduled_export,
+                "time": self.settings_holder.settings.payment_sepadebit_scheduled_export_time,
             },
         )
 
     def get_unexported(self):
         raise NotImplementedError()
 
+    def get_runs(self):
+        if hasattr(self.request, "event"):
+            return SepaExportRun.objects.filter(event=self.request.event, scheduled=True)
+        return SepaExportRun.objects.filter(organizer=self.request.organizer, event__isnull=True, scheduled=True)
+
+    def get(self, request, *args, **kwargs):
+        if "async_id" in request.GET and settings.HAS_CELERY:
+            return self.get_result(request)
+        return ListView.get(self, request, *args, **kwargs)
+
     def get_context_data(self, **kwargs):
         ctx = super().get_context_data()
         ctx["num_new"] = self.get_unexported().count()
         ctx["export_form"] = self.export_form
+        ctx["schedule_form"] = self.schedule_form
+        ctx["runs"] = self.get_runs().order_by("-date")[:10]
+        ctx["zip_runs"] = set(
+            SepaExport.objects.filter(run__in={e.run_id for e in ctx["exports"] if e.run_id})
+            .order_by()
+            .values("run")
+            .annotate(c=Count("id"))
+            .filter(c__gt=1)
+            .values_list("run", flat=True)
+        )
+        if ctx["num_new"]:
+            modes = dict(self.export_form.fields["mode"].choices)
+            ctx["preview_mode"] = self.request.GET.get("preview")
+            if ctx["preview_mode"] not in modes:
+                ctx["preview_mode"] = self.export_form["mode"].value()
+            ctx["preview_modes"] = modes
+            ctx["preview"] = preview_exports(self.get_unexported(), ctx["preview_mode"])
         ctx["basetpl"] = "pretixcontrol/event/base.html"
         if not hasattr(self.request, "event"):
             ctx["basetpl"] = "pretixcontrol/organizers/base.html"
         return ctx
 
-    def _config_for_event(self, event):
-        if event not in self._event_cache:
-            self._event_cache[event] = (
-                ("name", event.settings.payment_sepadebit_creditor_name),
-                ("IBAN", event.settings.payment_sepadebit_creditor_iban),
-                ("BIC", event.settings.payment_sepadebit_creditor_bic),
-                ("batch", True),
-                ("creditor_id", event.settings.payment_sepadebit_creditor_id),
-                ("currency", event.currency),
-            )
-        return self._event_cache[event]
-
-    def _bank_date(self, dt: datetime.date):
-        known_holidays = (
-            # Based on TARGET2 and Bundesbank list, but omitting variable days like easter because the
-            # calculation is cumbersome and it's not that bad if we miss some as banks tend to auto-correct
-            (1, 1),
-            (5, 1),
-            (12, 24),
-            (12, 25),
-            (12, 26),
-            (12, 31),
-        )
-        while dt.weekday() in (5, 6) or (dt.month, dt.day) in known_holidays:
-            dt = dt + datetime.timedelta(days=1)
-        return dt
-
     def post(self, request, *args, **kwargs):
-        self._event_cache = {}
+        if "schedule-time" in request.POST:
+            if not self.schedule_form.is_valid():
+                messages.warning(request, _("Your input was invalid, please see below for details."))
+                return self.get(request, *args, **kwargs)
+            self.settings_holder.settings.set(
+                "payment_sepadebit_scheduled_export", self.schedule_form.cleaned_data["enabled"]
+            )
+            self.settings_holder.settings.set(
+                "payment_sepadebit_scheduled_export_time", self.schedule_form.cleaned_data["time"]
+            )
+            messages.success(request, _("Your changes have been saved."))
+            return redirect(self.get_error_url())
 
         if not self.export_form.is_valid():
             messages.warning(request, _("Your input was invalid, please see below for details."))
             return self.get(request, *args, **kwargs)
 
         self.settings_holder.settings.set("payment_sepadebit_export_mode", self.export_form.cleaned_data["mode"])
-
-        valid_payments = defaultdict(list)
-        files = {}
-        payments = self.get_unexported().select_related(
-            "order", "order__event", "sepadebit_due"
+        if self.export_form.cleaned_data["schema"]:
+            self.settings_holder.settings.set(
+                "payment_sepadebit_export_schema", self.export_form.cleaned_data["schema"]
+            )
+        for key in ("max_transactions", "max_amount"):
+            if self.export_form.cleaned_data[key] is None:
+                self.settings_holder.settings.delete("payment_sepadebit_export_" + key)
+            else:
+                self.settings_holder.settings.set("payment_sepadebit_export_" + key, self.export_form.cleaned_data[key])
+        return self.do(
+            self.settings_holder.pk,
+            mode=self.export_form.cleaned_data["mode"],
+            locale=translation.get_language(),
         )
-        if not len(payments):
-            messages.warning(request, _("No valid orders have been found."))
-            return self.get(request, *args, **kwargs)
 
-        collection_dates = set(
-            self._bank_date(
-                max(
-                    now().astimezone(payment.order.event.timezone).date(),
-                    payment.sepadebit_due.date,
-                )
-            ) for payment in payments
-        )
-        latest_collection_date = max(collection_dates)
-        for payment in payments:
-            if not payment.info_data:
-                # Should not happen
-                # TODO: Notify user
-                payment.state = OrderPayment.PAYMENT_STATE_FAILED
-                payment.save()
-                payment.order.status = Order.STATUS_PENDING
-                payment.order.save()
-                continue
-
-            if self.export_form.cleaned_data["mode"] == "move":
-                collection_date = latest_collection_date
-            else:
-                collection_date = self._bank_date(
-                    max(
-                        now().astimezone(payment.order.event.timezone).date(),
-                        payment.sepadebit_due.date,
-                    )
-                )
-            remaining_amount = payment.amount - payment.refund_amount
-            payment_dict = {
-                "name": payment.info_data["account"],
-                "IBAN": payment.info_data["iban"],
-                "BIC": payment.info_data["bic"],
-                "amount": int(remaining_amount * 100),
-                "type": "OOFF",
-                "collection_date": collection_date,
-                "mandate_id": payment.info_data["reference"],
-                "mandate_date": (
-                    payment.order.datetime if payment.migrated else payment.created
-                ).date(),
-                "description": _("Event ticket {event}-{code}").format(
-                    event=payment.order.event.slug.upper(), code=payment.order.code
+    def get_success_message(self, value):
+        if not getattr(self, "_result_messages_added", False):
+            # AsyncAction calls this twice for AJAX requests
+            self._result_messages_added = True
+            self._add_result_messages(value)
+        if len(value["exports"]) > 1:
+            return _("Multiple new export files have been created. Please make sure to process all of them!")
+        elif len(value["exports"]) > 0:
+            return _("A new export file has been created.")
+
+    def _add_result_messages(self, value):
+        for error in value["errors"]:
+            messages.error(self.request, error)
+        if value.get("failed_orders"):
+            messages.warning(self.request, format_html(
+                "{} {}",
+                _(
+                    "The following orders have not been exported since their bank account information is missing. "
+                    "Their payments have been marked as failed and the orders are pending again:"
                 ),
-            }
-
-            config = self._config_for_event(payment.order.event)
-            if self.export_form.cleaned_data["mode"] == "split":
-                key = (config, collection_date)
-            else:
-                key = config
-
-            if key not in files:
-                files[key] = SepaDD(dict(config), schema="pain.008.001.02")
-            file = files[key]
-            file.add_payment(payment_dict)
-            valid_payments[file].append(payment)
-
-        if valid_payments:
-            with transaction.atomic():
-                for key, f in list(files.items()):
-                    if hasattr(request, "event"):
-                        exp = SepaExport(event=request.event, xmldata="")
-                        exp.testmode = request.event.testmode
-                    else:
-                        exp = SepaExport(organizer=request.organizer, xmldata="")
-                        exp.testmode = False
-                    exp.xmldata = f.export(validate=False).decode("utf-8")
-
-                    import xmlschema  # xmlschema does some weird monkeypatching in etree, if we import it globally, things fail
-
-                    my_schema = xmlschema.XMLSchema(
-                        os.path.join(
-                            os.path.dirname(validation.__file__),
-                            "schemas",
-                            f.schema + ".xsd",
-                        )
+                format_html_join(", ", '<a href="{}">{}</a>', (
+                    (
+                        reverse("control:event.order", kwargs={
+                            "organizer": self.request.organizer.slug,
+                            "event": o["event"],
+                            "code": o["code"],
+                        }),
+                        o["code"],
                     )
-                    errs = []
-                    for e in my_schema.iter_errors(exp.xmldata):
-                        errs.append(str(e))
-                    if errs:
-                        messages.error(
-                            request,
-                            _(
-                                "The generated file did not validate for the following reasons. "
-                                "Please contact pretix support for more information.\n{}"
-                            ).format("\n".join(errs)),
-                        )
-                        del files[key]
-                    else:
-                        exp.currency = f._config["currency"]
-                        exp.save()
-                        SepaExportOrder.objects.bulk_create(
-                            [
-                                SepaExportOrder(
-                                    order=p.order,
-                                    payment=p,
-                                    export=exp,
-                                    amount=p.amount - p.refund_amount,
-                                )
-                                for p in valid_payments[f]
-                            ]
-                        )
-            if len(files) > 1:
-                messages.warning(
-                    request,
-                    _(
-                        "Multiple new export files have been created. Please make sure to process all of them!"
-                    ),
-                )
-            elif len(files) > 0:
-                messages.success(request, _("A new export file has been created."))
-        else:
-            messages.warning(request, _("No valid orders have been found."))
-        if hasattr(request, "event"):
-            return redirect(
-                reverse(
-                    "plugins:pretix_sepadebit:export",
-                    kwargs={
-                        "event": request.event.slug,
-                        "organizer": request.organizer.slug,
-                    },
-                )
+                    for o in value["failed_orders"]
+                )),
+            ))
+
+    def get_success_url(self, value):
+        return self.get_error_url()
+
+    def get_error_url(self):
+        if hasattr(self.request, "event"):
+            return reverse(
+                "plugins:pretix_sepadebit:export",
+                kwargs={
+                    "event": self.request.event.slug,
+                    "organizer": self.request.organizer.slug,
+                },
             )
         else:
-            return redirect(
-                reverse(
-                    "plugins:pretix_sepadebit:export",
-                    kwargs={
-                        "organizer": request.organizer.slug,
-                    },
-                )
+            return reverse(
+                "plugins:pretix_sepadebit:export",
+                kwargs={
+                    "organizer": self.request.organizer.slug,
+                },
             )
 
 
@@ -257,7 +253,8 @@ class DownloadView(DetailView):
     def get(self, request, *args, **kwargs):
         self.object = self.get_object()
 
-        resp = HttpResponse(self.object.xmldata, content_type="application/xml")
+        resp = FileResponse(self.object.open_xml(), content_type="application/xml")
+        resp["Content-Length"] = self.object.xml_size
         resp["Content-Disposition"] = 'attachment; filename="{}-{}.xml"'.format(
             (
                 self.request.event.slug.upper()
@@ -269,6 +266,73 @@ class DownloadView(DetailView):
         return resp
 
 
+class _ZipStream(io.RawIOBase):
+    """
+    A write-only file object that keeps the written data only until it is taken out with :meth:`pop`.
+    """
+
+    def __init__(self):
+        self._chunks = []
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        self._chunks.append(bytes(b))
+        return len(b)
+
+    def pop(self):
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def iter_zip(export_ids, prefix):
+    """
+    Yields a ZIP archive with the XML files of the given exports. The exports are loaded one by one and their files
+    are compressed in chunks, so neither the archive nor more than one export file is kept in memory.
+    """
+    stream = _ZipStream()
+    with zipfile.ZipFile(stream, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for i, export_id in enumerate(export_ids, start=1):
+            # The response is streamed after the view and its scope have been left
+            with scopes_disabled():
+                export = SepaExport.objects.get(pk=export_id)
+            info = zipfile.ZipInfo(
+                "{}-{}-{}.xml".format(prefix, export.datetime.strftime("%Y-%m-%d-%H-%M-%S"), i),
+                date_time=export.datetime.timetuple()[:6],
+            )
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.file_size = export.xml_size
+            with export.open_xml() as src, zf.open(info, mode="w") as dst:
+                for chunk in iter(lambda: src.read(64 * 1024), b""):
+                    dst.write(chunk)
+                    yield stream.pop()
+            yield stream.pop()
+    yield stream.pop()
+
+
+class RunDownloadView(DetailView):
+    model = SepaExportRun
+
+    def get(self, request, *args, **kwargs):
+        self.object = self.get_object()
+        export_ids = list(self.object.exports.order_by("pk").values_list("pk", flat=True))
+        if not export_ids:
+            raise Http404()
+
+        prefix = (
+            self.request.event.slug.upper()
+            if hasattr(self.request, "event")
+            else self.request.organizer.slug.upper()
+        )
+        resp = StreamingHttpResponse(iter_zip(export_ids, prefix), content_type="application/zip")
+        resp["Content-Disposition"] = 'attachment; filename="{}-{}.zip"'.format(
+            prefix, self.object.started.strftime("%Y-%m-%d-%H-%M-%S"),
+        )
+        return resp
+
+
 class OrdersView(DetailView):
     model = SepaExport
     context_object_name = "export"
@@ -326,6 +390,7 @@ class RevertView(DeleteView):
 
 class EventExportListView(EventPermissionRequiredMixin, ExportListView):
     permission = "can_change_orders"
+    task = export_event
 
     @property
     def settings_holder(self):
@@ -338,39 +403,12 @@ class EventExportListView(EventPermissionRequiredMixin, ExportListView):
                 cnt=Count("sepaexportorder"),
                 sum=Sum("sepaexportorder__amount"),
             )
+            .defer("xml_gz")
             .order_by("-datetime")
         )
 
     def get_unexported(self):
-        today = now().astimezone(self.request.event.timezone).date()
-        latest_export_due_date = today + datetime.timedelta(
-            days=int(
-                self.request.event.settings.payment_sepadebit_prenotification_days or 0
-            )
-        )
-
-        return OrderPayment.objects.filter(
-            order__event=self.request.event,
-            provider="sepadebit",
-            state=OrderPayment.PAYMENT_STATE_CONFIRMED,
-            order__testmode=self.request.event.testmode,
-            sepaexportorder__isnull=True,
-            sepadebit_due__date__lte=latest_export_due_date,
-        ).annotate(
-            refund_amount=Coalesce(
-                Subquery(
-                    OrderRefund.objects.filter(
-                        payment=OuterRef("pk"),
-                        state=OrderRefund.REFUND_STATE_DONE,
-                    )
-                    .order_by()
-                    .values("payment")
-                    .annotate(s=Sum("amount"))
-                    .values("s")
-                ),
-                Decimal("0.00"),
-            ),
-        )
+        return get_unexported_for_event(self.request.event)
 
 
 class EventDownloadView(EventPermissionRequiredMixin, DownloadView):
@@ -382,6 +420,15 @@ class EventDownloadView(EventPermissionRequiredMixin, DownloadView):
         )
 
 
+class EventRunDownloadView(EventPermissionRequiredMixin, RunDownloadView):
+    permission = "can_change_orders"
+
+    def get_object(self, *args, **kwargs):
+        return get_object_or_404(
+            SepaExportRun, event=self.request.event, pk=self.kwargs.get("id")
+        )
+
+
 class EventOrdersView(EventPermissionRequiredMixin, OrdersView):
     permission = "can_change_orders"
 
@@ -411,6 +458,17 @@ class OrganizerDownloadView(
         )
 
 
+class OrganizerRunDownloadView(
+    OrganizerPermissionRequiredMixin, OrganizerDetailViewMixin, RunDownloadView
+):
+    permission = "can_change_organizer_settings"
+
+    def get_object(self, *args, **kwargs):
+        return get_object_or_404(
+            SepaExportRun, organizer=self.request.organizer, event__isnull=True, pk=self.kwargs.get("id")
+        )
+
+
 class OrganizerOrdersView(
     OrganizerPermissionRequiredMixin, OrganizerDetailViewMixin, OrdersView
 ):
@@ -437,6 +495,7 @@ class OrganizerExportListView(
     OrganizerPermissionRequiredMixin, OrganizerDetailViewMixin, ExportListView
 ):
     permission = "can_change_organizer_settings"
+    task = export_organizer
 
     @property
     def settings_holder(self):
@@ -452,49 +511,113 @@ class OrganizerExportListView(
                 cnt=Count("sepaexportorder"),
                 sum=Sum("sepaexportorder__amount"),
             )
+            .defer("xml_gz")
             .order_by("-datetime")
         )
 
     def get_unexported(self):
-        q_list = []
-        today = now().astimezone(self.request.organizer.timezone).today()
-
-        for event in Event.objects.filter(
-            organizer=self.request.organizer, plugins__contains="pretix_sepadebit"
-        ):
-            try:
-                latest_export_due_date = today + datetime.timedelta(
-                    days=int(event.settings.payment_sepadebit_prenotification_days or 0)
-                )
-            except (TypeError, ValueError):
-                continue
-
-            q_list.append(
-                Q(order__event=event, sepadebit_due__date__lte=latest_export_due_date)
+        return get_unexported_for_organizer(self.request.organizer)
+
+
+class BlocklistImportForm(forms.Form):
+    entries = forms.CharField(
+        label=_("IBANs or IBAN prefixes"),
+        widget=forms.Textarea,
+        required=False,
+        help_text=_("Put one IBAN or IBAN prefix per line. The check digits will be ignored for comparison."),
+    )
+    file = forms.FileField(
+        label=_("Text file"),
+        required=False,
+        help_text=_("Alternatively, upload a text file with one IBAN or IBAN prefix per line."),
+    )
+    replace = forms.BooleanField(
+        label=_("Replace the current blocklist instead of adding to it"),
+        required=False,
+    )
+
+    def clean(self):
+        d = super().clean()
+        lines = (d.get("entries") or "").splitlines()
+        if d.get("file"):
+            lines += d["file"].read().decode("utf-8", errors="replace").splitlines()
+        prefixes = set()
+        for line in lines:
+            prefix = line.replace(" ", "").upper()
+            prefix = prefix[:2] + prefix[4:]
+            if prefix and prefix.isalnum():
+                prefixes.add(prefix)
+        if not prefixes and not d.get("replace"):
+            raise forms.ValidationError(_("Please enter at least one IBAN or IBAN prefix."))
+        d["prefixes"] = prefixes
+        return d
+
+
+class OrganizerBlocklistView(OrganizerPermissionRequiredMixin, OrganizerDetailViewMixin, FormView):
+    """
+    Bulk import of the organizer-wide IBAN blocklist. Entries are only ever inserted or deleted in bulk and checkout
+    only reads them through the unique index, so an import of many thousand entries does not block checkouts.
+    """
+    permission = "can_change_organizer_settings"
+    template_name = "pretix_sepadebit/blocklist.html"
+    form_class = BlocklistImportForm
+
+    def get_context_data(self, **kwargs):
+        ctx = super().get_context_data(**kwargs)
+        ctx["num_entries"] = self.request.organizer.sepa_blocklist_entries.count()
+        return ctx
+
+    def form_valid(self, form):
+        organizer = self.request.organizer
+        with transaction.atomic():
+            if form.cleaned_data["replace"]:
+                organizer.sepa_blocklist_entries.all().delete()
+            before = organizer.sepa_blocklist_entries.count()
+            SepaBlocklistEntry.objects.bulk_create(
+                [
+                    SepaBlocklistEntry(organizer=organizer, prefix_hash=SepaBlocklistEntry.hash_prefix(organizer.pk, p))
+                    for p in form.cleaned_data["prefixes"]
+                ],
+                batch_size=1000,
+                ignore_conflicts=True,
+            )
+            added = organizer.sepa_blocklist_entries.count() - before
+            organizer.log_action(
+                "pretix_sepadebit.blocklist.imported",
+                user=self.request.user,
+                data={"added": added, "replace": form.cleaned_data["replace"]},
             )
+        messages.success(
+            self.request,
+            _("{num} entries have been added to the blocklist.").format(num=added),
+        )
+        return redirect(self.get_success_url())
 
-        preselection = OrderPayment.objects.filter(
-            provider="sepadebit",
-            state=OrderPayment.PAYMENT_STATE_CONFIRMED,
-            order__testmode=False,
-            sepaexportorder__isnull=True,
-        ).annotate(
-            refund_amount=Coalesce(
-                Subquery(
-                    OrderRefund.objects.filter(
-                        payment=OuterRef("pk"),
-                        state=OrderRefund.REFUND_STATE_DONE,
-                    )
-                    .order_by()
-                    .values("payment")
-                    .annotate(s=Sum("amount"))
-                    .values("s")
-                ),
-                Decimal("0.00"),
-            ),
+    def get_success_url(self):
+        return reverse(
+            "plugins:pretix_sepadebit:blocklist",
+            kwargs={"organizer": self.request.organizer.slug},
         )
 
-        if q_list:
-            return preselection.filter(reduce(or_, q_list))
-        else:
-            return OrderPayment.objects.none()
+
+@lru_cache(maxsize=4096)
+def _cached_bic(prefix):
+    return lookup_bic(prefix)
+
+
+@require_GET
+@cache_control(public=True, max_age=86400)
+def bic_lookup(request):
+    """
+    Returns the BIC for an IBAN prefix, so the checkout form can fill it in while the customer types. Only the country
+    code and the bank identifier are relevant, so we cut off the check digits and everything after the longest key
+    known for the country before caching. This does not touch the database at all.
+    """
+    iban = normalize_iban(request.GET.get("iban", ""))
+    iban = iban[:4 + bicdata.load().key_length(iban[:2])]
+    if len(iban) <= 4 or not iban.isalnum():
+        iban = ""
+    resp = JsonResponse({"bic": _cached_bic(iban) if iban else None})
+    # The customer might be on a custom domain of the event, and the data is public anyway
+    resp["Access-Control-Allow-Origin"] = "*"
+    return resp
@@ -1,33 +1,100 @@
 """
-Updates IBAN→BIC information contained in this module using public sources.
+Updates the IBAN→BIC dataset in pretix_sepadebit/bicdata.bin using the public sources registered in
+pretix_sepadebit.bicsources.
 
-100310001EIS Einlagensicherungsbank                                10178Berlin                             EIS Bank
-Berlin                 EIEGDEB1XXX09056711U000000000
+    python update_bic_info.py [COUNTRY ...] [--file COUNTRY=PATH ...] [--dry-run] [--report PATH]
+    python update_bic_info.py --verify
 
+Without arguments, all registered countries are downloaded and updated. With ``--file``, the given local file is
+parsed instead of downloading the list of that country, which allows rebuilding the dataset without network access.
+Countries that are not updated keep their current records.
+
+Before writing, the changes against the current dataset are summarized. ``--report`` additionally writes all added,
+removed and changed records to a JSON file for review, ``--dry-run`` skips writing the dataset. The written file
+carries a version label, its record count and a checksum of its contents, which ``--verify`` checks. ``--verify``
+also lists the records per country and the registered countries that the dataset does not contain yet.
 """
 
+import argparse
 import json
-import requests
-from bs4 import BeautifulSoup
+import os
+import sys
+from datetime import date
+
+from pretix_sepadebit import bicdata
+from pretix_sepadebit.bicsources import sources
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Update the IBAN→BIC dataset.")
+    parser.add_argument("countries", nargs="*", metavar="COUNTRY", help="One of: " + ", ".join(sorted(sources)))
+    parser.add_argument("--file", action="append", default=[], metavar="COUNTRY=PATH",
+                        help="Parse a local file instead of downloading the list of this country.")
+    parser.add_argument("--version", default=date.today().isoformat(), help="Version label of the new dataset.")
+    parser.add_argument("--report", metavar="PATH", help="Write all changes to this JSON file.")
+    parser.add_argument("--dry-run", action="store_true", help="Do not write the new dataset.")
+    parser.add_argument("--verify", action="store_true", help="Only verify the checksum of the current dataset.")
+    args = parser.parse_args()
+
+    current = bicdata.load()
+    if args.verify:
+        ok = current.verify()
+        print(f"Version {current.version}, {len(current)} records, checksum {current.checksum}: "
+              f"{'OK' if ok else 'MISMATCH'}")
+        counts = current.country_counts
+        for country in sorted(set(counts) | set(sources)):
+            print(f"  {country}: {counts.get(country, 0)} records"
+                  + ("" if counts.get(country) else f" (not included yet, run: python update_bic_info.py {country})"))
+        sys.exit(0 if ok else 1)
+
+    files = {}
+    for f in args.file:
+        country, __, path = f.partition("=")
+        files[country.upper()] = path
+
+    countries = [c.upper() for c in args.countries] or sorted(files) or sorted(sources)
+    for c in countries + list(files):
+        if c not in sources:
+            parser.error(f"No source registered for {c}.")
 
-map = {}
+    old = dict(current.items())
+    new = {k: v for k, v in old.items() if k[:2] not in countries}
+    for country in countries:
+        source = sources[country]
+        if country in files:
+            with open(files[country], "rb") as f:
+                records = source.parse(f.read())
+        else:
+            records = source.parse(source.fetch())
+        if not records:
+            parser.error(f"No records found for {country}, refusing to remove all of them.")
+        new.update({f"{country}XX{prefix}": bic for prefix, bic in records.items()})
 
-# Germany
-page = requests.get(
-    "https://www.bundesbank.de/en/tasks/payment-systems/services/bank-sort-codes/download-bank-sort-codes-626218"
-)
-doc = BeautifulSoup(page.text, "lxml")
+    added, removed, changed = bicdata.diff(old, new)
+    print(f"{len(added)} added, {len(removed)} removed, {len(changed)} changed, {len(new)} records in total")
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump({
+                "version": args.version,
+                "previous_version": current.version,
+                "added": {k: new[k] for k in added},
+                "removed": {k: old[k] for k in removed},
+                "changed": {k: [old[k], new[k]] for k in changed},
+            }, f, indent=2)
 
-url = doc.select("a[href*='/blz-aktuell-txt-data.txt']")[0].attrs["href"]
-data = requests.get(url).text
+    if args.dry_run:
+        return
+    if not (added or removed or changed):
+        print("Nothing to do.")
+        return
 
-for line in data.split("\n"):
-    if not line or line[8] != "1" or line[139] == " ":
-        continue
-    map[f"DEXX{line[0:8]}"] = line[139:150]
+    # The current file is still memory-mapped, so we must not truncate it in place
+    content = bicdata.dump(new, version=args.version)
+    with open(bicdata.PATH + ".tmp", "wb") as f:
+        f.write(content)
+    os.replace(bicdata.PATH + ".tmp", bicdata.PATH)
+    print(f"Written version {args.version} with checksum {bicdata.BICDataset(content).checksum}")
 
 
-# Write file
-d = json.dumps(map)
-with open("pretix_sepadebit/bicdata.py", "w") as f:
-    f.write(f"DATA = {d}")
+if __name__ == "__main__":
+    main()